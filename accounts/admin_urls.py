@@ -4,11 +4,19 @@ from django.urls import path
 from .admin_views import (
     ApproveEditorView,
     ApproveReviewerView,
+    BulkApproveView,
+    BulkRejectView,
+    PendingUsersView,
     RejectEditorView,
     RejectReviewerView,
+    UserSearchView,
 )
 
 urlpatterns = [
+    path("users/search", UserSearchView.as_view(), name="admin-user-search"),
+    path("users/pending", PendingUsersView.as_view(), name="admin-pending-users"),
+    path("users/bulk-approve", BulkApproveView.as_view(), name="admin-bulk-approve"),
+    path("users/bulk-reject", BulkRejectView.as_view(), name="admin-bulk-reject"),
     path("users/<int:user_id>/approve-reviewer", ApproveReviewerView.as_view(), name="admin-approve-reviewer"),
     path("users/<int:user_id>/approve-editor", ApproveEditorView.as_view(), name="admin-approve-editor"),
     path("users/<int:user_id>/reject-reviewer", RejectReviewerView.as_view(), name="admin-reject-reviewer"),
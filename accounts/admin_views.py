@@ -1,10 +1,23 @@
 """Admin API views for user role approvals."""
-from rest_framework import status
+from django.db import transaction
+from django.db.models import Q
+from rest_framework import generics, status
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import APPROVAL_APPROVED, APPROVAL_REJECTED, User
+from ejournal.pagination import KeysetPagination
+
+from .authentication import invalidate_principal, invalidate_principals
+from .models import APPROVAL_APPROVED, APPROVAL_PENDING, APPROVAL_REJECTED, ROLE_EDITOR, ROLE_REVIEWER, User
+from .search import search_users
+from .serializers import (
+    BulkRoleDecisionSerializer,
+    PendingUserSerializer,
+    PendingUsersFilterSerializer,
+    UserSearchQuerySerializer,
+    UserSearchResultSerializer,
+)
 
 
 class ApproveReviewerView(APIView):
@@ -23,6 +36,7 @@ class ApproveReviewerView(APIView):
             )
         user.reviewer_status = APPROVAL_APPROVED
         user.save(update_fields=["reviewer_status"])
+        invalidate_principal(user.id)
 
         from audit.services import log
         log(actor_user=request.user, action_type="reviewer_approved", target_type="user", target_id=user_id)
@@ -46,6 +60,7 @@ class ApproveEditorView(APIView):
             )
         user.editor_status = APPROVAL_APPROVED
         user.save(update_fields=["editor_status"])
+        invalidate_principal(user.id)
 
         from audit.services import log
         log(actor_user=request.user, action_type="editor_approved", target_type="user", target_id=user_id)
@@ -75,6 +90,7 @@ class RejectReviewerView(APIView):
             )
         user.reviewer_status = APPROVAL_REJECTED
         user.save(update_fields=["reviewer_status"])
+        invalidate_principal(user.id)
 
         from audit.services import log
         log(
@@ -110,6 +126,7 @@ class RejectEditorView(APIView):
             )
         user.editor_status = APPROVAL_REJECTED
         user.save(update_fields=["editor_status"])
+        invalidate_principal(user.id)
 
         from audit.services import log
         log(
@@ -121,3 +138,112 @@ class RejectEditorView(APIView):
         )
 
         return Response({"editor_status": user.editor_status})
+
+
+class PendingUsersPagination(KeysetPagination):
+    """Oldest applicant first, matching the (status, date_joined, id) queue indexes."""
+
+    ordering = ("date_joined", "id")
+
+
+class PendingUsersView(generics.ListAPIView):
+    """GET /api/admin/users/pending - Applicants awaiting reviewer/editor approval (?role=reviewer|editor)."""
+
+    permission_classes = [IsAdminUser]
+    serializer_class = PendingUserSerializer
+    pagination_class = PendingUsersPagination
+
+    def get_queryset(self):
+        params = PendingUsersFilterSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        role = params.validated_data.get("role")
+        if role == ROLE_REVIEWER:
+            condition = Q(reviewer_status=APPROVAL_PENDING)
+        elif role == ROLE_EDITOR:
+            condition = Q(editor_status=APPROVAL_PENDING)
+        else:
+            condition = Q(reviewer_status=APPROVAL_PENDING) | Q(editor_status=APPROVAL_PENDING)
+        return User.objects.filter(condition)
+
+
+class BulkRoleDecisionView(APIView):
+    """
+    Base for bulk approve/reject: one SELECT ... FOR UPDATE, one UPDATE and one
+    audit bulk insert for the whole batch. Users without the role, or already in
+    the target status, are reported as skipped.
+    """
+
+    permission_classes = [IsAdminUser]
+    decision = None
+    action_suffix = None
+    reason_required = False
+
+    def post(self, request):
+        serializer = BulkRoleDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        role = serializer.validated_data["role"]
+        user_ids = serializer.validated_data["user_ids"]
+        reason = serializer.validated_data.get("reason", "")
+        if self.reason_required and not reason:
+            return Response({"detail": "Reason is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        field = f"{role}_status"
+        with transaction.atomic():
+            # Eligibility is holding the role, as in the single-user views (a null status
+            # still counts); checked in Python because roles is a JSON list
+            rows = (
+                User.objects.select_for_update()
+                .filter(id__in=user_ids)
+                .order_by("id")
+                .values_list("id", "roles", field)
+            )
+            updated = [
+                user_id for user_id, roles, current in rows if role in (roles or []) and current != self.decision
+            ]
+            if updated:
+                User.objects.filter(id__in=updated).update(**{field: self.decision})
+
+                from audit.services import log_many
+                log_many(
+                    actor_user=request.user,
+                    action_type=f"{role}_{self.action_suffix}",
+                    target_type="user",
+                    target_ids=updated,
+                    new_value={"reason": reason} if self.reason_required else None,
+                )
+        invalidate_principals(updated)
+
+        done = set(updated)
+        skipped = [user_id for user_id in user_ids if user_id not in done]
+        return Response({field: self.decision, "updated": updated, "skipped": skipped})
+
+
+class BulkApproveView(BulkRoleDecisionView):
+    """POST /api/admin/users/bulk-approve - Approve a role for many users (body: role, user_ids)."""
+
+    decision = APPROVAL_APPROVED
+    action_suffix = "approved"
+
+
+class BulkRejectView(BulkRoleDecisionView):
+    """POST /api/admin/users/bulk-reject - Reject a role for many users (body: role, user_ids, reason)."""
+
+    decision = APPROVAL_REJECTED
+    action_suffix = "rejected"
+    reason_required = True
+
+
+class UserSearchView(APIView):
+    """GET /api/admin/users/search?q= - Ranked fuzzy search on email, name and affiliation (?role=, ?limit=)."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        params = UserSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        users = search_users(
+            params.validated_data["q"],
+            limit=params.validated_data["limit"],
+            role=params.validated_data.get("role"),
+        )
+        return Response({"results": UserSearchResultSerializer(users, many=True).data})
@@ -8,3 +8,15 @@ class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
     verbose_name = "Accounts"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        from .authentication import user_changed
+        from .models import User
+        from .tokens import blacklisted_token_saved
+
+        post_save.connect(blacklisted_token_saved, sender=BlacklistedToken, dispatch_uid="accounts:blacklist:save")
+        post_save.connect(user_changed, sender=User, dispatch_uid="accounts:principal:save")
+        post_delete.connect(user_changed, sender=User, dispatch_uid="accounts:principal:delete")
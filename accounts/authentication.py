@@ -0,0 +1,120 @@
+"""
+JWT authentication with a cached principal.
+
+simplejwt's JWTAuthentication loads the user row on every request. The permission
+classes only need roles and approval statuses, so the fields below are cached per
+user for AUTH_PRINCIPAL_CACHE_SECONDS and the user is rebuilt from them without a
+query. Anything else (password, affiliation, ...) stays deferred and loads on access.
+Views that change these fields call invalidate_principal() after saving; any other
+User save or delete (Django admin, shell) is caught by the receivers connected in
+AccountsConfig.ready(). Queryset update() sends no signals, so bulk writes must
+invalidate explicitly.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_FIELDS = (
+    "id",
+    "email",
+    "full_name",
+    "roles",
+    "reviewer_status",
+    "editor_status",
+    "notification_digest",
+    "is_staff",
+    "is_active",
+    "is_superuser",
+)
+# Bump when PRINCIPAL_FIELDS changes so old entries are ignored after a deploy
+PRINCIPAL_CACHE_VERSION = 1
+
+
+def _cache_key(user_id) -> str:
+    return f"auth:principal:{user_id}"
+
+
+def invalidate_principal(user_id) -> None:
+    """Drop the cached principal so the next request reloads it."""
+    invalidate_principals([user_id])
+
+
+def invalidate_principals(user_ids) -> None:
+    """Drop the cached principals of several users at once."""
+    try:
+        cache.delete_many([_cache_key(user_id) for user_id in user_ids], version=PRINCIPAL_CACHE_VERSION)
+    except Exception:
+        logger.warning("Could not invalidate cached principals for users %s", list(user_ids), exc_info=True)
+
+
+def user_changed(sender, instance, update_fields=None, **kwargs):
+    """post_save/post_delete receiver: drop the principal now and again once the write commits."""
+    if update_fields and not set(update_fields) & {*PRINCIPAL_FIELDS, "password"}:
+        return  # e.g. last_login on every login
+    invalidate_principal(instance.pk)
+    # A request between the write and its commit may have re-cached the old row
+    transaction.on_commit(lambda: invalidate_principal(instance.pk))
+
+
+def _load_principal(user_id) -> dict | None:
+    row = (
+        User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+        .values(*PRINCIPAL_FIELDS, "password")
+        .first()
+    )
+    if row is None:
+        return None
+    password = row.pop("password")
+    if api_settings.CHECK_REVOKE_TOKEN:
+        # Only the hash of the hash is cached, never the password hash itself
+        row["revoke_hash"] = get_md5_hash_password(password)
+    return row
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that resolves the user from the principal cache."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        ttl = settings.AUTH_PRINCIPAL_CACHE_SECONDS
+        key = _cache_key(user_id)
+        principal = None
+        if ttl > 0:
+            try:
+                principal = cache.get(key, version=PRINCIPAL_CACHE_VERSION)
+            except Exception:
+                logger.warning("Principal cache unavailable", exc_info=True)
+        if principal is None:
+            principal = _load_principal(user_id)
+            if principal is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            if ttl > 0:
+                try:
+                    cache.set(key, principal, ttl, version=PRINCIPAL_CACHE_VERSION)
+                except Exception:
+                    logger.warning("Principal cache unavailable", exc_info=True)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not principal["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != principal.get("revoke_hash"):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        # from_db expects values in concrete field order
+        fields = [f.attname for f in User._meta.concrete_fields if f.attname in PRINCIPAL_FIELDS]
+        return User.from_db("default", fields, [principal[f] for f in fields])
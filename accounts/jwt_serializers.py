@@ -1,10 +1,14 @@
 """Custom JWT serializers with user_id and roles in token payload."""
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+
+from .tokens import CachedBlacklistRefreshToken
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Add user_id and roles to JWT payload."""
 
+    token_class = CachedBlacklistRefreshToken
+
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
@@ -12,3 +16,9 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token["email"] = user.email
         token["roles"] = user.roles or []
         return token
+
+
+class CachedBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refresh (and rotate) with the cached blacklist check."""
+
+    token_class = CachedBlacklistRefreshToken
@@ -0,0 +1,19 @@
+"""Delete expired JWT outstanding/blacklisted tokens and rebuild the blacklist cache."""
+from django.core.management.base import BaseCommand
+
+from accounts.tokens import compact_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted tokens in batches, then warm the blacklist cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per statement")
+
+    def handle(self, *args, **options):
+        result = compact_tokens(options["batch_size"])
+        self.stdout.write(f"  token_blacklist: flushed {result['flushed']} expired tokens")
+        if result["cached"] is None:
+            self.stdout.write(self.style.WARNING("Blacklist cache unavailable; checks fall back to the database"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Cached {result['cached']} blacklisted tokens"))
@@ -1,7 +1,8 @@
-"""Seed database with superuser, topic areas, and optional sample users."""
+"""Seed database with superuser, topic areas, optional sample users and synthetic data at scale."""
 import os
+import time
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 
 from accounts.models import APPROVAL_APPROVED, User
@@ -9,7 +10,7 @@ from submissions.models import TopicArea
 
 
 class Command(BaseCommand):
-    help = "Seed database: superuser, topic areas, optional sample users"
+    help = "Seed database: superuser, topic areas, optional sample users, --scale N synthetic authors"
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -22,6 +23,14 @@ class Command(BaseCommand):
             action="store_true",
             help="Skip superuser creation (e.g. if already exists)",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=0,
+            help="Generate N synthetic authors with submissions, reviews, notifications and audit rows (~20 rows each)",
+        )
+        parser.add_argument("--seed", type=int, default=1, help="Random seed for --scale (same seed, same data)")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Authors per bulk insert transaction")
 
     def handle(self, *args, **options):
         with transaction.atomic():
@@ -33,6 +42,9 @@ class Command(BaseCommand):
             if options["sample_users"]:
                 self._seed_sample_users()
 
+        if options["scale"]:
+            self._seed_synthetic(options["scale"], options["seed"], options["chunk_size"])
+
         self.stdout.write(self.style.SUCCESS("Seed completed."))
 
     def _seed_topic_areas(self):
@@ -88,3 +100,21 @@ class Command(BaseCommand):
             user.save()
             self.stdout.write(f"  User: {email}")
         self.stdout.write("  Sample users created (passwords: author123, reviewer123, editor123)")
+
+    def _seed_synthetic(self, scale, seed, chunk_size):
+        from ejournal.synthetic import PASSWORD, generate
+
+        domain = f"@seed-{seed}.invalid"
+        if User.objects.filter(email__endswith=domain).exists():
+            raise CommandError(f"Synthetic data for seed {seed} already exists ({domain}); use another --seed.")
+        started = time.monotonic()
+        try:
+            counts = generate(scale, seed=seed, chunk_size=chunk_size, stdout=self.stdout)
+        except RuntimeError as e:
+            raise CommandError(str(e)) from e
+        for label, n in counts.items():
+            self.stdout.write(f"  {label}: {n:,}")
+        self.stdout.write(
+            f"  Synthetic: {sum(counts.values()):,} rows in {time.monotonic() - started:.1f}s "
+            f"(accounts *{domain}, password {PASSWORD})"
+        )
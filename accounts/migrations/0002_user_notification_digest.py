@@ -0,0 +1,21 @@
+"""Add per-user notification digest preference."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="notification_digest",
+            field=models.CharField(
+                choices=[("immediate", "Immediate"), ("hourly", "Hourly digest"), ("daily", "Daily digest")],
+                default="immediate",
+                max_length=20,
+            ),
+        ),
+    ]
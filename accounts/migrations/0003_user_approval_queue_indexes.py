@@ -0,0 +1,20 @@
+"""Indexes for the pending-approvals queue."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_notification_digest"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["reviewer_status", "date_joined", "id"], name="accounts_reviewer_queue_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["editor_status", "date_joined", "id"], name="accounts_editor_queue_idx"),
+        ),
+    ]
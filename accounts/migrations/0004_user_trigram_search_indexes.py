@@ -0,0 +1,40 @@
+"""pg_trgm GIN indexes for user search (PostgreSQL only; a no-op elsewhere)."""
+from django.db import migrations
+
+INDEXES = {
+    "accounts_user_email_trgm_idx": "email",
+    "accounts_user_full_name_trgm_idx": "full_name",
+    "accounts_user_affiliation_trgm_idx": "affiliation",
+}
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in INDEXES.items():
+        # UPPER(): the expression Django's icontains compares on PostgreSQL.
+        # CONCURRENTLY: accounts_user stays writable while the indexes build.
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON accounts_user USING gin (UPPER({column}) gin_trgm_ops)"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0003_user_approval_queue_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
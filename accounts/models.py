@@ -18,6 +18,16 @@ APPROVAL_STATUS_CHOICES = [
     (APPROVAL_REJECTED, "Rejected"),
 ]
 
+# Notification delivery preference for digest-eligible events
+DIGEST_IMMEDIATE = "immediate"
+DIGEST_HOURLY = "hourly"
+DIGEST_DAILY = "daily"
+DIGEST_CHOICES = [
+    (DIGEST_IMMEDIATE, "Immediate"),
+    (DIGEST_HOURLY, "Hourly digest"),
+    (DIGEST_DAILY, "Daily digest"),
+]
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """Custom user model with email as login and role-based approval."""
@@ -44,6 +54,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         blank=True,
     )
     why_to_be = models.TextField(blank=True)
+    notification_digest = models.CharField(
+        max_length=20,
+        choices=DIGEST_CHOICES,
+        default=DIGEST_IMMEDIATE,
+    )
 
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
@@ -56,6 +71,11 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = "accounts_user"
+        indexes = [
+            # Pending-approval queues, oldest applicant first
+            models.Index(fields=["reviewer_status", "date_joined", "id"], name="accounts_reviewer_queue_idx"),
+            models.Index(fields=["editor_status", "date_joined", "id"], name="accounts_editor_queue_idx"),
+        ]
 
     def __str__(self):
         return self.email
@@ -0,0 +1,68 @@
+"""
+User search for the admin API and the reviewer-invite picker.
+
+On PostgreSQL, email, full_name and affiliation each have a pg_trgm GIN index on
+UPPER(column) (accounts migration 0004), the expression Django's icontains
+compares, so both substring and fuzzy word-similarity (%>) matches are index
+scans; results are ranked by the best word similarity across the three fields. Other databases (SQLite in tests) fall back to
+icontains with prefix matches ranked first.
+"""
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from .models import APPROVAL_APPROVED, User
+
+SEARCH_FIELDS = ("email", "full_name", "affiliation")
+MIN_QUERY_LENGTH = 2
+
+
+def _postgres_search(qs, query):
+    from django.contrib.postgres.search import TrigramWordSimilarity
+    from django.db.models.functions import Greatest, Upper
+
+    # pg_trgm is case-insensitive; Upper() only makes the expression match the index
+    upper = {f"{field}_upper": Upper(field) for field in SEARCH_FIELDS}
+    match = Q()
+    for field in SEARCH_FIELDS:
+        match |= Q(**{f"{field}__icontains": query}) | Q(**{f"{field}_upper__trigram_word_similar": query})
+    rank = Greatest(*(TrigramWordSimilarity(query, expr) for expr in upper.values()))
+    return qs.alias(**upper).filter(match).annotate(rank=rank).order_by("-rank", "id")
+
+
+def _fallback_search(qs, query):
+    match = Q()
+    for field in SEARCH_FIELDS:
+        match |= Q(**{f"{field}__icontains": query})
+    rank = Case(
+        When(email__istartswith=query, then=Value(3)),
+        When(full_name__istartswith=query, then=Value(2)),
+        default=Value(1),
+        output_field=IntegerField(),
+    )
+    return qs.filter(match).annotate(rank=rank).order_by("-rank", "full_name", "id")
+
+
+def search_users(query: str, limit: int = 20, approved_reviewers: bool = False, role: str | None = None):
+    """
+    Up to `limit` users matching `query`, best match first.
+    approved_reviewers restricts to users who can be invited by account.
+    role restricts to users who hold that role (reviewer/editor), whatever its
+    approval status, the same eligibility as the approve/reject endpoints.
+    """
+    query = query.strip()
+    if len(query) < MIN_QUERY_LENGTH:
+        return []
+    qs = User.objects.filter(is_active=True)
+    if approved_reviewers:
+        qs = qs.filter(reviewer_status=APPROVAL_APPROVED)
+    if role:
+        if connection.vendor == "postgresql":
+            qs = qs.filter(roles__contains=[role])
+        else:
+            # No JSON containment on SQLite: match the quoted element in the stored JSON text
+            qs = qs.filter(roles__icontains=f'"{role}"')
+    if connection.vendor == "postgresql":
+        qs = _postgres_search(qs, query)
+    else:
+        qs = _fallback_search(qs, query)
+    return list(qs[:limit])
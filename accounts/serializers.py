@@ -87,6 +87,63 @@ class UserSerializer(serializers.ModelSerializer):
             "roles",
             "reviewer_status",
             "editor_status",
+            "notification_digest",
             "date_joined",
         ]
         read_only_fields = ["id", "email", "roles", "reviewer_status", "editor_status", "date_joined"]
+
+
+class PendingUserSerializer(serializers.ModelSerializer):
+    """Serializer for applicants in the admin approvals queue."""
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "email",
+            "full_name",
+            "affiliation",
+            "country",
+            "roles",
+            "reviewer_status",
+            "editor_status",
+            "why_to_be",
+            "date_joined",
+        ]
+        read_only_fields = fields
+
+
+class PendingUsersFilterSerializer(serializers.Serializer):
+    """Query parameters for the pending-approvals queue."""
+
+    role = serializers.ChoiceField(choices=[ROLE_REVIEWER, ROLE_EDITOR], required=False)
+
+
+class BulkRoleDecisionSerializer(serializers.Serializer):
+    """Body of bulk approve/reject: role, user ids and (for rejections) a reason."""
+
+    role = serializers.ChoiceField(choices=[ROLE_REVIEWER, ROLE_EDITOR])
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=500
+    )
+    reason = serializers.CharField(required=False, allow_blank=True, trim_whitespace=True)
+
+    def validate_user_ids(self, value):
+        return list(dict.fromkeys(value))
+
+
+class UserSearchResultSerializer(serializers.ModelSerializer):
+    """Serializer for user search results (admin search, reviewer picker)."""
+
+    class Meta:
+        model = User
+        fields = ["id", "email", "full_name", "affiliation", "roles", "reviewer_status", "editor_status"]
+        read_only_fields = fields
+
+
+class UserSearchQuerySerializer(serializers.Serializer):
+    """Query parameters for user search."""
+
+    q = serializers.CharField(min_length=2, max_length=100)
+    role = serializers.ChoiceField(choices=[ROLE_REVIEWER, ROLE_EDITOR], required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=50, default=20)
@@ -0,0 +1,10 @@
+"""Celery tasks for accounts."""
+from celery import shared_task
+
+
+@shared_task
+def compact_tokens():
+    """Periodic maintenance: delete expired JWT rows and rebuild the blacklist cache."""
+    from .tokens import compact_tokens as run
+
+    return {"status": "compacted", **run()}
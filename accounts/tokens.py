@@ -0,0 +1,134 @@
+"""
+Refresh tokens with cached blacklist checks, and compaction of expired token rows.
+
+Blacklisted jtis are mirrored into the cache (one key per jti). compact_tokens()
+loads every unexpired blacklisted jti and then sets a "warm" marker; while the
+marker is present a cache miss means "not blacklisted" and the database is not
+queried. Without the marker (cold cache, expired marker, cache errors) checks fall
+back to the database. Every BlacklistedToken save (rotation, admin, shell, stock
+RefreshToken.blacklist()) reaches the cache through the post_save receiver
+connected in AccountsConfig.ready(). The cache must not evict keys under memory
+pressure before their TTL (e.g. Redis maxmemory-policy noeviction or volatile-ttl
+on a dedicated database), otherwise an evicted jti would read as not blacklisted.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+logger = logging.getLogger(__name__)
+
+WARM_KEY = "auth:blacklist:warm"
+
+
+def _key(jti: str) -> str:
+    return f"auth:blacklist:{jti}"
+
+
+def _ttl(expires_at) -> int:
+    return max(int((expires_at - timezone.now()).total_seconds()), 1)
+
+
+def mark_blacklisted(jti: str, expires_at) -> None:
+    """Mirror a blacklisted jti into the cache until the token expires."""
+    try:
+        cache.set(_key(jti), 1, _ttl(expires_at))
+    except Exception:
+        logger.warning("Could not cache blacklisted token %s", jti, exc_info=True)
+        # The cache no longer holds every jti, so stop trusting misses
+        try:
+            cache.delete(WARM_KEY)
+        except Exception:
+            pass
+
+
+def blacklisted_token_saved(sender, instance, **kwargs):
+    """post_save receiver: mirror every blacklist row, however it was written."""
+    mark_blacklisted(instance.token.jti, instance.token.expires_at)
+
+
+def is_blacklisted(jti: str) -> bool:
+    """True if the jti is blacklisted; answers from the cache when it is warm."""
+    try:
+        hits = cache.get_many([_key(jti), WARM_KEY])
+    except Exception:
+        logger.warning("Token blacklist cache unavailable", exc_info=True)
+        hits = {}
+    if _key(jti) in hits:
+        return True
+    if WARM_KEY in hits:
+        return False
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+def warm_blacklist_cache(batch_size: int = 1000) -> int:
+    """Load all unexpired blacklisted jtis into the cache, then set the warm marker."""
+    now = timezone.now()
+    jtis = (
+        BlacklistedToken.objects.filter(token__expires_at__gt=now)
+        .values_list("token__jti", flat=True)
+        .iterator(chunk_size=batch_size)
+    )
+    # Keys live for a full refresh lifetime; outliving their (expired) token is harmless
+    ttl = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    count, batch = 0, {}
+    for jti in jtis:
+        batch[_key(jti)] = 1
+        if len(batch) >= batch_size:
+            cache.set_many(batch, ttl)
+            count += len(batch)
+            batch = {}
+    if batch:
+        cache.set_many(batch, ttl)
+        count += len(batch)
+    cache.set(WARM_KEY, now.isoformat(), settings.TOKEN_BLACKLIST_WARM_SECONDS)
+    return count
+
+
+def flush_expired_tokens(batch_size: int = 1000) -> int:
+    """
+    Delete expired outstanding tokens (and their blacklist rows) in batches of
+    batch_size, so no single statement locks a large part of either table.
+    Returns the number of outstanding tokens deleted.
+    """
+    cutoff = timezone.now()
+    total = 0
+    while True:
+        ids = list(OutstandingToken.objects.filter(expires_at__lt=cutoff).values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        total += len(ids)
+    return total
+
+
+def compact_tokens(batch_size: int = 1000) -> dict:
+    """Periodic maintenance: flush expired token rows, then rebuild the blacklist cache."""
+    flushed = flush_expired_tokens(batch_size)
+    try:
+        cached = warm_blacklist_cache(batch_size)
+    except Exception:
+        logger.warning("Could not warm token blacklist cache", exc_info=True)
+        cached = None
+    return {"flushed": flushed, "cached": cached}
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check goes through the cache."""
+
+    def check_blacklist(self) -> None:
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        mark_blacklisted(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload["exp"]))
+        return result
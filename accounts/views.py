@@ -4,6 +4,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .authentication import invalidate_principal
 from .models import User
 from .serializers import SignupSerializer, UserSerializer
 
@@ -39,7 +40,12 @@ class MeView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
 
     def get_object(self):
-        return self.request.user
+        # request.user is rebuilt from the principal cache with most fields deferred
+        return User.objects.get(pk=self.request.user.pk)
+
+    def perform_update(self, serializer):
+        serializer.save()
+        invalidate_principal(serializer.instance.pk)
 
 
 # Re-export JWT views for URL wiring
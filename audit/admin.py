@@ -8,4 +8,6 @@ class AuditLogAdmin(admin.ModelAdmin):
     list_display = ["id", "action_type", "target_type", "target_id", "actor_user", "created_at"]
     list_filter = ["action_type", "target_type"]
     search_fields = ["target_id", "action_type"]
+    list_select_related = ["actor_user"]
+    show_full_result_count = False  # avoid COUNT(*) over the whole log
     readonly_fields = ["actor_user", "action_type", "target_type", "target_id", "old_value", "new_value", "created_at"]
@@ -0,0 +1,246 @@
+"""
+Cold storage for audit logs: rows past AUDIT_RETENTION_DAYS move to date-partitioned
+NDJSON segments under ARCHIVE_ROOT/audit/YYYY/MM/DD/.
+
+Each segment has a sidecar .idx.json listing the targets, actors and actions it
+contains plus its created_at range, so lookups open only the segments that can match.
+The sidecar is updated before rows are appended (it may over-report, never miss),
+and rows are deleted only after their chunk is fsynced.
+"""
+import json
+import os
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ejournal.archive import CODECS, append_rows, iter_archive
+
+from .models import AuditLog
+
+ARCHIVED_FIELDS = ["id", "actor_user_id", "action_type", "target_type", "target_id", "old_value", "new_value", "created_at"]
+
+
+def archive_dir() -> Path:
+    """Root directory of audit segments."""
+    return Path(settings.ARCHIVE_ROOT) / "audit"
+
+
+def _index_path(segment: Path) -> Path:
+    return segment.with_name(segment.name.split(".", 1)[0] + ".idx.json")
+
+
+def _load_index(path: Path) -> dict:
+    if path.exists():
+        return json.loads(path.read_text())
+    return {"rows": 0, "min_created_at": None, "max_created_at": None, "targets": {}, "actors": [], "actions": []}
+
+
+def _update_index(segment: Path, rows):
+    """Merge a chunk's keys into the segment's sidecar index (atomic replace)."""
+    path = _index_path(segment)
+    index = _load_index(path)
+    targets = {t: set(ids) for t, ids in index["targets"].items()}
+    actors, actions = set(index["actors"]), set(index["actions"])
+    for row in rows:
+        targets.setdefault(row["target_type"], set()).add(row["target_id"])
+        if row["actor_user_id"]:
+            actors.add(row["actor_user_id"])
+        actions.add(row["action_type"])
+    created = [r["created_at"].isoformat() for r in rows]
+    if index["min_created_at"]:
+        created += [index["min_created_at"], index["max_created_at"]]
+
+    index.update(
+        rows=index["rows"] + len(rows),
+        min_created_at=min(created),
+        max_created_at=max(created),
+        targets={t: sorted(ids) for t, ids in targets.items()},
+        actors=sorted(actors),
+        actions=sorted(actions),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def archive_old_rows(
+    days: int | None = None,
+    chunk_size: int | None = None,
+    codec: str | None = None,
+    dry_run: bool = False,
+) -> int:
+    """
+    Move audit rows older than `days` (default AUDIT_RETENTION_DAYS) into one segment
+    per day for this run, deleting them in batches of chunk_size (default
+    ARCHIVE_CHUNK_SIZE). codec is "gzip" or "zstd" (default AUDIT_ARCHIVE_CODEC).
+    Returns the number of rows archived (or that would be, with dry_run).
+    """
+    days = days if days is not None else settings.AUDIT_RETENTION_DAYS
+    chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+    codec = codec or settings.AUDIT_ARCHIVE_CODEC
+    if codec not in CODECS:
+        raise ImproperlyConfigured(f"AUDIT_ARCHIVE_CODEC must be one of {', '.join(CODECS)}")
+    cutoff = timezone.now() - timedelta(days=days)
+    stamp = timezone.now().strftime("%Y%m%dT%H%M%S")
+
+    qs = AuditLog.objects.filter(created_at__lt=cutoff)
+    if dry_run:
+        return qs.count()
+
+    total = 0
+    while True:
+        rows = list(qs.order_by("created_at", "id").values(*ARCHIVED_FIELDS)[:chunk_size])
+        if not rows:
+            break
+        by_day = {}
+        for row in rows:
+            by_day.setdefault(row["created_at"].date(), []).append(row)
+        for day, day_rows in by_day.items():
+            segment = archive_dir() / day.strftime("%Y/%m/%d") / f"audit-{day:%Y%m%d}-{stamp}{CODECS[codec]}"
+            _update_index(segment, day_rows)
+            append_rows(segment, day_rows)
+        AuditLog.objects.filter(id__in=[r["id"] for r in rows]).delete()
+        total += len(rows)
+    return total
+
+
+def _segments(since=None, until=None):
+    """Segment paths newest day first, limited to day partitions overlapping [since, until)."""
+    days = sorted(archive_dir().glob("*/*/*"), reverse=True)
+    for day_dir in days:
+        try:
+            day = datetime.strptime("/".join(day_dir.parts[-3:]), "%Y/%m/%d").date()
+        except ValueError:
+            continue
+        # Partitions are UTC days
+        if since and day < since.astimezone(dt_timezone.utc).date():
+            continue
+        if until and day > until.astimezone(dt_timezone.utc).date():
+            continue
+        for suffix in CODECS.values():
+            yield from sorted(day_dir.glob(f"audit-*{suffix}"), reverse=True)
+
+
+def _may_contain(index, target_type, target_id, actor, action, since, until) -> bool:
+    if target_type is not None:
+        ids = index["targets"].get(target_type)
+        if ids is None or (target_id is not None and target_id not in ids):
+            return False
+    if actor is not None and actor not in index["actors"]:
+        return False
+    if action is not None and action not in index["actions"]:
+        return False
+    if index["min_created_at"]:
+        if until and parse_datetime(index["min_created_at"]) >= until:
+            return False
+        if since and parse_datetime(index["max_created_at"]) < since:
+            return False
+    return True
+
+
+def search_archive(
+    target_type: str | None = None,
+    target_id: int | None = None,
+    actor: int | None = None,
+    action: str | None = None,
+    since=None,
+    until=None,
+):
+    """
+    Yield archived rows matching the filters, newest day first (rows within a day
+    in archive order). Segments are skipped using their sidecar index.
+    """
+    for segment in _segments(since, until):
+        index = _load_index(_index_path(segment))
+        if not _may_contain(index, target_type, target_id, actor, action, since, until):
+            continue
+        for row in iter_archive([segment]):
+            if target_type is not None and row["target_type"] != target_type:
+                continue
+            if target_id is not None and row["target_id"] != target_id:
+                continue
+            if actor is not None and row["actor_user_id"] != actor:
+                continue
+            if action is not None and row["action_type"] != action:
+                continue
+            if since or until:
+                created = parse_datetime(row["created_at"])
+                if (since and created < since) or (until and created >= until):
+                    continue
+            yield row
+
+
+def audit_trail(
+    target_type: str | None = None,
+    target_id: int | None = None,
+    actor: int | None = None,
+    action: str | None = None,
+    since=None,
+    until=None,
+    before: tuple | None = None,
+    limit: int = 100,
+) -> list[dict]:
+    """
+    Up to `limit` rows newest first from the live table followed by the archive,
+    which only holds rows older than anything left in the table.
+    before=(created_at, id) continues after the last row of a previous page.
+    """
+    qs = AuditLog.objects.all()
+    if target_type is not None:
+        qs = qs.filter(target_type=target_type)
+    if target_id is not None:
+        qs = qs.filter(target_id=target_id)
+    if actor is not None:
+        qs = qs.filter(actor_user_id=actor)
+    if action is not None:
+        qs = qs.filter(action_type=action)
+    if since:
+        qs = qs.filter(created_at__gte=since)
+    if until:
+        qs = qs.filter(created_at__lt=until)
+    if before:
+        qs = qs.filter(Q(created_at__lt=before[0]) | Q(created_at=before[0], id__lt=before[1]))
+    rows = list(qs.order_by("-created_at", "-id").values(*ARCHIVED_FIELDS)[:limit])
+    if len(rows) >= limit:
+        return rows
+
+    # Archived rows: sort each day partition newest first, drop duplicates of
+    # rows re-archived after an interrupted run
+    seen = {r["id"] for r in rows}
+    if before:
+        # Skip segments entirely newer than the cursor
+        cursor_until = before[0] + timedelta(microseconds=1)
+        until = min(until, cursor_until) if until else cursor_until
+    archived = search_archive(target_type, target_id, actor, action, since, until)
+    day, pending = None, []
+
+    def drain():
+        for row in sorted(pending, key=lambda r: (r["created_at"], r["id"]), reverse=True):
+            created = parse_datetime(row["created_at"])
+            if before and (created, row["id"]) >= before:
+                continue
+            if row["id"] in seen:
+                continue
+            seen.add(row["id"])
+            rows.append({**row, "created_at": created})
+            if len(rows) >= limit:
+                return True
+        return False
+
+    for row in archived:
+        row_day = row["created_at"][:10]
+        if day is not None and row_day != day:
+            if drain():
+                return rows
+            pending = []
+        day = row_day
+        pending.append(row)
+    drain()
+    return rows
@@ -0,0 +1,28 @@
+"""Archive and delete old audit log rows."""
+from django.core.management.base import BaseCommand
+
+from audit.archive import archive_dir, archive_old_rows
+from ejournal.archive import CODECS
+
+
+class Command(BaseCommand):
+    help = "Move audit rows older than N days to date-partitioned compressed NDJSON segments"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Retention in days (default AUDIT_RETENTION_DAYS)")
+        parser.add_argument("--chunk-size", type=int, help="Rows per batch (default ARCHIVE_CHUNK_SIZE)")
+        parser.add_argument("--codec", choices=list(CODECS), help="Compression (default AUDIT_ARCHIVE_CODEC)")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would be archived")
+
+    def handle(self, *args, **options):
+        count = archive_old_rows(
+            days=options["days"],
+            chunk_size=options["chunk_size"],
+            codec=options["codec"],
+            dry_run=options["dry_run"],
+        )
+        if options["dry_run"]:
+            self.stdout.write(f"  audit_log: would archive {count} rows")
+            return
+        self.stdout.write(f"  audit_log: archived {count} rows")
+        self.stdout.write(self.style.SUCCESS(f"Segments written to {archive_dir()}"))
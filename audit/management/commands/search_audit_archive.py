@@ -0,0 +1,57 @@
+"""Search the audit trail, including archived segments."""
+import json
+from datetime import timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from audit.archive import audit_trail, search_archive
+
+
+class Command(BaseCommand):
+    help = "Search audit entries (live table and archive, newest first); prints rows as NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target-type")
+        parser.add_argument("--target-id", type=int)
+        parser.add_argument("--actor", type=int, help="Actor user id")
+        parser.add_argument("--action", help="Exact action type")
+        parser.add_argument("--since", help="ISO datetime, inclusive (UTC unless it has an offset)")
+        parser.add_argument("--until", help="ISO datetime, exclusive (UTC unless it has an offset)")
+        parser.add_argument("--archive-only", action="store_true", help="Skip the live table")
+        parser.add_argument("--limit", type=int, default=100)
+
+    def handle(self, *args, **options):
+        since = parse_datetime(options["since"]) if options["since"] else None
+        until = parse_datetime(options["until"]) if options["until"] else None
+        if (options["since"] and not since) or (options["until"] and not until):
+            raise CommandError("--since/--until must be ISO datetimes, e.g. 2025-01-31T00:00:00+00:00")
+        # A value without an offset is taken as UTC (the archive's day partitions are UTC)
+        since, until = (
+            timezone.make_aware(value, dt_timezone.utc) if value and timezone.is_naive(value) else value
+            for value in (since, until)
+        )
+        if options["target_id"] is not None and not options["target_type"]:
+            raise CommandError("--target-id requires --target-type")
+
+        filters = {
+            "target_type": options["target_type"],
+            "target_id": options["target_id"],
+            "actor": options["actor"],
+            "action": options["action"],
+            "since": since,
+            "until": until,
+        }
+        if options["archive_only"]:
+            rows = []
+            for row in search_archive(**filters):
+                rows.append(row)
+                if len(rows) >= options["limit"]:
+                    break
+        else:
+            rows = audit_trail(**filters, limit=options["limit"])
+        for row in rows:
+            self.stdout.write(json.dumps(row, cls=DjangoJSONEncoder))
+        self.stderr.write(f"{len(rows)} row(s)")
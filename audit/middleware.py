@@ -0,0 +1,13 @@
+"""Audit middleware."""
+from .services import buffered
+
+
+class AuditBufferMiddleware:
+    """Buffer audit entries made while handling a request and write them in one batch."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with buffered():
+            return self.get_response(request)
@@ -0,0 +1,38 @@
+"""Integer target_id and created_at-suffixed indexes for the audit query API."""
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("audit", "0002_auditlog_created_at_default"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name="auditlog", name="audit_log_target__idx"),
+        migrations.RemoveIndex(model_name="auditlog", name="audit_log_action__idx"),
+        # All call sites log integer primary keys; PostgreSQL converts with USING target_id::bigint
+        migrations.AlterField(
+            model_name="auditlog",
+            name="target_id",
+            field=models.BigIntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["target_type", "target_id", "created_at"], name="audit_target_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["actor_user", "created_at"], name="audit_actor_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["action_type", "created_at"], name="audit_action_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["created_at"], name="audit_created_idx"),
+        ),
+    ]
@@ -1,6 +1,7 @@
 """Audit log model."""
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class AuditLog(models.Model):
@@ -15,15 +16,20 @@ class AuditLog(models.Model):
     )
     action_type = models.CharField(max_length=100)
     target_type = models.CharField(max_length=100)  # e.g. "submission", "review_assignment"
-    target_id = models.CharField(max_length=100)
+    target_id = models.BigIntegerField()
     old_value = models.JSONField(null=True, blank=True)
     new_value = models.JSONField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when log() is called, not when a buffered batch is flushed
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "audit_log"
         ordering = ["-created_at"]
+        # Each filter of GET /api/admin/audit has an index ending in created_at,
+        # so filtered pages are range scans in the listing order
         indexes = [
-            models.Index(fields=["target_type", "target_id"]),
-            models.Index(fields=["action_type"]),
+            models.Index(fields=["target_type", "target_id", "created_at"], name="audit_target_created_idx"),
+            models.Index(fields=["actor_user", "created_at"], name="audit_actor_created_idx"),
+            models.Index(fields=["action_type", "created_at"], name="audit_action_created_idx"),
+            models.Index(fields=["created_at"], name="audit_created_idx"),
         ]
@@ -0,0 +1,73 @@
+"""Audit serializers."""
+from rest_framework import serializers
+
+from .models import AuditLog
+
+
+class AuditLogSerializer(serializers.ModelSerializer):
+    """Serializer for audit log entries."""
+
+    actor_email = serializers.EmailField(source="actor_user.email", read_only=True, default=None)
+
+    class Meta:
+        model = AuditLog
+        fields = [
+            "id",
+            "actor_user",
+            "actor_email",
+            "action_type",
+            "target_type",
+            "target_id",
+            "old_value",
+            "new_value",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
+class AuditLogFilterSerializer(serializers.Serializer):
+    """Query parameters for the audit log API."""
+
+    target_type = serializers.CharField(required=False, max_length=100)
+    target_id = serializers.IntegerField(required=False)
+    actor = serializers.IntegerField(required=False, min_value=1)
+    action = serializers.CharField(required=False, max_length=100)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if "target_id" in attrs and "target_type" not in attrs:
+            raise serializers.ValidationError({"target_type": "Required when filtering by target_id."})
+        if "since" in attrs and "until" in attrs and attrs["since"] >= attrs["until"]:
+            raise serializers.ValidationError({"until": "Must be after since."})
+        return attrs
+
+
+class AuditTrailEntrySerializer(serializers.Serializer):
+    """Serializer for audit trail rows (live or archived; plain dicts)."""
+
+    id = serializers.IntegerField()
+    actor_user = serializers.IntegerField(source="actor_user_id", allow_null=True)
+    action_type = serializers.CharField()
+    target_type = serializers.CharField()
+    target_id = serializers.IntegerField()
+    old_value = serializers.JSONField(allow_null=True)
+    new_value = serializers.JSONField(allow_null=True)
+    created_at = serializers.DateTimeField()
+
+
+class AuditTrailFilterSerializer(AuditLogFilterSerializer):
+    """Query parameters for the audit trail: the audit filters plus a (before, before_id) cursor."""
+
+    before = serializers.DateTimeField(required=False)
+    before_id = serializers.IntegerField(required=False, min_value=1)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000, default=100)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if not any(k in attrs for k in ("target_type", "actor", "since")):
+            # Without one of these every archived segment would be read
+            raise serializers.ValidationError("Filter by target_type, actor or since.")
+        if ("before" in attrs) != ("before_id" in attrs):
+            raise serializers.ValidationError({"before": "before and before_id go together."})
+        return attrs
@@ -1,4 +1,20 @@
 """Audit logging service."""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Entries collected for the current request (see buffered / AuditBufferMiddleware)
+_buffer: ContextVar[list | None] = ContextVar("audit_buffer", default=None)
+
+
+def _is_async(action_type: str) -> bool:
+    return action_type in getattr(settings, "AUDIT_ASYNC_ACTIONS", ())
 
 
 def log(
@@ -11,15 +27,123 @@ def log(
 ):
     """
     Create an audit log entry.
-    target_id is coerced to string for consistency.
+    target_id is coerced to int (all audited targets have integer primary keys).
+
+    Inside buffered() (every request, via AuditBufferMiddleware) the entry joins the
+    buffer when its transaction commits and is written with the rest of the request's
+    entries in one bulk_create; entries of rolled-back transactions are dropped.
+    Outside a buffer the entry is written immediately. Action types listed in
+    AUDIT_ASYNC_ACTIONS are handed to a Celery task instead of written in-process.
+    """
+    log_many(actor_user, action_type, target_type, [target_id], old_value=old_value, new_value=new_value)
+
+
+def log_many(
+    actor_user,
+    action_type: str,
+    target_type: str,
+    target_ids,
+    old_value=None,
+    new_value=None,
+):
+    """
+    Create one audit log entry per target id for the same action (bulk operations).
+    Buffered and written like log(); outside a buffer the entries are saved with a
+    single bulk_create.
     """
     from .models import AuditLog
 
-    AuditLog.objects.create(
-        actor_user=actor_user,
-        action_type=action_type,
-        target_type=target_type,
-        target_id=str(target_id),
-        old_value=old_value,
-        new_value=new_value,
+    now = timezone.now()
+    entries = [
+        AuditLog(
+            actor_user=actor_user,
+            action_type=action_type,
+            target_type=target_type,
+            target_id=int(target_id),
+            old_value=old_value,
+            new_value=new_value,
+            created_at=now,
+        )
+        for target_id in target_ids
+    ]
+    if not entries:
+        return
+    buffer = _buffer.get()
+    if buffer is not None:
+        transaction.on_commit(lambda: buffer.extend(entries))
+    elif _is_async(action_type):
+        transaction.on_commit(lambda: _enqueue(entries))
+    elif len(entries) == 1:
+        entries[0].save()
+    else:
+        AuditLog.objects.bulk_create(entries, batch_size=500)
+
+
+def _enqueue(entries):
+    """Send entries to the async audit writer task."""
+    from .tasks import write_audit_entries
+
+    write_audit_entries.delay(
+        [
+            {
+                "actor_user_id": e.actor_user_id,
+                "action_type": e.action_type,
+                "target_type": e.target_type,
+                "target_id": e.target_id,
+                "old_value": e.old_value,
+                "new_value": e.new_value,
+                "created_at": e.created_at.isoformat(),
+            }
+            for e in entries
+        ]
     )
+
+
+def flush(entries):
+    """Write buffered entries: one bulk_create, plus one task for async action types."""
+    from .models import AuditLog
+
+    deferred = [e for e in entries if _is_async(e.action_type)]
+    direct = [e for e in entries if not _is_async(e.action_type)]
+    if direct:
+        AuditLog.objects.bulk_create(direct, batch_size=500)
+    if deferred:
+        _enqueue(deferred)
+    entries.clear()
+
+
+def _flush_or_enqueue(entries):
+    """flush() at the end of a buffer; entries it could not write go to the task to be retried."""
+    try:
+        flush(entries)
+    except Exception:
+        logger.warning("Failed to write %d buffered audit entries, queueing them", len(entries), exc_info=True)
+        # bulk_create marks the rows it inserted; don't queue those again
+        pending = [e for e in entries if e._state.adding]
+        try:
+            _enqueue(pending)
+        except Exception:
+            # The audited actions have already committed; don't fail the response
+            logger.exception("Failed to queue %d buffered audit entries", len(pending))
+
+
+@contextmanager
+def buffered():
+    """
+    Collect log() entries made inside the block and write them together on exit.
+    Nested use joins the outer buffer. Entered inside an atomic block, the write
+    waits for that block's commit.
+    """
+    if _buffer.get() is not None:
+        yield
+        return
+    entries = []
+    token = _buffer.set(entries)
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: _flush_or_enqueue(entries))
+        elif entries:
+            _flush_or_enqueue(entries)
@@ -0,0 +1,25 @@
+"""Celery tasks for audit logging."""
+from celery import shared_task
+
+
+@shared_task(
+    bind=True,
+    max_retries=5,
+    autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_jitter=True,
+)
+def write_audit_entries(self, entries: list[dict]):
+    """Write audit entries queued by log() for AUDIT_ASYNC_ACTIONS."""
+    from .models import AuditLog
+
+    AuditLog.objects.bulk_create([AuditLog(**entry) for entry in entries], batch_size=500)
+    return {"status": "written", "count": len(entries)}
+
+
+@shared_task
+def archive_old_audit_logs():
+    """Periodic retention: move audit rows past AUDIT_RETENTION_DAYS to segment files."""
+    from .archive import archive_old_rows
+
+    return {"status": "archived", "count": archive_old_rows()}
@@ -0,0 +1,9 @@
+"""Audit API URL routes (mounted at /api/admin/)."""
+from django.urls import path
+
+from .views import AuditLogListView, AuditTrailView
+
+urlpatterns = [
+    path("audit", AuditLogListView.as_view(), name="admin-audit"),
+    path("audit/trail", AuditTrailView.as_view(), name="admin-audit-trail"),
+]
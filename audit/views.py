@@ -0,0 +1,79 @@
+"""Audit log query API."""
+from rest_framework import generics
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from ejournal.pagination import KeysetPagination
+
+from .archive import audit_trail
+from .models import AuditLog
+from .serializers import (
+    AuditLogFilterSerializer,
+    AuditLogSerializer,
+    AuditTrailEntrySerializer,
+    AuditTrailFilterSerializer,
+)
+
+
+class AuditLogPagination(KeysetPagination):
+    """Newest first; every filter has an index ending in created_at."""
+
+    ordering = ("-created_at", "-id")
+
+
+class AuditLogListView(generics.ListAPIView):
+    """
+    GET /api/admin/audit - Audit trail, newest first.
+    Filters: target_type, target_id (with target_type), actor, action, since, until.
+    """
+
+    permission_classes = [IsAdminUser]
+    serializer_class = AuditLogSerializer
+    pagination_class = AuditLogPagination
+
+    def get_queryset(self):
+        params = AuditLogFilterSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        qs = AuditLog.objects.select_related("actor_user")
+        if "target_type" in filters:
+            qs = qs.filter(target_type=filters["target_type"])
+        if "target_id" in filters:
+            qs = qs.filter(target_id=filters["target_id"])
+        if "actor" in filters:
+            qs = qs.filter(actor_user_id=filters["actor"])
+        if "action" in filters:
+            qs = qs.filter(action_type=filters["action"])
+        if "since" in filters:
+            qs = qs.filter(created_at__gte=filters["since"])
+        if "until" in filters:
+            qs = qs.filter(created_at__lt=filters["until"])
+        return qs
+
+
+class AuditTrailView(APIView):
+    """
+    GET /api/admin/audit/trail - Compliance lookup across the live table and archived
+    segments, newest first. Same filters as /api/admin/audit (target_type, actor or
+    since required); follow `next` (before/before_id cursor) for older rows.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        params = AuditTrailFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = dict(params.validated_data)
+        limit = filters.pop("limit")
+        before = (filters.pop("before"), filters.pop("before_id")) if "before" in filters else None
+
+        rows = audit_trail(**filters, before=before, limit=limit)
+        next_url = None
+        if len(rows) >= limit:
+            last = rows[-1]
+            next_url = replace_query_param(request.build_absolute_uri(), "before", last["created_at"].isoformat())
+            next_url = replace_query_param(next_url, "before_id", last["id"])
+        return Response({"next": next_url, "results": AuditTrailEntrySerializer(rows, many=True).data})
@@ -0,0 +1,4 @@
+"""
+Performance benchmarks. Run as modules from the project root, e.g.
+python -m benchmarks.bench_email_rendering
+"""
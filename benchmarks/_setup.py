@@ -0,0 +1,10 @@
+"""Django bootstrap shared by benchmark scripts."""
+import os
+
+import django
+
+
+def setup(settings_module: str = "ejournal.settings.test"):
+    """Configure Django (DJANGO_SETTINGS_MODULE wins if already set)."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
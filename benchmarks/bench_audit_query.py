@@ -0,0 +1,212 @@
+"""
+Audit log query benchmark.
+
+Seeds audit_log with synthetic rows and times the GET /api/admin/audit query
+shapes (per-target timeline, actor feed, action + time range, unfiltered),
+first page and a deep page reached by keyset, against the equivalent OFFSET page.
+
+    python -m benchmarks.bench_audit_query --rows 200000
+    # Realistic size, against a scratch PostgreSQL database:
+    DJANGO_SETTINGS_MODULE=ejournal.settings.dev DATABASE_URL=postgres://.../ejournal_bench \\
+        python -m benchmarks.bench_audit_query --rows 10000000 --allow-write --explain
+
+Seeded rows use target_type "bench-*" and are removed with --cleanup.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+from benchmarks._setup import setup
+
+TARGET_TYPES = ["bench-submission", "bench-review_assignment", "bench-user"]
+ACTIONS = ["status_transition", "reviewer_invited", "review_submitted", "decision", "reviewer_approved"]
+ACTORS = 50
+TARGETS_PER_TYPE = 100_000
+PAGE = 50
+
+
+def _in_memory():
+    from django.db import connection
+
+    return connection.vendor == "sqlite" and str(connection.settings_dict["NAME"]).startswith(":memory:")
+
+
+def _actors():
+    from accounts.models import User
+
+    users = [
+        User(email=f"bench-actor-{i}@bench.invalid", full_name=f"Bench Actor {i}", password="!")
+        for i in range(ACTORS)
+    ]
+    User.objects.bulk_create(users, ignore_conflicts=True)
+    return list(User.objects.filter(email__startswith="bench-actor-").values_list("id", flat=True))
+
+
+def seed(rows: int, seed_value: int):
+    """Insert rows spread over a year, newest last."""
+    from django.db import connection
+    from django.utils import timezone
+
+    from audit.models import AuditLog
+
+    actor_ids = _actors()
+    start = timezone.now() - timedelta(days=365)
+    step = 365 * 86400 / max(rows, 1)
+
+    if connection.vendor == "postgresql":
+        # Server-side generation; the ORM path takes hours at 10M rows
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT setseed(%s)", [(seed_value % 1000) / 1000])
+            cursor.execute(
+                """
+                INSERT INTO audit_log (actor_user_id, action_type, target_type, target_id, new_value, created_at)
+                SELECT (%(actors)s::bigint[])[1 + floor(random() * %(n_actors)s)::int],
+                       (%(actions)s::text[])[1 + floor(random() * %(n_actions)s)::int],
+                       (%(types)s::text[])[1 + floor(random() * %(n_types)s)::int],
+                       1 + floor(random() * %(targets)s)::bigint,
+                       NULL,
+                       %(start)s::timestamptz + (g * %(step)s) * interval '1 second'
+                FROM generate_series(1, %(rows)s) AS g
+                """,
+                {
+                    "actors": actor_ids,
+                    "n_actors": len(actor_ids),
+                    "actions": ACTIONS,
+                    "n_actions": len(ACTIONS),
+                    "types": TARGET_TYPES,
+                    "n_types": len(TARGET_TYPES),
+                    "targets": TARGETS_PER_TYPE,
+                    "start": start,
+                    "step": step,
+                    "rows": rows,
+                },
+            )
+            cursor.execute("ANALYZE audit_log")
+        return
+
+    rng = random.Random(seed_value)
+    batch = []
+    for i in range(rows):
+        batch.append(
+            AuditLog(
+                actor_user_id=rng.choice(actor_ids),
+                action_type=rng.choice(ACTIONS),
+                target_type=rng.choice(TARGET_TYPES),
+                target_id=rng.randint(1, TARGETS_PER_TYPE),
+                created_at=start + timedelta(seconds=i * step),
+            )
+        )
+        if len(batch) == 10_000:
+            AuditLog.objects.bulk_create(batch)
+            batch = []
+    AuditLog.objects.bulk_create(batch)
+
+
+def cleanup():
+    """Delete seeded rows in batches, then the bench actors."""
+    from accounts.models import User
+    from audit.models import AuditLog
+
+    seeded = AuditLog.objects.filter(target_type__startswith="bench-")
+    while True:
+        ids = list(seeded.values_list("id", flat=True)[:10_000])
+        if not ids:
+            break
+        AuditLog.objects.filter(id__in=ids).delete()
+    User.objects.filter(email__startswith="bench-actor-").delete()
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def _cursor_at(qs, pages):
+    """created_at of the last row before page `pages` (what a client's cursor would hold)."""
+    values = qs.order_by("-created_at", "-id").values_list("created_at", flat=True)
+    found = list(values[pages * PAGE - 1 : pages * PAGE]) or list(values.reverse()[:1])
+    return found[0]
+
+
+def run(repeat: int, deep: int, explain: bool) -> dict:
+    from audit.models import AuditLog
+
+    # Parameters taken from the newest seeded row (cheap to find via the created_at index)
+    newest = AuditLog.objects.filter(target_type__startswith="bench-").order_by("-created_at").first()
+
+    shapes = {
+        "target": AuditLog.objects.filter(target_type=newest.target_type, target_id=newest.target_id),
+        "actor": AuditLog.objects.filter(actor_user_id=newest.actor_user_id),
+        "action_range": AuditLog.objects.filter(
+            action_type="decision", created_at__gte=newest.created_at - timedelta(days=30)
+        ),
+        "unfiltered": AuditLog.objects.all(),
+    }
+
+    results = {}
+    for name, qs in shapes.items():
+        ordered = qs.order_by("-created_at", "-id")
+        keyset = ordered.filter(created_at__lt=_cursor_at(qs, deep))
+        results[name] = {
+            "first_page_ms": _time(lambda: list(ordered[:PAGE]), repeat),
+            f"keyset_page_{deep}_ms": _time(lambda: list(keyset[:PAGE]), repeat),
+            f"offset_page_{deep}_ms": _time(lambda: list(ordered[deep * PAGE : (deep + 1) * PAGE]), repeat),
+        }
+        if explain:
+            results[name]["plan"] = ordered[:PAGE].explain()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--deep", type=int, default=20, help="Page depth for keyset vs OFFSET comparison")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse rows seeded by an earlier run")
+    parser.add_argument("--allow-write", action="store_true", help="Required for databases other than in-memory SQLite")
+    parser.add_argument("--cleanup", action="store_true", help="Delete seeded rows and exit")
+    parser.add_argument("--explain", action="store_true", help="Include query plans")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    setup()
+    if _in_memory():
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+    elif not args.allow_write:
+        print("Refusing to seed a persistent database without --allow-write", file=sys.stderr)
+        return 2
+
+    if args.cleanup:
+        cleanup()
+        return 0
+    if not args.skip_seed:
+        started = time.perf_counter()
+        seed(args.rows, args.seed)
+        if not args.json:
+            print(f"seeded {args.rows:,} rows in {time.perf_counter() - started:.1f}s")
+
+    results = run(args.repeat, args.deep, args.explain)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for name, r in results.items():
+        timings = "  ".join(f"{k}={v}" for k, v in r.items() if k != "plan")
+        print(f"{name:>13}: {timings}")
+        if "plan" in r:
+            print("    " + r["plan"].replace("\n", "\n    "))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
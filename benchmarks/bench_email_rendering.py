@@ -0,0 +1,80 @@
+"""
+Email rendering throughput benchmark.
+
+Compares the compiled-template batch path (notifications.rendering.render_many)
+against loading and rendering templates per recipient, for a fan-out event.
+
+    python -m benchmarks.bench_email_rendering --recipients 2000
+    python -m benchmarks.bench_email_rendering --min-rate 5000   # exit 1 if slower
+"""
+import argparse
+import json
+import sys
+import time
+
+from benchmarks._setup import setup
+
+
+def _naive(event_type, contexts, shared):
+    """Per-recipient loader lookup + render (what ad-hoc render_to_string calls do)."""
+    from django.template import engines
+    from django.template.loader import render_to_string
+
+    from notifications.rendering import SUBJECTS
+
+    out = []
+    for ctx in contexts:
+        data = {**shared, **ctx}
+        subject = engines["django"].from_string(SUBJECTS[event_type]).render(data)
+        body = render_to_string(f"notifications/email/{event_type}.txt", data)
+        html = render_to_string(f"notifications/email/{event_type}.html", data)
+        out.append((subject, body, html))
+    return out
+
+
+def run(recipients: int, repeat: int) -> dict:
+    from notifications.models import EVENT_REVIEW_SUBMITTED
+    from notifications.rendering import render_email, render_many
+
+    shared = {"submission_title": "Deep learning for manuscript triage: a benchmark study"}
+    contexts = [{"recipient_email": f"editor{i}@example.org"} for i in range(recipients)]
+    render_email(EVENT_REVIEW_SUBMITTED, {**shared, **contexts[0]})  # warm the compile cache
+
+    results = {}
+    for name, fn in (
+        ("render_many", lambda: render_many(EVENT_REVIEW_SUBMITTED, contexts, shared=shared)),
+        ("per_recipient", lambda: _naive(EVENT_REVIEW_SUBMITTED, contexts, shared)),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        results[name] = {"seconds": round(best, 4), "emails_per_second": round(recipients / best, 1)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-rate", type=float, default=0, help="Fail if render_many is slower (emails/s)")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    setup()
+    results = run(args.recipients, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, r in results.items():
+            print(f"{name:>14}: {r['emails_per_second']:>10,.0f} emails/s ({r['seconds']:.4f}s for {args.recipients})")
+    rate = results["render_many"]["emails_per_second"]
+    if args.min_rate and rate < args.min_rate:
+        print(f"FAIL: render_many {rate:,.0f} emails/s < {args.min_rate:,.0f}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
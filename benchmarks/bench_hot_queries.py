@@ -0,0 +1,244 @@
+"""
+Hot query index benchmark.
+
+Seeds the synthetic dataset (ejournal.synthetic, as seed_db --scale) and drives
+the author, editor and reviewer lists and the invite-reviewer duplicate check
+through the API. Every SELECT an endpoint issues is EXPLAINed and the endpoint
+is timed twice: "before" with the indexes from submissions migration 0004 and
+reviews migration 0003 dropped, "after" with them in place. Queries whose plan
+changed are printed with both plans (--all-plans prints every query).
+
+    python -m benchmarks.bench_hot_queries --scale 5000
+    DJANGO_SETTINGS_MODULE=ejournal.settings.dev DATABASE_URL=postgres://.../ejournal_bench \\
+        python -m benchmarks.bench_hot_queries --scale 200000 --allow-write
+
+On a persistent database the indexes are dropped and rebuilt in place (use a
+scratch database); seeded data is reused by later runs with the same --seed.
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+
+from benchmarks._setup import setup
+
+NEW_INDEXES = {
+    "submissions.Submission": [
+        "submissions_author_status_idx",
+        "submissions_status_created_idx",
+        "submissions_queue_created_idx",
+    ],
+    "reviews.ReviewAssignment": [
+        "reviews_assign_rev_status_idx",
+        "reviews_assign_invite_dup_idx",
+    ],
+}
+
+
+def _in_memory():
+    from django.db import connection
+
+    return connection.vendor == "sqlite" and str(connection.settings_dict["NAME"]).startswith(":memory:")
+
+
+def _analyze():
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("ANALYZE submissions_submission, submissions_version, reviews_assignment")
+        elif connection.vendor == "sqlite":
+            cursor.execute("ANALYZE")
+
+
+def set_indexes(present: bool):
+    """Create or drop the indexes under test (skipping those already in that state), then ANALYZE."""
+    from django.apps import apps
+    from django.db import connection
+
+    with connection.schema_editor() as editor:
+        for label, names in NEW_INDEXES.items():
+            model = apps.get_model(label)
+            with connection.cursor() as cursor:
+                existing = set(connection.introspection.get_constraints(cursor, model._meta.db_table))
+            for index in model._meta.indexes:
+                if index.name not in names or (index.name in existing) == present:
+                    continue
+                if present:
+                    editor.add_index(model, index)
+                else:
+                    editor.remove_index(model, index)
+    _analyze()
+
+
+def seed(scale: int, seed_value: int, quiet: bool):
+    """seed_db --scale, unless this seed's data is already there."""
+    import io
+
+    from django.core.management import call_command
+
+    from accounts.models import User
+
+    if User.objects.filter(email__endswith=f"@seed-{seed_value}.invalid").exists():
+        return
+    call_command("seed_db", scale=scale, seed=seed_value, stdout=io.StringIO() if quiet else sys.stdout)
+
+
+def endpoints(seed_value: int) -> list[tuple]:
+    """(name, user, method, path, data, expected status) for the busiest seeded actors."""
+    from django.db.models import Count
+
+    from accounts.models import User
+    from reviews.models import ReviewAssignment
+    from submissions.models import STATUS_SCREENING, STATUS_UNDER_REVIEW, Submission
+
+    domain = f"@seed-{seed_value}.invalid"
+    author_id = (
+        Submission.objects.filter(author__email__endswith=domain)
+        .values("author").annotate(n=Count("id")).order_by("-n")[0]["author"]
+    )
+    reviewer_id = (
+        ReviewAssignment.objects.filter(reviewer__email__endswith=domain)
+        .values("reviewer").annotate(n=Count("id")).order_by("-n")[0]["reviewer"]
+    )
+    editor = User.objects.filter(email__endswith=domain, editor_status="approved").order_by("id")[0]
+    candidates = (
+        ReviewAssignment.objects
+        .filter(submission__status__in=[STATUS_SCREENING, STATUS_UNDER_REVIEW], submission__author__email__endswith=domain)
+        .exclude(invited_email="")
+        .select_related("submission")
+        .order_by("id")[:200]
+    )
+    duplicate = next(
+        a for a in candidates
+        if a.submission.versions.order_by("-version_number").values_list("id", flat=True)[0] == a.submission_version_id
+    )
+    author, reviewer = User.objects.get(pk=author_id), User.objects.get(pk=reviewer_id)
+    return [
+        ("author_list", author, "get", "/api/submissions/", None, 200),
+        ("author_list_status", author, "get", "/api/submissions/?status=under_review", None, 200),
+        ("editor_queue", editor, "get", "/api/editor/submissions/", None, 200),
+        ("editor_queue_status", editor, "get", "/api/editor/submissions/?status=submitted", None, 200),
+        ("reviewer_list", reviewer, "get", "/api/reviewer/assignments/", None, 200),
+        ("reviewer_list_status", reviewer, "get", "/api/reviewer/assignments/?status=accepted", None, 200),
+        (
+            "invite_duplicate",
+            editor,
+            "post",
+            f"/api/editor/submissions/{duplicate.submission_id}/invite-reviewer/",
+            {"reviewer_email": duplicate.invited_email},
+            400,
+        ),
+    ]
+
+
+def _timings(prefix: str, samples: list[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        f"{prefix}_median_ms": round(statistics.median(samples), 3),
+        f"{prefix}_p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)], 3),
+    }
+
+
+def measure(cases, repeat: int) -> dict:
+    """Per endpoint: request and SQL time, and the plan of every SELECT it issued."""
+    from django.db import connection
+    from rest_framework.test import APIClient
+
+    from monitoring.profiling import _QueryLog, explain
+
+    results = {}
+    for name, user, method, path, data, expected in cases:
+        client = APIClient()
+        client.force_authenticate(user=user)
+        call = getattr(client, method)
+        log = _QueryLog("default")
+        with connection.execute_wrapper(log):
+            response = call(path, data, format="json") if data is not None else call(path)
+        if response.status_code != expected:
+            raise RuntimeError(f"{name}: expected {expected}, got {response.status_code}: {response.content[:200]!r}")
+        gc.collect()  # the editor queue leaves a lot behind; don't bill it to the next endpoint
+        request_ms, db_ms = [], []
+        for _ in range(repeat):
+            timed = _QueryLog("default")
+            start = time.perf_counter()
+            with connection.execute_wrapper(timed):
+                call(path, data, format="json") if data is not None else call(path)
+            request_ms.append((time.perf_counter() - start) * 1000)
+            db_ms.append(sum(q[0] for q in timed.queries) * 1000)
+        results[name] = {
+            **_timings("request", request_ms),
+            **_timings("db", db_ms),
+            "queries": [
+                {"sql": sql, "plan": explain(alias, sql, params)}
+                for _seconds, sql, params, many, alias in log.queries
+                if not many and sql.lstrip().upper().startswith("SELECT")
+            ],
+        }
+    return results
+
+
+def run(seed_value: int, repeat: int) -> dict:
+    from django.test import override_settings
+
+    with override_settings(ALLOWED_HOSTS=["*"], DEBUG=False):
+        cases = endpoints(seed_value)
+        try:
+            set_indexes(False)
+            before = measure(cases, repeat)
+        finally:
+            set_indexes(True)
+        after = measure(cases, repeat)
+    return {"before": before, "after": after}
+
+
+def _print(results: dict, all_plans: bool):
+    for name, after in results["after"].items():
+        before = results["before"][name]
+        print(
+            f"{name:>21}: db median {before['db_median_ms']} -> {after['db_median_ms']} ms "
+            f"(p95 {before['db_p95_ms']} -> {after['db_p95_ms']}), "
+            f"request median {before['request_median_ms']} -> {after['request_median_ms']} ms"
+        )
+        for old, new in zip(before["queries"], after["queries"]):
+            if not all_plans and old["plan"] == new["plan"]:
+                continue
+            sql = new["sql"] if len(new["sql"]) <= 160 else new["sql"][:157] + "..."
+            print(f"    {sql}")
+            for label, query in (("before", old), ("after", new)):
+                for line in query["plan"] or []:
+                    print(f"      {label:>6}  {line}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=2000, help="Synthetic authors (about 20 rows each)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed requests per endpoint and phase")
+    parser.add_argument("--allow-write", action="store_true", help="Required for databases other than in-memory SQLite")
+    parser.add_argument("--all-plans", action="store_true", help="Print every query's plans, not just changed ones")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    setup()
+    if _in_memory():
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+    elif not args.allow_write:
+        print("Refusing to seed a persistent database and rebuild its indexes without --allow-write", file=sys.stderr)
+        return 2
+
+    seed(args.scale, args.seed, quiet=args.json)
+    results = run(args.seed, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print(results, args.all_plans)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+User search (typeahead) benchmark.
+
+Seeds accounts_user with synthetic users and times search_users() for typeahead
+prefixes, full-name fragments, misspellings and affiliation words, reporting the
+median and p95 latency per query shape (target: under 20 ms at 500k users on
+PostgreSQL with the pg_trgm indexes from accounts migration 0004).
+
+    python -m benchmarks.bench_user_search --users 20000
+    DJANGO_SETTINGS_MODULE=ejournal.settings.dev DATABASE_URL=postgres://.../ejournal_bench \\
+        python -m benchmarks.bench_user_search --users 500000 --allow-write --explain
+
+Seeded users have emails ending in @bench.invalid and are removed with --cleanup.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+from benchmarks._setup import setup
+
+FIRST = ["anna", "boris", "chen", "dilnoza", "elena", "farrukh", "gulnora", "hiroshi", "ivan", "jamshid",
+         "karina", "lucas", "madina", "nodir", "olga", "pedro", "rustam", "sevara", "timur", "umida"]
+LAST = ["abdullaev", "brown", "karimova", "nakamura", "petrov", "rahimov", "smith", "tashkentova",
+        "usmonov", "wang", "yusupova", "zhukov"]
+AFFILIATIONS = ["National University of Uzbekistan", "Tashkent State Technical University",
+                "Samarkand State University", "Inha University in Tashkent", "Westminster International University",
+                "Academy of Sciences", "Bukhara State University", "Ferghana Polytechnic Institute"]
+DOMAIN = "bench.invalid"
+
+
+def _in_memory():
+    from django.db import connection
+
+    return connection.vendor == "sqlite" and str(connection.settings_dict["NAME"]).startswith(":memory:")
+
+
+def seed(users: int, seed_value: int):
+    """Insert synthetic users (unusable passwords, a third of them reviewers)."""
+    from django.db import connection
+
+    from accounts.models import User
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT setseed(%s)", [(seed_value % 1000) / 1000])
+            cursor.execute(
+                """
+                INSERT INTO accounts_user (password, is_superuser, email, full_name, affiliation, country,
+                    orcid_id, is_email_verified, roles, reviewer_status, editor_status, why_to_be,
+                    notification_digest, is_staff, is_active, date_joined)
+                SELECT '!', false, f || '.' || l || g || '@' || %(domain)s, initcap(f) || ' ' || initcap(l),
+                       a, '', '', true,
+                       CASE WHEN g %% 3 = 0 THEN '["author", "reviewer"]'::jsonb ELSE '["author"]'::jsonb END,
+                       CASE WHEN g %% 3 = 0 THEN 'approved' END, NULL, '', 'immediate', false, true, now()
+                FROM generate_series(1, %(users)s) AS g,
+                     LATERAL (SELECT (%(first)s::text[])[1 + floor(random() * %(n_first)s)::int] AS f,
+                                     (%(last)s::text[])[1 + floor(random() * %(n_last)s)::int] AS l,
+                                     (%(aff)s::text[])[1 + floor(random() * %(n_aff)s)::int] AS a,
+                                     g AS _g) AS pick  -- referencing g re-runs random() per row
+                """,
+                {
+                    "domain": DOMAIN,
+                    "users": users,
+                    "first": FIRST,
+                    "n_first": len(FIRST),
+                    "last": LAST,
+                    "n_last": len(LAST),
+                    "aff": AFFILIATIONS,
+                    "n_aff": len(AFFILIATIONS),
+                },
+            )
+            cursor.execute("ANALYZE accounts_user")
+        return
+
+    rng = random.Random(seed_value)
+    batch = []
+    for i in range(users):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        reviewer = i % 3 == 0
+        batch.append(
+            User(
+                email=f"{first}.{last}{i}@{DOMAIN}",
+                full_name=f"{first.title()} {last.title()}",
+                affiliation=rng.choice(AFFILIATIONS),
+                password="!",
+                roles=["author", "reviewer"] if reviewer else ["author"],
+                reviewer_status="approved" if reviewer else None,
+            )
+        )
+        if len(batch) == 10_000:
+            User.objects.bulk_create(batch)
+            batch = []
+    User.objects.bulk_create(batch)
+
+
+def cleanup():
+    """Delete seeded users in batches."""
+    from accounts.models import User
+
+    seeded = User.objects.filter(email__endswith=f"@{DOMAIN}")
+    while True:
+        ids = list(seeded.values_list("id", flat=True)[:10_000])
+        if not ids:
+            break
+        User.objects.filter(id__in=ids).delete()
+
+
+QUERIES = {
+    "email_prefix": ["fa", "farr", "farrukh.ra", "sev", "sevara.yus"],
+    "name_fragment": ["Karimova", "Nakamura", "Petrov", "Rahimov"],
+    "misspelled": ["Nakamora", "Yusupva", "Tashkentva", "Abdulaev"],
+    "affiliation": ["Samarkand", "Inha", "Polytechnic", "Westminster"],
+}
+
+
+def run(repeat: int, explain: bool) -> dict:
+    from accounts.models import User
+    from accounts.search import search_users
+
+    results = {}
+    for shape, queries in QUERIES.items():
+        samples, hits = [], 0
+        for _ in range(repeat):
+            for q in queries:
+                start = time.perf_counter()
+                found = search_users(q, limit=20)
+                samples.append((time.perf_counter() - start) * 1000)
+                hits += len(found)
+        samples.sort()
+        results[shape] = {
+            "median_ms": round(statistics.median(samples), 3),
+            "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+            "avg_hits": round(hits / len(samples), 1),
+        }
+    start = time.perf_counter()
+    for _ in range(repeat):
+        search_users("naka", limit=20, approved_reviewers=True)
+    results["reviewer_picker"] = {"median_ms": round((time.perf_counter() - start) * 1000 / repeat, 3)}
+
+    if explain:
+        from django.db import connection
+
+        if connection.vendor == "postgresql":
+            from accounts.search import _postgres_search
+
+            qs = _postgres_search(User.objects.filter(is_active=True), "nakamora")[:20]
+            results["misspelled"]["plan"] = qs.explain(analyze=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse users seeded by an earlier run")
+    parser.add_argument("--allow-write", action="store_true", help="Required for databases other than in-memory SQLite")
+    parser.add_argument("--cleanup", action="store_true", help="Delete seeded users and exit")
+    parser.add_argument("--explain", action="store_true", help="Include the query plan (PostgreSQL)")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    setup()
+    if _in_memory():
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+    elif not args.allow_write:
+        print("Refusing to seed a persistent database without --allow-write", file=sys.stderr)
+        return 2
+
+    if args.cleanup:
+        cleanup()
+        return 0
+    if not args.skip_seed:
+        started = time.perf_counter()
+        seed(args.users, args.seed)
+        if not args.json:
+            print(f"seeded {args.users:,} users in {time.perf_counter() - started:.1f}s")
+
+    results = run(args.repeat, args.explain)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for name, r in results.items():
+        timings = "  ".join(f"{k}={v}" for k, v in r.items() if k != "plan")
+        print(f"{name:>15}: {timings}")
+        if "plan" in r:
+            print("    " + r["plan"].replace("\n", "\n    "))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
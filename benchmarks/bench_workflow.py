@@ -0,0 +1,456 @@
+"""
+End-to-end workflow load test.
+
+Virtual users (threads, each with its own Django test client and JWT) drive the
+real API through a full journey: signup, login, draft creation, PATCH autosaves,
+manuscript upload, submit, editor queue, screening, reviewer invitation, send to
+review, reviewer accept and review, move to decision and the decision. Celery runs
+eagerly in-process and notification emails go over SMTP to a local sink, so
+every request pays for its on-commit tasks and email delivery, as it would with
+a worker pool that is keeping up. Reports p50/p95/p99 latency and requests per
+second per endpoint.
+
+    python -m benchmarks.bench_workflow --users 8 --journeys 5
+    python -m benchmarks.bench_workflow --save-baseline benchmarks/baselines/workflow.json
+    python -m benchmarks.bench_workflow --baseline benchmarks/baselines/workflow.json   # exit 1 on p95 regression
+    # Against a scratch PostgreSQL database (seeded users end in @bench.invalid; remove with --cleanup):
+    DJANGO_SETTINGS_MODULE=ejournal.settings.dev DATABASE_URL=postgres://.../ejournal_bench \\
+        python -m benchmarks.bench_workflow --users 32 --journeys 20 --allow-write
+
+With the default test settings the run uses a scratch SQLite file (shared by the
+virtual-user threads, unlike :memory:) that is deleted afterwards. Baselines
+are only comparable on the same machine and database.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from benchmarks._setup import setup
+
+DOMAIN = "bench.invalid"
+PASSWORD = "bench-password-1"
+STEPS = [
+    "signup",
+    "login",
+    "create_draft",
+    "autosave",
+    "upload_manuscript",
+    "submit",
+    "editor_queue",
+    "start_screening",
+    "invite_reviewer",
+    "send_to_review",
+    "accept_invitation",
+    "submit_review",
+    "move_to_decision",
+    "decision",
+]
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: accept every message and count it."""
+
+    def handle(self):
+        self.wfile.write(b"220 bench-sink ESMTP\r\n")
+        for line in self.rfile:
+            command = line[:4].upper()
+            if command == b"EHLO":
+                reply = b"250-bench-sink\r\n250 8BITMIME"
+            elif command == b"DATA":
+                self.wfile.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                with self.server.lock:
+                    self.server.messages += 1
+                reply = b"250 Queued"
+            elif command == b"QUIT":
+                self.wfile.write(b"221 Bye\r\n")
+                return
+            else:
+                reply = b"250 OK"
+            self.wfile.write(reply + b"\r\n")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.messages = 0
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)]
+
+
+def _in_memory():
+    from django.db import connection
+
+    return connection.vendor == "sqlite" and str(connection.settings_dict["NAME"]).startswith(":memory:")
+
+
+def _use_scratch_sqlite(path: str):
+    """Point the default database at a SQLite file so all virtual-user threads see the same data."""
+    from django.core.management import call_command
+    from django.db import connection
+
+    connection.close()
+    # settings_dict is shared with the connections threads will open
+    connection.settings_dict.update(
+        NAME=path,
+        OPTIONS={"timeout": 60, "transaction_mode": "IMMEDIATE", "init_command": "PRAGMA journal_mode=WAL;"},
+    )
+    call_command("migrate", verbosity=0)
+
+
+def seed(users: int, background: int) -> dict:
+    """Topic area, editors, one approved reviewer per virtual user and optional background submissions."""
+    from django.contrib.auth.hashers import make_password
+
+    from accounts.models import APPROVAL_APPROVED, User
+    from submissions.models import STATUS_SUBMITTED, Submission, TopicArea
+
+    run = f"{int(time.time())}"
+    password = make_password(PASSWORD)  # hashed once for every seeded account
+    topic, _ = TopicArea.objects.get_or_create(slug="bench-topic", defaults={"name": "Benchmark Topic"})
+    editors = [
+        User(
+            email=f"bench-editor-{run}-{i}@{DOMAIN}",
+            full_name=f"Bench Editor {i}",
+            password=password,
+            roles=["editor"],
+            editor_status=APPROVAL_APPROVED,
+        )
+        for i in range(2)
+    ]
+    reviewers = [
+        User(
+            email=f"bench-reviewer-{run}-{i}@{DOMAIN}",
+            full_name=f"Bench Reviewer {i}",
+            password=password,
+            roles=["reviewer"],
+            reviewer_status=APPROVAL_APPROVED,
+        )
+        for i in range(users)
+    ]
+    User.objects.bulk_create(editors + reviewers)
+    if background:
+        owner = User.objects.create(email=f"bench-author-{run}@{DOMAIN}", full_name="Bench Author", password=password)
+        Submission.objects.bulk_create(
+            [
+                Submission(
+                    author=owner,
+                    status=STATUS_SUBMITTED,
+                    title=f"Background submission {i}",
+                    abstract="Abstract",
+                    keywords=["a", "b", "c"],
+                    topic_area=topic,
+                )
+                for i in range(background)
+            ],
+            batch_size=1000,
+        )
+    return {"run": run, "topic": topic.id, "editors": [e.email for e in editors], "reviewers": [r.email for r in reviewers]}
+
+
+def cleanup():
+    """Delete benchmark users (their submissions, assignments and reviews cascade)."""
+    from accounts.models import User
+    from submissions.models import TopicArea
+
+    seeded = User.objects.filter(email__endswith=f"@{DOMAIN}")
+    while True:
+        ids = list(seeded.values_list("id", flat=True)[:1000])
+        if not ids:
+            break
+        User.objects.filter(id__in=ids).delete()
+    TopicArea.objects.filter(slug="bench-topic").delete()
+
+
+class StepFailed(Exception):
+    pass
+
+
+class VirtualUser:
+    """One thread running journeys back to back, recording (step, seconds) samples."""
+
+    def __init__(self, index: int, fixtures: dict, journeys: int, autosaves: int, pdf: bytes):
+        from django.test import Client
+
+        self.index = index
+        self.fixtures = fixtures
+        self.journeys = journeys
+        self.autosaves = autosaves
+        self.pdf = pdf
+        self.client = Client()
+        self.samples = []
+        self.errors = defaultdict(list)
+        self.tokens = {}
+
+    def call(self, step, method, path, expected, token=None, **kwargs):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        start = time.perf_counter()
+        resp = getattr(self.client, method)(path, **kwargs, **headers)
+        self.samples.append((step, time.perf_counter() - start))
+        if resp.status_code != expected:
+            self.errors[step].append(f"{resp.status_code}: {resp.content[:200]!r}")
+            raise StepFailed(step)
+        return resp.json() if resp.get("Content-Type", "").startswith("application/json") else None
+
+    def login(self, email):
+        data = self.call("login", "post", "/api/auth/login", 200, data={"email": email, "password": PASSWORD}, content_type="application/json")
+        return data["access"]
+
+    def journey(self, n: int):
+        fx = self.fixtures
+        editor = self.tokens["editor"]
+        reviewer = self.tokens["reviewer"]
+        email = f"bench-vu-{fx['run']}-{self.index}-{n}@{DOMAIN}"
+        self.call(
+            "signup", "post", "/api/auth/signup", 201,
+            data={"email": email, "password": PASSWORD, "full_name": f"Virtual User {self.index}", "roles": ["author"]},
+            content_type="application/json",
+        )
+        author = self.login(email)
+        sub = self.call("create_draft", "post", "/api/submissions/", 201, token=author, data={}, content_type="application/json")
+        url = f"/api/submissions/{sub['id']}/"
+        # The form is filled in four autosaves; --autosaves above that keeps editing the abstract
+        patches = [
+            {"title": "Load-tested manuscript"},
+            {"abstract": "An abstract written in several autosaves. " * 20},
+            {"keywords": ["benchmark", "workflow", "latency"], "topic_area_id": fx["topic"]},
+            {"originality_confirmation": True, "plagiarism_agreement": True, "ethics_compliance": True, "copyright_agreement": True},
+        ]
+        patches += [{"abstract": f"Revised abstract {i}. " * 20} for i in range(self.autosaves - len(patches))]
+        for patch in patches:
+            self.call("autosave", "patch", url, 200, token=author, data=patch, content_type="application/json")
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        upload = SimpleUploadedFile("manuscript.pdf", self.pdf, content_type="application/pdf")
+        self.call("upload_manuscript", "post", f"{url}upload-file/?file_type=manuscript", 200, token=author, data={"file": upload})
+        self.call("submit", "post", f"{url}submit/", 200, token=author)
+
+        editor_url = f"/api/editor/submissions/{sub['id']}/"
+        self.call("editor_queue", "get", "/api/editor/submissions/", 200, token=editor)
+        self.call("start_screening", "post", f"{editor_url}start-screening/", 200, token=editor)
+        invite = self.call(
+            "invite_reviewer", "post", f"{editor_url}invite-reviewer/", 201, token=editor,
+            data={"reviewer_email": fx["reviewers"][self.index]}, content_type="application/json",
+        )
+        self.call("send_to_review", "post", f"{editor_url}send-to-review/", 200, token=editor)
+        assignment = f"/api/reviewer/assignments/{invite['id']}/"
+        self.call("accept_invitation", "post", "/api/reviewer/accept-by-token/", 200, token=reviewer, data={"token": invite["token"]}, content_type="application/json")
+        self.call(
+            "submit_review", "post", f"{assignment}submit-review/", 200, token=reviewer,
+            data={"summary": "Sound", "strengths": "Clear", "weaknesses": "Few", "recommendation": "accept"},
+            content_type="application/json",
+        )
+        self.call("move_to_decision", "post", f"{editor_url}move-to-decision/", 200, token=editor)
+        self.call(
+            "decision", "post", f"{editor_url}decision/", 200, token=editor,
+            data={"decision": "accept", "decision_letter": "Accepted."}, content_type="application/json",
+        )
+
+    def run(self, start_barrier):
+        from django.db import connections
+
+        try:
+            self.tokens["editor"] = self.login(self.fixtures["editors"][self.index % len(self.fixtures["editors"])])
+            self.tokens["reviewer"] = self.login(self.fixtures["reviewers"][self.index])
+        except StepFailed:
+            start_barrier.abort()
+            return
+        finally:
+            connections.close_all()
+        try:
+            start_barrier.wait()
+        except threading.BrokenBarrierError:
+            return
+        self.samples = []  # the warm-up logins above are not part of the run
+        for n in range(self.journeys):
+            try:
+                self.journey(n)
+            except StepFailed:
+                continue
+        connections.close_all()
+
+
+def run(users: int, journeys: int, autosaves: int, pdf_kb: int, background: int) -> dict:
+    from django.test import override_settings
+
+    from ejournal.celery import app
+
+    pdf = b"%PDF-1.4\n" + b"0" * (pdf_kb * 1024) + b"\n%%EOF\n"
+    fixtures = seed(users, background)
+    media = tempfile.TemporaryDirectory(prefix="bench-media-")
+    app.conf.task_always_eager = True
+    with SMTPSink() as sink, media, override_settings(
+        DEBUG=False,
+        ALLOWED_HOSTS=["*"],
+        MEDIA_ROOT=media.name,
+        EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+        EMAIL_USE_PROVIDER=False,
+        EMAIL_HOST="127.0.0.1",
+        EMAIL_PORT=sink.server_address[1],
+        EMAIL_USE_TLS=False,
+        EMAIL_USE_SSL=False,
+        EMAIL_HOST_USER="",
+        EMAIL_HOST_PASSWORD="",
+        METRICS_ENABLED=False,
+        PROFILING_SAMPLE_RATE=0,
+    ):
+        vus = [VirtualUser(i, fixtures, journeys, autosaves, pdf) for i in range(users)]
+        barrier = threading.Barrier(users + 1)
+        threads = [threading.Thread(target=vu.run, args=(barrier,)) for vu in vus]
+        for t in threads:
+            t.start()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        started = time.perf_counter()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        emails = sink.messages
+
+    by_step = defaultdict(list)
+    errors = defaultdict(list)
+    for vu in vus:
+        for step, seconds in vu.samples:
+            by_step[step].append(seconds * 1000)
+        for step, messages in vu.errors.items():
+            errors[step].extend(messages)
+    endpoints = {}
+    for step in STEPS:
+        samples = sorted(by_step.get(step, []))
+        endpoints[step] = {
+            "requests": len(samples),
+            "errors": len(errors.get(step, [])),
+            "p50_ms": round(percentile(samples, 50), 2) if samples else None,
+            "p95_ms": round(percentile(samples, 95), 2) if samples else None,
+            "p99_ms": round(percentile(samples, 99), 2) if samples else None,
+            "rps": round(len(samples) / elapsed, 2),
+        }
+    completed = sum(len(vu.samples) for vu in vus)
+    return {
+        "config": {"users": users, "journeys": journeys, "autosaves": autosaves, "pdf_kb": pdf_kb, "background": background},
+        "environment": _environment(),
+        "seconds": round(elapsed, 2),
+        "requests": completed,
+        "rps": round(completed / elapsed, 2),
+        "emails_sent": emails,
+        "endpoints": endpoints,
+        "error_samples": {step: messages[:3] for step, messages in errors.items()},
+    }
+
+
+def _environment() -> dict:
+    from django.db import connection
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "database": connection.vendor,
+    }
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Endpoints whose p95 grew by more than max_regression (a fraction) over the baseline."""
+    regressions = []
+    for step, current in results["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(step)
+        if not before or not before.get("p95_ms") or current["p95_ms"] is None:
+            continue
+        change = current["p95_ms"] / before["p95_ms"] - 1
+        if change > max_regression:
+            regressions.append(f"{step}: p95 {before['p95_ms']} -> {current['p95_ms']} ms (+{change:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=4, help="Concurrent virtual users")
+    parser.add_argument("--journeys", type=int, default=3, help="Full journeys per virtual user")
+    parser.add_argument("--autosaves", type=int, default=4, help="PATCH autosaves per draft (at least 4)")
+    parser.add_argument("--pdf-kb", type=int, default=256, help="Manuscript size")
+    parser.add_argument("--background", type=int, default=0, help="Extra submitted submissions in the editor queue")
+    parser.add_argument("--allow-write", action="store_true", help="Required for databases other than in-memory SQLite")
+    parser.add_argument("--cleanup", action="store_true", help="Delete benchmark users and exit")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as the new baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare p95 per endpoint with a saved baseline")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="Allowed p95 growth over the baseline (0.25 = 25%%)")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    setup()
+    scratch = None
+    if _in_memory():
+        scratch = tempfile.TemporaryDirectory(prefix="bench-workflow-")
+        _use_scratch_sqlite(os.path.join(scratch.name, "db.sqlite3"))
+    elif not args.allow_write:
+        print("Refusing to seed a persistent database without --allow-write", file=sys.stderr)
+        return 2
+
+    try:
+        if args.cleanup:
+            cleanup()
+            return 0
+        results = run(args.users, args.journeys, args.autosaves, args.pdf_kb, args.background)
+    finally:
+        if scratch is not None:
+            from django.db import connections
+
+            connections.close_all()
+            scratch.cleanup()
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline) or ".", exist_ok=True)
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{results['requests']} requests in {results['seconds']}s ({results['rps']} req/s), {results['emails_sent']} emails")
+        print(f"{'endpoint':>18} {'n':>6} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+        for step, r in results["endpoints"].items():
+            cells = [f"{r[k]:>9}" if r[k] is not None else f"{'-':>9}" for k in ("p50_ms", "p95_ms", "p99_ms")]
+            print(f"{step:>18} {r['requests']:>6} {r['errors']:>4} {' '.join(cells)} {r['rps']:>8}")
+        for step, messages in results["error_samples"].items():
+            print(f"errors in {step}: {messages[0]}", file=sys.stderr)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions or results["error_samples"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Per-submission activity timeline.
+
+Each source is an indexed, time-ordered query (audit entries, review invitations,
+reviewer responses, submitted reviews, notifications). A page fetches at most
+limit + 1 rows from each source past the cursor and k-way merges them with heapq,
+newest first. Ties are broken by (source rank, id), which also forms the cursor.
+"""
+import base64
+import heapq
+import json
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+@dataclass(frozen=True)
+class TimelineSource:
+    """One stream of timeline entries."""
+
+    kind: str
+    rank: int  # orders sources at the same instant
+    time_field: str
+    queryset: Callable  # submission_id -> QuerySet
+    entry: Callable  # model instance -> dict
+
+
+def _audit_entries(submission_id):
+    from audit.models import AuditLog
+
+    return AuditLog.objects.filter(target_type="submission", target_id=submission_id).select_related("actor_user")
+
+
+def _invitations(submission_id):
+    from reviews.models import ReviewAssignment
+
+    return ReviewAssignment.objects.filter(submission_id=submission_id).select_related("reviewer")
+
+
+def _responses(submission_id):
+    return _invitations(submission_id).filter(responded_at__isnull=False)
+
+
+def _reviews(submission_id):
+    from reviews.models import Review
+
+    return Review.objects.filter(assignment__submission_id=submission_id)
+
+
+def _notifications(submission_id):
+    from notifications.models import Notification
+
+    return Notification.objects.filter(submission_id=submission_id).select_related("user")
+
+
+SOURCES = [
+    TimelineSource(
+        "audit",
+        0,
+        "created_at",
+        _audit_entries,
+        lambda a: {
+            "action": a.action_type,
+            "actor": a.actor_user.email if a.actor_user else None,
+            "old_value": a.old_value,
+            "new_value": a.new_value,
+        },
+    ),
+    TimelineSource(
+        "review_invitation",
+        1,
+        "invited_at",
+        _invitations,
+        lambda ra: {
+            "assignment_id": ra.id,
+            "reviewer": ra.reviewer.email if ra.reviewer else ra.invited_email,
+            "due_date": ra.due_date,
+        },
+    ),
+    TimelineSource(
+        "review_response",
+        2,
+        "responded_at",
+        _responses,
+        lambda ra: {"assignment_id": ra.id, "status": ra.status},
+    ),
+    TimelineSource(
+        "review_submitted",
+        3,
+        "submitted_at",
+        _reviews,
+        lambda r: {"assignment_id": r.assignment_id, "recommendation": r.recommendation},
+    ),
+    TimelineSource(
+        "notification",
+        4,
+        "created_at",
+        _notifications,
+        lambda n: {
+            "event_type": n.event_type,
+            "recipient": n.user.email if n.user else None,
+            "status": n.status,
+        },
+    ),
+]
+
+
+def encode_cursor(position) -> str:
+    at, rank, pk = position
+    raw = json.dumps([at.isoformat(), rank, pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Return (datetime, rank, id); raises ValueError for malformed cursors."""
+    try:
+        at, rank, pk = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        at = parse_datetime(at)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if at is None or not isinstance(rank, int) or not isinstance(pk, int):
+        raise ValueError("Invalid cursor")
+    return at, rank, pk
+
+
+def _after(qs, source: TimelineSource, cursor):
+    """Rows of source that sort after cursor in (time, rank, id) descending order."""
+    at, rank, pk = cursor
+    field = source.time_field
+    if source.rank < rank:
+        return qs.filter(**{f"{field}__lte": at})
+    if source.rank > rank:
+        return qs.filter(**{f"{field}__lt": at})
+    return qs.filter(Q(**{f"{field}__lt": at}) | Q(**{field: at, "id__lt": pk}))
+
+
+def _stream(source: TimelineSource, submission_id: int, cursor, limit: int):
+    qs = source.queryset(submission_id)
+    if cursor:
+        qs = _after(qs, source, cursor)
+    for obj in qs.order_by(f"-{source.time_field}", "-id")[: limit + 1]:
+        yield (getattr(obj, source.time_field), source.rank, obj.id), source, obj
+
+
+def get_timeline(submission_id: int, cursor=None, limit: int = 50):
+    """
+    Return (entries, next_position) for one page, newest first.
+    next_position is None on the last page; pass it to encode_cursor.
+    """
+    streams = [_stream(source, submission_id, cursor, limit) for source in SOURCES]
+    merged = heapq.merge(*streams, key=lambda item: item[0], reverse=True)
+    page = list(islice(merged, limit + 1))
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    entries = [
+        {"type": source.kind, "id": obj.id, "at": position[0], **source.entry(obj)}
+        for position, source, obj in page
+    ]
+    return entries, (page[-1][0] if has_more else None)
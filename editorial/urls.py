@@ -2,12 +2,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import EditorialReviewAssignmentViewSet, EditorialSubmissionViewSet
+from .views import EditorialReviewAssignmentViewSet, EditorialSubmissionViewSet, ReviewerSearchView
 
 router = DefaultRouter()
 router.register("submissions", EditorialSubmissionViewSet, basename="editor-submission")
 router.register("review-assignments", EditorialReviewAssignmentViewSet, basename="editor-review-assignment")
 
 urlpatterns = [
+    path("reviewers/search", ReviewerSearchView.as_view(), name="editor-reviewer-search"),
     path("", include(router.urls)),
 ]
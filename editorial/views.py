@@ -3,15 +3,21 @@ from django.db import transaction
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
 
 from accounts.models import User
 from accounts.permissions import IsApprovedEditor
+from accounts.search import search_users
+from accounts.serializers import UserSearchQuerySerializer, UserSearchResultSerializer
 from reviews.models import ReviewAssignment, STATUS_INVITED
 from submissions.models import (
     STATUS_ACCEPTED,
     STATUS_DECISION_PENDING,
     STATUS_DESK_REJECTED,
+    STATUS_DRAFT,
     STATUS_REJECTED,
     STATUS_REVISION_REQUIRED,
     STATUS_SCREENING,
@@ -27,11 +33,15 @@ from .serializers import (
     EditorialSubmissionSerializer,
     InviteReviewerSerializer,
 )
+from .timeline import decode_cursor, encode_cursor, get_timeline
+
+TIMELINE_PAGE_SIZE = 50
+TIMELINE_MAX_PAGE_SIZE = 200
 
 
 def get_submission_queryset():
     """Submissions visible to editors (all non-draft)."""
-    return Submission.objects.filter(status__ne="draft").select_related(
+    return Submission.objects.exclude(status=STATUS_DRAFT).select_related(
         "author", "topic_area"
     ).prefetch_related("supplementary_files", "review_assignments")
 
@@ -43,20 +53,43 @@ class EditorialSubmissionViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = EditorialSubmissionSerializer
 
     def get_queryset(self):
+        if self.action == "timeline":
+            # Only the existence/visibility check; skip the detail prefetches
+            return Submission.objects.exclude(status=STATUS_DRAFT)
         qs = get_submission_queryset()
         status_filter = self.request.query_params.get("status")
         if status_filter:
             qs = qs.filter(status=status_filter)
-        return qs
+        return qs.order_by("-created_at")
 
     def list(self, request, *args, **kwargs):
-        """GET /api/editor/submissions?status= - List submissions."""
+        """GET /api/editor/submissions?status= - List submissions, newest first."""
         return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
         """GET /api/editor/submissions/{id} - Get submission detail."""
         return super().retrieve(request, *args, **kwargs)
 
+    @action(detail=True, methods=["get"])
+    def timeline(self, request, pk=None):
+        """GET /api/editor/submissions/{id}/timeline?cursor=&limit= - Merged activity stream, newest first."""
+        submission = self.get_object()
+        try:
+            limit = min(max(int(request.query_params.get("limit", TIMELINE_PAGE_SIZE)), 1), TIMELINE_MAX_PAGE_SIZE)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        cursor = request.query_params.get("cursor")
+        try:
+            position = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise NotFound("Invalid cursor.")
+
+        entries, next_position = get_timeline(submission.id, cursor=position, limit=limit)
+        next_url = None
+        if next_position:
+            next_url = replace_query_param(request.build_absolute_uri(), "cursor", encode_cursor(next_position))
+        return Response({"next": next_url, "results": entries})
+
     @action(detail=True, methods=["post"], url_path="start-screening")
     def start_screening(self, request, pk=None):
         """POST /api/editor/submissions/{id}/start-screening - submitted -> screening."""
@@ -337,3 +370,32 @@ class EditorialReviewAssignmentViewSet(viewsets.ViewSet):
             {"detail": "Reminder queued.", "assignment_id": assignment.id},
             status=status.HTTP_200_OK,
         )
+
+
+class ReviewerSearchView(APIView):
+    """
+    GET /api/editor/reviewers/search?q= - Approved reviewers for the invite picker, best match first.
+    With ?submission_id=, each result has shared_works: works co-authored with the submission's
+    author according to the cached ORCID records (a likely conflict of interest).
+    """
+
+    permission_classes = [IsApprovedEditor]
+
+    def get(self, request):
+        params = UserSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        users = search_users(params.validated_data["q"], limit=params.validated_data["limit"], approved_reviewers=True)
+        results = UserSearchResultSerializer(users, many=True).data
+        submission_id = request.query_params.get("submission_id")
+        if submission_id:
+            if not submission_id.isdigit():
+                raise ValidationError({"submission_id": "Must be an integer."})
+            author_id = Submission.objects.filter(pk=submission_id).values_list("author_id", flat=True).first()
+            if author_id is None:
+                raise NotFound("Submission not found.")
+            from integrations.orcid import shared_work_counts
+
+            shared = shared_work_counts(author_id, [u.id for u in users])
+            for result in results:
+                result["shared_works"] = shared.get(result["id"], 0)
+        return Response({"results": results})
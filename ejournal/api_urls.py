@@ -13,7 +13,10 @@ urlpatterns = [
     path("", include("accounts.urls")),
     path("", include("integrations.urls")),
     path("", include("submissions.urls")),
+    path("", include("notifications.urls")),
     path("reviewer/", include("reviews.urls")),
     path("editor/", include("editorial.urls")),
     path("admin/", include("accounts.admin_urls")),
+    path("admin/", include("audit.urls")),
+    path("admin/", include("monitoring.urls")),
 ]
@@ -0,0 +1,98 @@
+"""
+Archival of old rows to compressed NDJSON files (gzip, or zstd when installed).
+
+Rows are copied in primary-key chunks; each chunk is appended to the archive as
+its own gzip member / zstd frame and fsynced before the same rows are deleted, so
+an interrupted run never loses data (multi-member files read back as one stream).
+The codec follows the file suffix: .ndjson.gz or .ndjson.zst.
+"""
+import gzip
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+
+# codec -> file suffix
+CODECS = {"gzip": ".ndjson.gz", "zstd": ".ndjson.zst"}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImproperlyConfigured("zstd archives need the zstandard package: pip install zstandard") from e
+    return zstandard
+
+
+def _is_zstd(path) -> bool:
+    return str(path).endswith(".zst")
+
+
+def append_rows(path: Path, rows) -> None:
+    """Append rows as one compressed member of NDJSON and fsync the file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = b"".join(
+        json.dumps(row, cls=DjangoJSONEncoder, separators=(",", ":")).encode("utf-8") + b"\n" for row in rows
+    )
+    with open(path, "ab") as raw:
+        if _is_zstd(path):
+            raw.write(_zstandard().ZstdCompressor().compress(data))
+        else:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                gz.write(data)
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def archive_queryset(
+    queryset,
+    path: Path,
+    fields: list[str],
+    chunk_size: int = 1000,
+    pause: float = 0,
+    before_delete=None,
+) -> int:
+    """
+    Move rows matching queryset into path, chunk_size rows at a time.
+    before_delete(rows) runs for each chunk after it is written and before it is
+    deleted (e.g. to adjust counters). pause sleeps between chunks to bound load.
+    Returns the number of rows archived.
+    """
+    model = queryset.model
+    pk_name = model._meta.pk.name
+    if pk_name not in fields:
+        fields = [pk_name, *fields]
+    total = 0
+    while True:
+        rows = list(queryset.order_by(pk_name).values(*fields)[:chunk_size])
+        if not rows:
+            break
+        append_rows(path, rows)
+        if before_delete:
+            before_delete(rows)
+        model._base_manager.filter(pk__in=[r[pk_name] for r in rows]).delete()
+        total += len(rows)
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def _open_text(path):
+    if _is_zstd(path):
+        raw = open(path, "rb")
+        reader = _zstandard().ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return gzip.open(path, "rt", encoding="utf-8")
+
+
+def iter_archive(paths):
+    """Yield archived rows (dicts) from one or more .ndjson.gz / .ndjson.zst files."""
+    for path in paths:
+        with _open_text(path) as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,149 @@
+"""
+Two-tier cache for reference data (topic areas and other small, rarely edited tables).
+
+Each ReferenceCache namespace has a version counter in the shared cache (Redis).
+Values are stored there under keys that include the version, and each process
+keeps an LRU of them in front. A local entry is trusted for
+REFERENCE_CACHE_LOCAL_SECONDS. After that, one cache round trip checks the
+version before it is used again. Saving or deleting a watched model bumps the
+version (again on commit, so no worker can cache pre-commit rows under the new
+version) and clears this process's entries. Other workers notice within
+REFERENCE_CACHE_LOCAL_SECONDS. In steady state a lookup costs no query and,
+inside the local window, no network I/O either. Cache errors fall back to the
+loader.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+
+class _LocalLRU:
+    """Thread-safe, size-bounded map of key -> (version, value, checked_at)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def discard_namespace(self, namespace: str):
+        with self._lock:
+            for key in [k for k in self._data if k[0] == namespace]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LocalLRU(settings.REFERENCE_CACHE_LOCAL_MAX_ENTRIES)
+
+
+def clear_local():
+    """Forget this process's entries (tests, or after editing rows with queryset.update())."""
+    _local.clear()
+
+
+class ReferenceCache:
+    """A namespace of cached values that is invalidated as a whole; see the module docstring."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.version_key = f"refcache:{namespace}:version"
+
+    def _value_key(self, key: str, version: int) -> str:
+        return f"refcache:{self.namespace}:{key}:v{version}"
+
+    def version(self) -> int:
+        """Current version from the shared cache (created on first use)."""
+        # Seeded from the clock so a counter lost to eviction never restarts at a version a worker still holds
+        cache.add(self.version_key, int(time.time()), timeout=None)
+        return cache.get(self.version_key) or 0
+
+    def get(self, key: str, loader):
+        """The cached value for key, calling loader() to build it on a miss."""
+        local_key = (self.namespace, key)
+        entry = _local.get(local_key)
+        now = time.monotonic()
+        if entry is not None and now - entry[2] < settings.REFERENCE_CACHE_LOCAL_SECONDS:
+            return entry[1]
+        try:
+            version = self.version()
+            if entry is not None and entry[0] == version:
+                _local.set(local_key, (version, entry[1], now))
+                return entry[1]
+            value_key = self._value_key(key, version)
+            value = cache.get(value_key)
+            if value is None:
+                value = loader()
+                cache.set(value_key, value, settings.REFERENCE_CACHE_SECONDS)
+        except Exception:
+            logger.warning("Reference cache unavailable for %s; loading directly", self.namespace, exc_info=True)
+            return loader()
+        _local.set(local_key, (version, value, now))
+        return value
+
+    def _bump(self):
+        try:
+            try:
+                cache.incr(self.version_key)
+            except ValueError:
+                cache.add(self.version_key, int(time.time()), timeout=None)
+        except Exception:
+            logger.warning("Could not invalidate reference cache %s", self.namespace, exc_info=True)
+        _local.discard_namespace(self.namespace)
+
+    def invalidate(self):
+        """Drop every value in the namespace (now, and again once the transaction commits)."""
+        self._bump()
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(self._bump)
+
+    def watch(self, model):
+        """Invalidate whenever a row of model is saved or deleted."""
+
+        def handler(sender, **kwargs):
+            self.invalidate()
+
+        uid = f"refcache:{self.namespace}:{model._meta.label_lower}"
+        post_save.connect(handler, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(handler, sender=model, weak=False, dispatch_uid=f"{uid}:delete")
+
+
+def conditional_response(request, data, etag: str) -> Response:
+    """
+    Response for cacheable reference data: 304 when If-None-Match carries etag,
+    otherwise data. Both carry ETag and Cache-Control (max-age REFERENCE_CACHE_MAX_AGE).
+    """
+    candidates = {tag.strip().removeprefix("W/") for tag in request.headers.get("If-None-Match", "").split(",")}
+    if etag in candidates or "*" in candidates:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+    response["ETag"] = etag
+    # private: the endpoints require authentication
+    response["Cache-Control"] = f"private, max-age={settings.REFERENCE_CACHE_MAX_AGE}"
+    return response
@@ -1,11 +1,57 @@
 """Celery application configuration."""
 from celery import Celery
 
+# Queues (declared in settings.CELERY_TASK_QUEUES)
+QUEUE_DEFAULT = "celery"
+QUEUE_TRANSACTIONAL = "notifications-high"
+QUEUE_BULK = "notifications-bulk"
+
+# Emails a user is waiting on right now: invitations, status changes, decisions
+TRANSACTIONAL_EVENTS = {
+    "submission_submitted",
+    "status_changed",
+    "reviewer_invited",
+    "revision_requested",
+    "submission_accepted",
+    "submission_rejected",
+    "submission_published",
+}
+BULK_EVENTS = {"review_reminder", "digest"}
+
+TASK_QUEUES = {
+    "notifications.tasks.flush_status_change": QUEUE_TRANSACTIONAL,
+    "notifications.tasks.send_review_reminder": QUEUE_BULK,
+    "notifications.tasks.send_notification_digests": QUEUE_BULK,
+    "notifications.tasks.archive_old_notifications": QUEUE_BULK,
+    "audit.tasks.write_audit_entries": QUEUE_BULK,
+    "audit.tasks.archive_old_audit_logs": QUEUE_BULK,
+    "accounts.tasks.compact_tokens": QUEUE_BULK,
+    "integrations.tasks.collect_orphaned_files": QUEUE_BULK,
+    "integrations.tasks.sync_orcid_records": QUEUE_BULK,
+}
+
 app = Celery("ejournal")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
+def route_task(name, args, kwargs, options, task=None, **kw):
+    """
+    Route transactional emails to the high-priority queue and reminders/digests to
+    the bulk queue so a large sweep cannot delay an invitation.
+    send_notification_email is routed by its event_type; an explicit queue= wins.
+    """
+    if name == "notifications.tasks.send_notification_email":
+        event_type = (kwargs or {}).get("event_type") or (args[0] if args else None)
+        if event_type in TRANSACTIONAL_EVENTS:
+            return {"queue": QUEUE_TRANSACTIONAL}
+        if event_type in BULK_EVENTS:
+            return {"queue": QUEUE_BULK}
+        return None
+    queue = TASK_QUEUES.get(name)
+    return {"queue": queue} if queue else None
+
+
 @app.task(bind=True)
 def debug_task(self):
     """Debug task for testing Celery setup."""
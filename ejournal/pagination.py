@@ -0,0 +1,15 @@
+"""Shared DRF pagination classes."""
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination: each page is an indexed range scan from the
+    previous position instead of an OFFSET, so deep pages cost the same as the first.
+    Subclasses set ordering to match a composite index.
+    """
+
+    page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 200
+    ordering = "-created_at"
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party
     "rest_framework",
     "rest_framework_simplejwt",
@@ -46,9 +47,12 @@ INSTALLED_APPS = [
     "editorial",
     "notifications",
     "audit",
+    "monitoring",
 ]
 
 MIDDLEWARE = [
+    "monitoring.middleware.MetricsMiddleware",
+    "monitoring.profiling.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -57,6 +61,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "audit.middleware.AuditBufferMiddleware",
 ]
 
 ROOT_URLCONF = "ejournal.urls"
@@ -87,6 +92,42 @@ DATABASES = {
     )
 }
 
+# Cache (Redis): shared state across web and Celery workers, e.g. the email circuit breaker
+CACHES = {
+    "default": env.cache("CACHE_URL", default="redis://localhost:6379/1"),
+}
+
+# Reference data (ejournal.cache): per-process LRU in front of the shared cache, invalidated by model signals
+REFERENCE_CACHE_SECONDS = env.int("REFERENCE_CACHE_SECONDS", default=24 * 3600)
+# How long a worker trusts its local copy before re-checking the shared version
+REFERENCE_CACHE_LOCAL_SECONDS = env.float("REFERENCE_CACHE_LOCAL_SECONDS", default=5)
+REFERENCE_CACHE_LOCAL_MAX_ENTRIES = env.int("REFERENCE_CACHE_LOCAL_MAX_ENTRIES", default=256)
+# Cache-Control max-age sent to clients for reference endpoints (topic areas)
+REFERENCE_CACHE_MAX_AGE = env.int("REFERENCE_CACHE_MAX_AGE", default=300)
+
+# Prometheus metrics (GET /metrics); gunicorn.conf.py sets METRICS_DIR so all workers' values are summed
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+METRICS_DIR = env.str("METRICS_DIR", default="")
+# How often a process writes its values to METRICS_DIR
+METRICS_FLUSH_SECONDS = env.float("METRICS_FLUSH_SECONDS", default=1.0)
+# Scrapes must send Authorization: Bearer <token>; required in production, without it /metrics answers 403
+METRICS_TOKEN = env.str("METRICS_TOKEN", default="")
+# Serve /metrics to anyone when METRICS_TOKEN is empty (local development only)
+METRICS_ALLOW_ANONYMOUS = env.bool("METRICS_ALLOW_ANONYMOUS", default=False)
+METRICS_CELERY_TASKS = env.list(
+    "METRICS_CELERY_TASKS",
+    default=["notifications.tasks.send_notification_email", "notifications.tasks.send_review_reminder"],
+)
+
+# On-demand profiling (monitoring.profiling): admin tokens, or this fraction of all requests (0 = tokens only)
+PROFILING_ENABLED = env.bool("PROFILING_ENABLED", default=True)
+PROFILING_SAMPLE_RATE = env.float("PROFILING_SAMPLE_RATE", default=0.0)
+PROFILING_TOKEN_MAX_AGE = env.int("PROFILING_TOKEN_MAX_AGE", default=600)
+PROFILING_DIR = env("PROFILING_DIR", default=str(BASE_DIR / "profiles"))
+PROFILING_MAX_ARTIFACTS = env.int("PROFILING_MAX_ARTIFACTS", default=200)
+# Slowest statements per profile that are stored with their EXPLAIN plan
+PROFILING_EXPLAIN_TOP = env.int("PROFILING_EXPLAIN_TOP", default=5)
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -115,13 +156,50 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "media/"
 MEDIA_ROOT = env("MEDIA_ROOT", default=str(BASE_DIR / "media"))
 
+# Archives of rows removed by retention jobs (compressed NDJSON)
+ARCHIVE_ROOT = env("ARCHIVE_ROOT", default=str(BASE_DIR / "archive"))
+ARCHIVE_CHUNK_SIZE = env.int("ARCHIVE_CHUNK_SIZE", default=1000)
+
 # Storage: local FileSystemStorage (on-premise). For S3: pip install django-storages boto3, set USE_S3_STORAGE=True
 USE_S3_STORAGE = env.bool("USE_S3_STORAGE", default=False)
+# S3 / S3-compatible (MinIO, Ceph) bucket; credentials come from the usual AWS_* variables
+AWS_STORAGE_BUCKET_NAME = env("AWS_STORAGE_BUCKET_NAME", default="ejournal")
+AWS_S3_ENDPOINT_URL = env("AWS_S3_ENDPOINT_URL", default="")
+AWS_S3_REGION_NAME = env("AWS_S3_REGION_NAME", default="")
+if USE_S3_STORAGE:
+    STORAGES = {
+        "default": {"BACKEND": "storages.backends.s3.S3Storage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+
+# Direct uploads (integrations.storage): presigned PUT URLs, multipart above the threshold
+UPLOAD_PRESIGN_EXPIRES_SECONDS = env.int("UPLOAD_PRESIGN_EXPIRES_SECONDS", default=900)
+UPLOAD_MULTIPART_THRESHOLD_MB = env.int("UPLOAD_MULTIPART_THRESHOLD_MB", default=64)
+UPLOAD_PART_SIZE_MB = env.int("UPLOAD_PART_SIZE_MB", default=16)  # S3 minimum is 5
+UPLOAD_MAX_SIZE_MB = {
+    "manuscript": env.int("UPLOAD_MAX_MANUSCRIPT_MB", default=50),
+    "supplementary": env.int("UPLOAD_MAX_SUPPLEMENTARY_MB", default=200),
+    "other": env.int("UPLOAD_MAX_OTHER_MB", default=20),
+}
+# Orphaned file GC (integrations.orphans): unreferenced files older than the grace period are deleted daily
+STORAGE_GC_GRACE_HOURS = env.int("STORAGE_GC_GRACE_HOURS", default=24)
+STORAGE_GC_BATCH_SIZE = env.int("STORAGE_GC_BATCH_SIZE", default=500)
+# Pause the walk this long every N entries so it does not saturate disk I/O
+STORAGE_GC_THROTTLE_EVERY = env.int("STORAGE_GC_THROTTLE_EVERY", default=1000)
+STORAGE_GC_THROTTLE_SECONDS = env.float("STORAGE_GC_THROTTLE_SECONDS", default=0.05)
+
+# ORCID public API sync (integrations.orcid): hourly batches of records older than the max age
+ORCID_API_URL = env("ORCID_API_URL", default="https://pub.orcid.org/v3.0")
+ORCID_SYNC_MAX_AGE_HOURS = env.int("ORCID_SYNC_MAX_AGE_HOURS", default=24 * 7)
+ORCID_SYNC_BATCH_SIZE = env.int("ORCID_SYNC_BATCH_SIZE", default=500)
+# Parallel fetches, each on its own keep-alive connection; ORCID allows 24 req/s on the public API
+ORCID_SYNC_CONCURRENCY = env.int("ORCID_SYNC_CONCURRENCY", default=4)
+ORCID_SYNC_TIMEOUT_SECONDS = env.int("ORCID_SYNC_TIMEOUT_SECONDS", default=10)
 
 # Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -146,7 +224,12 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "accounts.jwt_serializers.CachedBlacklistTokenRefreshSerializer",
 }
+# Seconds the authenticated principal (roles, approval statuses) is cached per user; 0 disables
+AUTH_PRINCIPAL_CACHE_SECONDS = env.int("AUTH_PRINCIPAL_CACHE_SECONDS", default=60)
+# Blacklist checks trust the cache for this long after each compaction run; keep it above the schedule interval
+TOKEN_BLACKLIST_WARM_SECONDS = env.int("TOKEN_BLACKLIST_WARM_SECONDS", default=2 * 3600)
 
 # Celery
 CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="redis://localhost:6379/0")
@@ -157,6 +240,68 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 
+from kombu import Queue
+
+# Transactional emails and bulk sends (reminders, digests) use separate queues;
+# see ejournal.celery.route_task. Workers started without -Q consume all of them.
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+CELERY_TASK_QUEUES = (
+    Queue("celery"),
+    Queue("notifications-high"),
+    Queue("notifications-bulk"),
+)
+CELERY_TASK_ROUTES = ("ejournal.celery.route_task",)
+CELERY_WORKER_PREFETCH_MULTIPLIER = env.int("CELERY_WORKER_PREFETCH_MULTIPLIER", default=4)
+
+from celery.schedules import crontab
+
+CELERY_BEAT_SCHEDULE = {
+    "notification-digests-hourly": {
+        "task": "notifications.tasks.send_notification_digests",
+        "schedule": crontab(minute=0),
+        "args": ("hourly",),
+    },
+    "notification-digests-daily": {
+        "task": "notifications.tasks.send_notification_digests",
+        "schedule": crontab(minute=0, hour=7),
+        "args": ("daily",),
+    },
+    "notification-archive": {
+        "task": "notifications.tasks.archive_old_notifications",
+        "schedule": crontab(minute=30, hour=3),
+    },
+    "audit-archive": {
+        "task": "audit.tasks.archive_old_audit_logs",
+        "schedule": crontab(minute=0, hour=4),
+    },
+    "token-compaction": {
+        "task": "accounts.tasks.compact_tokens",
+        "schedule": crontab(minute=15),
+    },
+    "orphaned-files": {
+        "task": "integrations.tasks.collect_orphaned_files",
+        "schedule": crontab(minute=0, hour=5),
+    },
+    "orcid-sync": {
+        "task": "integrations.tasks.sync_orcid_records",
+        "schedule": crontab(minute=45),
+    },
+}
+
 # Email (for notifications)
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="noreply@ejournal.local")
 EMAIL_USE_PROVIDER = env.bool("EMAIL_USE_PROVIDER", default=False)
+NOTIFICATION_DIGEST_CHUNK_SIZE = env.int("NOTIFICATION_DIGEST_CHUNK_SIZE", default=500)
+NOTIFICATION_RETENTION_DAYS = env.int("NOTIFICATION_RETENTION_DAYS", default=180)
+# Hold status_changed emails per (recipient, submission) and send only the final state; 0 disables
+NOTIFICATION_STATUS_COALESCE_SECONDS = env.int("NOTIFICATION_STATUS_COALESCE_SECONDS", default=60)
+# Shared circuit breaker: this many transient send failures within the window pause all sends for the cooldown
+EMAIL_CIRCUIT_FAILURE_THRESHOLD = env.int("EMAIL_CIRCUIT_FAILURE_THRESHOLD", default=10)
+EMAIL_CIRCUIT_WINDOW_SECONDS = env.int("EMAIL_CIRCUIT_WINDOW_SECONDS", default=60)
+EMAIL_CIRCUIT_COOLDOWN_SECONDS = env.int("EMAIL_CIRCUIT_COOLDOWN_SECONDS", default=120)
+
+# Audit: action types written through a Celery task instead of in the request (comma-separated)
+AUDIT_ASYNC_ACTIONS = env.list("AUDIT_ASYNC_ACTIONS", default=[])
+# Audit rows older than this move to ARCHIVE_ROOT/audit segments ("gzip", or "zstd" with pip install zstandard)
+AUDIT_RETENTION_DAYS = env.int("AUDIT_RETENTION_DAYS", default=730)
+AUDIT_ARCHIVE_CODEC = env.str("AUDIT_ARCHIVE_CODEC", default="gzip")
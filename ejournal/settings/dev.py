@@ -11,3 +11,6 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 # Optional: disable S3 in dev
 USE_S3_STORAGE = False
+
+# Unauthenticated /metrics while no METRICS_TOKEN is set
+METRICS_ALLOW_ANONYMOUS = env.bool("METRICS_ALLOW_ANONYMOUS", default=True)
@@ -8,4 +8,10 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 CELERY_TASK_ALWAYS_EAGER = True  # Run Celery tasks synchronously in tests
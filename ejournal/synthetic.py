@@ -0,0 +1,338 @@
+"""
+Synthetic data at scale for index, pagination and load testing (seed_db --scale).
+
+generate(scale, seed) creates `scale` authors with one or two submissions each,
+spread over the workflow (drafts through published, desk rejections,
+withdrawals), plus versions, review assignments, reviews, the authors'
+notifications and the audit trail of every transition. About 20 rows per unit
+of scale in total. Reviewers (scale / 5) and editors (scale / 200) are shared.
+
+Rows go in per chunk of authors with bulk_create, one transaction per chunk, so
+memory stays flat. Every account shares one password hash, computed once.
+Each author's rows come from their own random.Random seeded with (seed, author
+number), so a seed produces the same data whatever the chunk size. Timestamps
+span the last three years. Synthetic accounts use the @seed-<seed>.invalid domain.
+"""
+import random
+import string
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+PASSWORD = "seedpass123"
+SPAN_DAYS = 3 * 365
+
+FIRST = ["anna", "boris", "chen", "dilnoza", "elena", "farrukh", "gulnora", "hiroshi", "ivan", "jamshid",
+         "karina", "lucas", "madina", "nodir", "olga", "pedro", "rustam", "sevara", "timur", "umida"]
+LAST = ["abdullaev", "brown", "karimova", "nakamura", "petrov", "rahimov", "smith", "tashkentova",
+        "usmonov", "wang", "yusupova", "zhukov"]
+AFFILIATIONS = ["National University of Uzbekistan", "Tashkent State Technical University",
+                "Samarkand State University", "Inha University in Tashkent", "Westminster International University",
+                "Academy of Sciences", "Bukhara State University", "Ferghana Polytechnic Institute"]
+WORDS = ["adaptive", "graph", "neural", "robust", "federated", "sparse", "causal", "scalable", "learning",
+         "inference", "networks", "retrieval", "segmentation", "verification", "compilers", "privacy",
+         "optimization", "benchmark", "transformers", "agents", "embedded", "distributed", "uzbek", "corpus"]
+
+# Final status -> weight; the path to each status is built by _path()
+STATUS_WEIGHTS = {
+    "draft": 10,
+    "submitted": 8,
+    "screening": 6,
+    "desk_rejected": 8,
+    "under_review": 15,
+    "decision_pending": 6,
+    "revision_required": 6,
+    "resubmitted": 4,
+    "accepted": 6,
+    "rejected": 14,
+    "published": 12,
+    "withdrawn": 5,
+}
+REVIEWED = {"under_review", "decision_pending", "revision_required", "resubmitted", "accepted", "rejected", "published"}
+DECISIONS = {"accepted": "accept", "rejected": "reject", "revision_required": "revision_required"}
+AUTHOR_EVENTS = {
+    "submitted": "submission_submitted",
+    "revision_required": "revision_requested",
+    "accepted": "submission_accepted",
+    "rejected": "submission_rejected",
+    "published": "submission_published",
+}
+
+
+def _path(status: str, rng: random.Random) -> list[str]:
+    """Statuses a submission went through to reach status (after draft)."""
+    review = ["submitted", "screening", "under_review", "decision_pending"]
+    paths = {
+        "draft": [],
+        "submitted": ["submitted"],
+        "screening": ["submitted", "screening"],
+        "desk_rejected": ["submitted", "screening", "desk_rejected"],
+        "under_review": review[:3],
+        "decision_pending": review,
+        "revision_required": [*review, "revision_required"],
+        "resubmitted": [*review, "revision_required", "resubmitted"],
+        "accepted": [*review, "accepted"],
+        "rejected": [*review, "rejected"],
+        "published": [*review, "accepted", "published"],
+    }
+    if status == "withdrawn":
+        return [*review[: rng.randint(1, 3)], "withdrawn"]
+    return paths[status]
+
+
+@contextmanager
+def historical_timestamps(*models):
+    """Let bulk_create keep the given created_at/updated_at values (auto_now/auto_now_add off)."""
+    fields = [f for m in models for f in m._meta.concrete_fields if getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False)]
+    saved = [(f, f.auto_now, f.auto_now_add) for f in fields]
+    for f in fields:
+        f.auto_now = f.auto_now_add = False
+    try:
+        yield
+    finally:
+        for f, auto_now, auto_now_add in saved:
+            f.auto_now, f.auto_now_add = auto_now, auto_now_add
+
+
+class Generator:
+    """Builds and inserts the rows of one generate() run."""
+
+    def __init__(self, scale: int, seed: int, chunk_size: int, stdout=None):
+        self.scale = scale
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.stdout = stdout
+        self.rng = random.Random(seed)
+        self.domain = f"seed-{seed}.invalid"
+        self.password = make_password(PASSWORD)
+        self.now = timezone.now().replace(microsecond=0)
+        self.start = self.now - timedelta(days=SPAN_DAYS)
+        self.counts = {}
+        self.statuses = list(STATUS_WEIGHTS)
+        self.weights = list(STATUS_WEIGHTS.values())
+
+    def _count(self, name, n):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def _user(self, rng, i, kind, **fields):
+        from accounts.models import User
+
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        return User(
+            email=f"{first}.{last}.{kind}{i}@{self.domain}",
+            full_name=f"{first.title()} {last.title()}",
+            affiliation=rng.choice(AFFILIATIONS),
+            password=self.password,
+            is_email_verified=True,
+            date_joined=self.start + timedelta(seconds=rng.randrange(SPAN_DAYS * 86400)),
+            **fields,
+        )
+
+    def _insert(self, model, objs):
+        model.objects.bulk_create(objs, batch_size=self.chunk_size)
+        self._count(model._meta.label, len(objs))
+        return objs
+
+    @staticmethod
+    def _title(rng):
+        return " ".join(rng.sample(WORDS, rng.randint(4, 8))).capitalize()
+
+    def staff(self):
+        """Editors and the reviewer pool (a few reviewers still pending approval)."""
+        from accounts.models import APPROVAL_APPROVED, APPROVAL_PENDING, User
+
+        editors = [
+            self._user(self.rng, i, "editor", roles=["editor"], editor_status=APPROVAL_APPROVED)
+            for i in range(max(2, self.scale // 200))
+        ]
+        reviewers = [
+            self._user(
+                self.rng,
+                i,
+                "reviewer",
+                roles=["author", "reviewer"],
+                reviewer_status=APPROVAL_PENDING if self.rng.random() < 0.1 else APPROVAL_APPROVED,
+                why_to_be="Experienced reviewer",
+            )
+            for i in range(max(3, self.scale // 5))
+        ]
+        with transaction.atomic():
+            self._insert(User, editors + reviewers)
+        self.editor_ids = [u.pk for u in editors]
+        self.reviewers = [(u.pk, u.email) for u in reviewers if u.reviewer_status == APPROVAL_APPROVED]
+
+    def chunk(self, first: int, count: int, topic_ids):
+        """Authors first..first+count with their submissions and everything hanging off them."""
+        from accounts.models import User
+        from audit.models import AuditLog
+        from notifications.models import Notification
+        from reviews.models import Review, ReviewAssignment
+        from submissions.models import Submission, SubmissionVersion
+
+        authors = []
+        # Per submission: (submission, path, step timestamps, the author's rng)
+        plans = []
+        for i in range(first, first + count):
+            rng = random.Random(f"{self.seed}:{i}")
+            author = self._user(rng, i, "author", roles=["author"])
+            authors.append(author)
+            for _ in range(1 if rng.random() < 0.6 else 2):
+                status = rng.choices(self.statuses, self.weights)[0]
+                created = max(author.date_joined, self.start) + timedelta(hours=rng.randint(1, 24 * 60))
+                created = min(created, self.now - timedelta(days=1))
+                path = _path(status, rng)
+                stamps, t = [], created
+                for _ in path:
+                    t = min(t + timedelta(hours=rng.randint(2, 24 * 20)), self.now)
+                    stamps.append(t)
+                complete = bool(path) or rng.random() < 0.4
+                sub = Submission(
+                    author=author,
+                    status=status,
+                    title=self._title(rng) if complete or rng.random() < 0.7 else "",
+                    abstract=" ".join(rng.choices(WORDS, k=rng.randint(60, 160))) if complete else "",
+                    keywords=rng.sample(WORDS, rng.randint(3, 6)) if complete else [],
+                    topic_area_id=rng.choice(topic_ids) if complete else None,
+                    originality_confirmation=complete,
+                    plagiarism_agreement=complete,
+                    ethics_compliance=complete,
+                    copyright_agreement=complete,
+                    manuscript_pdf=f"submissions/synthetic/{self.seed}-{i}-{len(plans)}.pdf" if complete else None,
+                    desk_reject_reason="Out of scope for the journal." if status == "desk_rejected" else "",
+                    editorial_decision=next((DECISIONS[s] for s in reversed(path) if s in DECISIONS), ""),
+                    decision_letter="Thank you for your submission." if any(s in DECISIONS for s in path) else "",
+                    created_at=created,
+                    updated_at=stamps[-1] if stamps else created,
+                )
+                plans.append((sub, path, stamps, rng))
+
+        with transaction.atomic():
+            self._insert(User, authors)
+            for sub, *_ in plans:
+                sub.author_id = sub.author.pk
+            self._insert(Submission, [p[0] for p in plans])
+
+            versions = []
+            for sub, path, stamps, _ in plans:
+                if not path:
+                    continue
+                versions.append(SubmissionVersion(submission=sub, version_number=1, manuscript_pdf=sub.manuscript_pdf.name, created_at=stamps[0]))
+                if "resubmitted" in path:
+                    at = stamps[path.index("resubmitted")]
+                    versions.append(SubmissionVersion(submission=sub, version_number=2, manuscript_pdf=sub.manuscript_pdf.name, created_at=at))
+            self._insert(SubmissionVersion, versions)
+            latest = {}
+            for v in versions:
+                latest[v.submission_id] = v
+
+            assignments, reviews, notifications, audit = [], [], [], []
+            for sub, path, stamps, rng in plans:
+                old = "draft"
+                for status, at in zip(path, stamps):
+                    event = AUTHOR_EVENTS.get(status, "status_changed")
+                    read = rng.random() < 0.7
+                    notifications.append(
+                        Notification(
+                            user_id=sub.author_id,
+                            event_type=event,
+                            payload={"submission_id": sub.pk, "old_status": old, "new_status": status, "submission_title": sub.title},
+                            submission_id=sub.pk,
+                            status="sent",
+                            sent_at=at,
+                            idempotency_key=f"status_{sub.pk}_{old}_{status}",
+                            created_at=at,
+                            read_at=min(at + timedelta(hours=rng.randint(1, 72)), self.now) if read else None,
+                        )
+                    )
+                    by_author = status in ("submitted", "resubmitted", "withdrawn")
+                    audit.append(
+                        AuditLog(
+                            actor_user_id=sub.author_id if by_author else rng.choice(self.editor_ids),
+                            action_type="submission_submitted" if status == "submitted" else "decision" if status in DECISIONS else "publish" if status == "published" else "status_transition",
+                            target_type="submission",
+                            target_id=sub.pk,
+                            old_value={"status": old},
+                            new_value={"status": status},
+                            created_at=at,
+                        )
+                    )
+                    old = status
+
+                if sub.status not in REVIEWED and not (sub.status == "withdrawn" and "under_review" in path):
+                    continue
+                version = latest[sub.pk]
+                invited_at = stamps[path.index("under_review")]
+                finished = sub.status not in ("under_review",)
+                for reviewer_id, email in rng.sample(self.reviewers, min(len(self.reviewers), rng.randint(2, 3))):
+                    if finished:
+                        status = rng.choices(["review_submitted", "declined", "expired"], [8, 1, 1])[0]
+                    else:
+                        status = rng.choices(["invited", "accepted", "review_submitted", "declined"], [3, 4, 2, 1])[0]
+                    responded = invited_at + timedelta(hours=rng.randint(2, 96)) if status != "invited" else None
+                    assignment = ReviewAssignment(
+                        submission=sub,
+                        submission_version=version,
+                        reviewer_id=reviewer_id,
+                        invited_email=email,
+                        token="".join(rng.choices(string.ascii_letters + string.digits, k=43)),
+                        status=status,
+                        due_date=(invited_at + timedelta(days=21)).date(),
+                        invited_at=invited_at,
+                        responded_at=responded,
+                    )
+                    assignments.append(assignment)
+                    audit.append(
+                        AuditLog(
+                            actor_user_id=rng.choice(self.editor_ids),
+                            action_type="reviewer_invited",
+                            target_type="review_assignment",
+                            target_id=0,  # set once the assignment has its id
+                            new_value={"submission_id": sub.pk, "invited_email": email},
+                            created_at=invited_at,
+                        )
+                    )
+            self._insert(ReviewAssignment, assignments)
+
+            invited_audit = iter(a for a in audit if a.action_type == "reviewer_invited")
+            for assignment in assignments:
+                next(invited_audit).target_id = assignment.pk
+                if assignment.status == "review_submitted":
+                    reviews.append(
+                        Review(
+                            assignment=assignment,
+                            summary=" ".join(rng.choices(WORDS, k=rng.randint(20, 60))),
+                            strengths=" ".join(rng.choices(WORDS, k=12)),
+                            weaknesses=" ".join(rng.choices(WORDS, k=12)),
+                            recommendation=rng.choice(["accept", "minor_revision", "major_revision", "reject"]),
+                            submitted_at=assignment.responded_at + timedelta(days=rng.randint(1, 20)),
+                        )
+                    )
+            self._insert(Review, reviews)
+            self._insert(Notification, notifications)
+            self._insert(AuditLog, audit)
+
+    def run(self):
+        from accounts.models import User
+        from notifications.models import Notification
+        from reviews.models import Review, ReviewAssignment
+        from submissions.models import Submission, SubmissionVersion, TopicArea
+
+        topic_ids = list(TopicArea.objects.order_by("id").values_list("id", flat=True))
+        with historical_timestamps(User, Submission, SubmissionVersion, ReviewAssignment, Review, Notification):
+            self.staff()
+            for first in range(0, self.scale, self.chunk_size):
+                self.chunk(first, min(self.chunk_size, self.scale - first), topic_ids)
+                if self.stdout is not None:
+                    done = min(first + self.chunk_size, self.scale)
+                    self.stdout.write(f"  {done:,}/{self.scale:,} authors, {sum(self.counts.values()):,} rows")
+        return self.counts
+
+
+def generate(scale: int, seed: int = 1, chunk_size: int = 2000, stdout=None) -> dict:
+    """Insert the synthetic dataset; returns rows created per model label."""
+    if not connection.features.can_return_rows_from_bulk_insert:
+        raise RuntimeError("Synthetic data needs bulk_create to return ids (PostgreSQL, or SQLite 3.35+).")
+    return Generator(scale, seed, chunk_size, stdout).run()
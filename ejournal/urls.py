@@ -4,7 +4,10 @@ URL configuration for ejournal project.
 from django.contrib import admin
 from django.urls import path, include
 
+from monitoring.views import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("ejournal.api_urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration: gunicorn -c gunicorn.conf.py ejournal.wsgi:application
+
+Workers write their metrics to METRICS_DIR (see monitoring.metrics) so /metrics
+reports the sum over all of them whichever worker serves the scrape.
+"""
+import os
+import shutil
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "3"))
+threads = int(os.environ.get("GUNICORN_THREADS", "1"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+
+os.environ.setdefault("METRICS_DIR", "/tmp/ejournal-metrics")
+
+
+def on_starting(server):
+    # Start from zero: files of the previous run's workers would otherwise be counted forever
+    metrics_dir = os.environ["METRICS_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def worker_exit(server, worker):
+    from monitoring import metrics
+
+    metrics.flush(force=True)
@@ -0,0 +1,39 @@
+"""Delete stored files that no submission, supplementary file or version references."""
+from django.core.management.base import BaseCommand
+
+from integrations.orphans import collect_orphans
+
+
+class Command(BaseCommand):
+    help = "Walk MEDIA_ROOT and delete unreferenced files older than the grace period"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--grace-hours", type=int, help="Minimum file age (default STORAGE_GC_GRACE_HOURS)")
+        parser.add_argument("--batch-size", type=int, help="Keys checked per query (default STORAGE_GC_BATCH_SIZE)")
+        parser.add_argument("--throttle-every", type=int, help="Entries between pauses (default STORAGE_GC_THROTTLE_EVERY)")
+        parser.add_argument("--throttle-seconds", type=float, help="Pause length (default STORAGE_GC_THROTTLE_SECONDS)")
+        parser.add_argument("--dry-run", action="store_true", help="List orphans without deleting them")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        def report(key, size):
+            if dry_run or options["verbosity"] > 1:
+                self.stdout.write(f"  {key} ({size} bytes)")
+
+        result = collect_orphans(
+            grace_hours=options["grace_hours"],
+            batch_size=options["batch_size"],
+            dry_run=dry_run,
+            throttle_every=options["throttle_every"],
+            throttle_seconds=options["throttle_seconds"],
+            report=report,
+        )
+        verb = "would delete" if dry_run else "deleted"
+        count = result["orphaned"] if dry_run else result["deleted"]
+        self.stdout.write(
+            f"  scanned {result['scanned']} files, {verb} {count} orphans ({result['bytes']} bytes), "
+            f"{result['multipart_expired']} stale multipart uploads"
+        )
+        if not dry_run:
+            self.stdout.write(self.style.SUCCESS("Orphan collection finished"))
@@ -0,0 +1,80 @@
+"""Cached public ORCID records, affiliations and works."""
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrcidRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('orcid_id', models.CharField(max_length=19)),
+                ('given_names', models.CharField(blank=True, max_length=255)),
+                ('family_name', models.CharField(blank=True, max_length=255)),
+                ('credit_name', models.CharField(blank=True, max_length=255)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=64)),
+                ('status', models.CharField(choices=[('ok', 'OK'), ('not_found', 'Not found'), ('error', 'Error')], default='ok', max_length=20)),
+                ('error', models.TextField(blank=True)),
+                ('fetched_at', models.DateTimeField(blank=True, null=True)),
+                ('changed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='orcid_record', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'integrations_orcid_record',
+            },
+        ),
+        migrations.CreateModel(
+            name='OrcidAffiliation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('employment', 'Employment'), ('education', 'Education')], max_length=20)),
+                ('organization', models.CharField(max_length=500)),
+                ('department', models.CharField(blank=True, max_length=500)),
+                ('role', models.CharField(blank=True, max_length=500)),
+                ('start_year', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('end_year', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('record', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='affiliations', to='integrations.orcidrecord')),
+            ],
+            options={
+                'db_table': 'integrations_orcid_affiliation',
+            },
+        ),
+        migrations.CreateModel(
+            name='OrcidWork',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('put_code', models.BigIntegerField()),
+                ('title', models.TextField(blank=True)),
+                ('work_type', models.CharField(blank=True, max_length=50)),
+                ('journal', models.CharField(blank=True, max_length=500)),
+                ('year', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('doi', models.CharField(blank=True, max_length=255)),
+                ('record', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='works', to='integrations.orcidrecord')),
+            ],
+            options={
+                'db_table': 'integrations_orcid_work',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='orcidrecord',
+            index=models.Index(fields=['fetched_at'], name='integrations_orcid_fetch_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orcidwork',
+            index=models.Index(fields=['doi', 'record'], name='integrations_orcid_doi_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='orcidwork',
+            unique_together={('record', 'put_code')},
+        ),
+    ]
@@ -0,0 +1,77 @@
+"""Integration models: cached public ORCID records."""
+from django.conf import settings
+from django.db import models
+
+SYNC_OK = "ok"
+SYNC_NOT_FOUND = "not_found"
+SYNC_ERROR = "error"
+SYNC_STATUS_CHOICES = [
+    (SYNC_OK, "OK"),
+    (SYNC_NOT_FOUND, "Not found"),
+    (SYNC_ERROR, "Error"),
+]
+
+AFFILIATION_EMPLOYMENT = "employment"
+AFFILIATION_EDUCATION = "education"
+AFFILIATION_KIND_CHOICES = [
+    (AFFILIATION_EMPLOYMENT, "Employment"),
+    (AFFILIATION_EDUCATION, "Education"),
+]
+
+
+class OrcidRecord(models.Model):
+    """Last fetched public ORCID record of a user, with the validators for conditional requests."""
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="orcid_record")
+    orcid_id = models.CharField(max_length=19)
+    given_names = models.CharField(max_length=255, blank=True)
+    family_name = models.CharField(max_length=255, blank=True)
+    credit_name = models.CharField(max_length=255, blank=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)  # HTTP date, sent back verbatim
+    status = models.CharField(max_length=20, choices=SYNC_STATUS_CHOICES, default=SYNC_OK)
+    error = models.TextField(blank=True)
+    fetched_at = models.DateTimeField(null=True, blank=True)  # last request, 304s included
+    changed_at = models.DateTimeField(null=True, blank=True)  # last time the content was replaced
+
+    class Meta:
+        db_table = "integrations_orcid_record"
+        indexes = [models.Index(fields=["fetched_at"], name="integrations_orcid_fetch_idx")]
+
+    def __str__(self):
+        return self.orcid_id
+
+
+class OrcidAffiliation(models.Model):
+    """Employment or education entry from an ORCID record."""
+
+    record = models.ForeignKey(OrcidRecord, on_delete=models.CASCADE, related_name="affiliations")
+    kind = models.CharField(max_length=20, choices=AFFILIATION_KIND_CHOICES)
+    organization = models.CharField(max_length=500)
+    department = models.CharField(max_length=500, blank=True)
+    role = models.CharField(max_length=500, blank=True)
+    start_year = models.PositiveSmallIntegerField(null=True, blank=True)
+    end_year = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    class Meta:
+        db_table = "integrations_orcid_affiliation"
+
+
+class OrcidWork(models.Model):
+    """Work summary from an ORCID record; doi is normalized (lowercase, no resolver prefix)."""
+
+    record = models.ForeignKey(OrcidRecord, on_delete=models.CASCADE, related_name="works")
+    put_code = models.BigIntegerField()
+    title = models.TextField(blank=True)
+    work_type = models.CharField(max_length=50, blank=True)
+    journal = models.CharField(max_length=500, blank=True)
+    year = models.PositiveSmallIntegerField(null=True, blank=True)
+    doi = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = "integrations_orcid_work"
+        unique_together = [("record", "put_code")]
+        indexes = [
+            # Co-authorship (shared DOI) lookups for reviewer conflict checks
+            models.Index(fields=["doi", "record"], name="integrations_orcid_doi_idx"),
+        ]
@@ -0,0 +1,301 @@
+"""
+ORCID public record sync.
+
+sync_orcid_records() refreshes the local copy (OrcidRecord, OrcidAffiliation,
+OrcidWork) of users' public ORCID records. Fetches run on a thread pool of
+ORCID_SYNC_CONCURRENCY workers sharing one OrcidClient, which keeps one
+keep-alive connection per worker instead of a TLS handshake per record. Every
+request sends the stored ETag / Last-Modified back, so unchanged records cost a
+304 and no writes. Database writes stay on the calling thread.
+
+Request paths never call ORCID: reviewer matching and conflict checks read the
+cached works (shared_work_counts()).
+"""
+import http.client
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import (
+    AFFILIATION_EDUCATION,
+    AFFILIATION_EMPLOYMENT,
+    SYNC_ERROR,
+    SYNC_NOT_FOUND,
+    SYNC_OK,
+    OrcidAffiliation,
+    OrcidRecord,
+    OrcidWork,
+)
+
+logger = logging.getLogger(__name__)
+
+ORCID_ID_RE = re.compile(r"(\d{4}-\d{4}-\d{4}-\d{3}[\dX])$")
+DOI_PREFIX_RE = re.compile(r"^(https?://(dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+
+
+class OrcidError(Exception):
+    """The ORCID API could not be reached."""
+
+
+def normalize_orcid_id(value: str) -> str | None:
+    """Bare ORCID iD (0000-0002-1825-0097) from an iD or orcid.org URL, or None if the checksum fails."""
+    match = ORCID_ID_RE.search((value or "").strip().upper())
+    if not match:
+        return None
+    orcid_id = match.group(1)
+    digits = orcid_id.replace("-", "")
+    total = 0
+    for ch in digits[:-1]:
+        total = (total + int(ch)) * 2
+    check = (12 - total % 11) % 11
+    return orcid_id if digits[-1] == ("X" if check == 10 else str(check)) else None
+
+
+def normalize_doi(value: str) -> str:
+    return DOI_PREFIX_RE.sub("", (value or "").strip()).lower()
+
+
+@dataclass
+class OrcidResponse:
+    status: int
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+
+
+class OrcidClient:
+    """GETs against the ORCID public API over keep-alive connections, one per calling thread."""
+
+    def __init__(self, base_url: str | None = None, timeout: float | None = None):
+        url = urlsplit(base_url or settings.ORCID_API_URL)
+        self.https = url.scheme == "https"
+        self.host = url.hostname
+        self.port = url.port
+        self.path = url.path.rstrip("/")
+        self.timeout = timeout or settings.ORCID_SYNC_TIMEOUT_SECONDS
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = cls(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def fetch_record(self, orcid_id: str, etag: str = "", last_modified: str = "") -> OrcidResponse:
+        headers = {"Accept": "application/json", "User-Agent": "ejournal-orcid-sync"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request("GET", f"{self.path}/{orcid_id}/record", headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                # The server closed an idle keep-alive connection; reconnect once
+                conn.close()
+                if attempt:
+                    raise OrcidError(str(e)) from e
+                continue
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise OrcidError(str(e)) from e
+            return OrcidResponse(resp.status, body, resp.getheader("ETag", ""), resp.getheader("Last-Modified", ""))
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+def _value(data, *path):
+    """data[path[0]][path[1]]... with None for any missing or null step."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _year(date):
+    year = _value(date, "year", "value")
+    return int(year) if year and str(year).isdigit() else None
+
+
+def _affiliations(record, kind):
+    section = "employments" if kind == AFFILIATION_EMPLOYMENT else "educations"
+    for group in _value(record, "activities-summary", section, "affiliation-group") or []:
+        for summary in group.get("summaries") or []:
+            item = summary.get(f"{kind}-summary") or {}
+            name = _value(item, "organization", "name")
+            if name:
+                yield OrcidAffiliation(
+                    kind=kind,
+                    organization=name[:500],
+                    department=(item.get("department-name") or "")[:500],
+                    role=(item.get("role-title") or "")[:500],
+                    start_year=_year(item.get("start-date")),
+                    end_year=_year(item.get("end-date")),
+                )
+
+
+def _works(record):
+    for group in _value(record, "activities-summary", "works", "group") or []:
+        summaries = group.get("work-summary") or []
+        if not summaries:
+            continue
+        item = summaries[0]  # ORCID lists the preferred source first
+        ids = (_value(item, "external-ids", "external-id") or []) + (_value(group, "external-ids", "external-id") or [])
+        doi = next((i.get("external-id-value") for i in ids if i.get("external-id-type") == "doi"), "")
+        yield OrcidWork(
+            put_code=item.get("put-code"),
+            title=_value(item, "title", "title", "value") or "",
+            work_type=(item.get("type") or "")[:50],
+            journal=(_value(item, "journal-title", "value") or "")[:500],
+            year=_year(item.get("publication-date")),
+            doi=normalize_doi(doi)[:255],
+        )
+
+
+def apply_response(record: OrcidRecord, response: OrcidResponse) -> str:
+    """Store one fetch result on record; returns the outcome counted by sync_orcid_records()."""
+    now = timezone.now()
+    record.fetched_at = now
+    if response.status == 304:
+        record.status, record.error = SYNC_OK, ""
+        record.save()
+        return "not_modified"
+    if response.status in (404, 410):
+        record.status, record.error = SYNC_NOT_FOUND, ""
+        record.save()
+        return "not_found"
+    if response.status != 200:
+        record.status, record.error = SYNC_ERROR, f"HTTP {response.status}"
+        record.save()
+        return "failed"
+    try:
+        data = json.loads(response.body)
+    except ValueError:
+        record.status, record.error = SYNC_ERROR, "Invalid JSON"
+        record.save()
+        return "failed"
+
+    record.given_names = (_value(data, "person", "name", "given-names", "value") or "")[:255]
+    record.family_name = (_value(data, "person", "name", "family-name", "value") or "")[:255]
+    record.credit_name = (_value(data, "person", "name", "credit-name", "value") or "")[:255]
+    record.etag, record.last_modified = response.etag[:255], response.last_modified[:64]
+    record.status, record.error, record.changed_at = SYNC_OK, "", now
+    affiliations = [*_affiliations(data, AFFILIATION_EMPLOYMENT), *_affiliations(data, AFFILIATION_EDUCATION)]
+    works = {w.put_code: w for w in _works(data) if w.put_code is not None}
+    with transaction.atomic():
+        record.save()
+        record.affiliations.all().delete()
+        record.works.all().delete()
+        for item in [*affiliations, *works.values()]:
+            item.record = record
+        OrcidAffiliation.objects.bulk_create(affiliations)
+        OrcidWork.objects.bulk_create(works.values())
+    return "fetched"
+
+
+def stale_user_ids(max_age_hours: int | None = None, limit: int | None = None) -> list[int]:
+    """Users with an ORCID iD whose record is missing or older than max_age_hours, least recently fetched first."""
+    from accounts.models import User
+
+    max_age_hours = max_age_hours if max_age_hours is not None else settings.ORCID_SYNC_MAX_AGE_HOURS
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    qs = (
+        User.objects.exclude(orcid_id="")
+        .filter(Q(orcid_record__isnull=True) | Q(orcid_record__fetched_at__isnull=True) | Q(orcid_record__fetched_at__lt=cutoff))
+        .order_by(F("orcid_record__fetched_at").asc(nulls_first=True), "id")
+        .values_list("id", flat=True)
+    )
+    return list(qs[: limit or settings.ORCID_SYNC_BATCH_SIZE])
+
+
+def sync_orcid_records(user_ids=None, concurrency: int | None = None, client: OrcidClient | None = None) -> dict:
+    """
+    Fetch and store the ORCID records of user_ids (default: a batch of stale ones).
+    Returns counts of fetched, not_modified, not_found, failed and invalid (bad iD) records.
+    """
+    from accounts.models import User
+
+    if user_ids is None:
+        user_ids = stale_user_ids()
+    users = dict(User.objects.filter(id__in=user_ids).exclude(orcid_id="").values_list("id", "orcid_id"))
+    records = {r.user_id: r for r in OrcidRecord.objects.filter(user_id__in=users)}
+    result = Counter({"fetched": 0, "not_modified": 0, "not_found": 0, "failed": 0, "invalid": 0})
+
+    jobs = []
+    for user_id, raw_id in users.items():
+        orcid_id = normalize_orcid_id(raw_id)
+        if orcid_id is None:
+            result["invalid"] += 1
+            continue
+        record = records.get(user_id) or OrcidRecord(user_id=user_id, orcid_id=orcid_id)
+        if record.orcid_id != orcid_id:
+            # The user connected a different iD; start over without validators
+            record.orcid_id, record.etag, record.last_modified = orcid_id, "", ""
+        jobs.append(record)
+    if not jobs:
+        return dict(result)
+
+    own_client = client is None
+    client = client or OrcidClient()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency or settings.ORCID_SYNC_CONCURRENCY) as pool:
+            futures = {
+                pool.submit(client.fetch_record, r.orcid_id, r.etag, r.last_modified): r for r in jobs
+            }
+            for future in as_completed(futures):
+                record = futures[future]
+                try:
+                    response = future.result()
+                except OrcidError as e:
+                    logger.warning("ORCID fetch failed for %s: %s", record.orcid_id, e)
+                    response = None
+                if response is None:
+                    record.fetched_at, record.status, record.error = timezone.now(), SYNC_ERROR, "Unreachable"
+                    record.save()
+                    result["failed"] += 1
+                else:
+                    result[apply_response(record, response)] += 1
+    finally:
+        if own_client:
+            client.close()
+    return dict(result)
+
+
+def shared_work_counts(user_id: int, candidate_ids) -> dict[int, int]:
+    """
+    Number of works (by DOI) each candidate shares with user_id in the cached
+    ORCID records: co-authorship, i.e. a likely conflict of interest.
+    """
+    dois = OrcidWork.objects.filter(record__user_id=user_id).exclude(doi="").values("doi")
+    rows = (
+        OrcidWork.objects.filter(doi__in=dois, record__user_id__in=candidate_ids)
+        .exclude(record__user_id=user_id)
+        .values("record__user_id")
+        .annotate(n=Count("doi", distinct=True))
+    )
+    return {row["record__user_id"]: row["n"] for row in rows}
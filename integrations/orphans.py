@@ -0,0 +1,146 @@
+"""
+Garbage collection for stored files that no row references.
+
+collect_orphans() walks the GC prefixes under MEDIA_ROOT with os.scandir (one
+directory open at a time, nothing listed up front), checks the keys in batches
+against the file columns that still point at them (indexed lookups, see
+submissions migration 0003), and deletes unreferenced files whose mtime is
+older than STORAGE_GC_GRACE_HOURS, so uploads still being attached are left
+alone. Files come from deleted drafts, replaced manuscripts and /api/upload-file
+scratch uploads; stale multipart part directories of abandoned direct uploads
+are expired with them. The walk sleeps STORAGE_GC_THROTTLE_SECONDS every
+STORAGE_GC_THROTTLE_EVERY entries to leave disk I/O for requests.
+"""
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import default_storage
+
+GC_PREFIXES = ("submissions", "uploads")
+MULTIPART_DIR = ".multipart"  # LocalPresignBackend part staging
+_SUPPLEMENTARY_KEY = re.compile(r"^submissions/(\d+)/supplementary/")
+
+
+def _walk(root: str):
+    """Yield DirEntry objects for regular files below root, depth first."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+
+def referenced_keys(keys) -> set[str]:
+    """The subset of storage keys that a submission, supplementary file or version still points at."""
+    from submissions.models import Submission, SubmissionSupplementaryFile, SubmissionVersion
+
+    keys = set(keys)
+    refs = set(Submission.objects.filter(manuscript_pdf__in=keys).values_list("manuscript_pdf", flat=True))
+    refs.update(SubmissionSupplementaryFile.objects.filter(file__in=keys).values_list("file", flat=True))
+    refs.update(SubmissionVersion.objects.filter(manuscript_pdf__in=keys).values_list("manuscript_pdf", flat=True))
+
+    # Version snapshots keep supplementary files by URL
+    submission_ids = {int(m.group(1)) for m in map(_SUPPLEMENTARY_KEY.match, keys) if m}
+    if submission_ids:
+        snapshots = SubmissionVersion.objects.filter(submission_id__in=submission_ids).values_list(
+            "supplementary_files_snapshot", flat=True
+        )
+        for snapshot in snapshots:
+            for item in snapshot or []:
+                url = unquote((item or {}).get("url") or "")
+                if url.startswith(settings.MEDIA_URL):
+                    refs.add(url[len(settings.MEDIA_URL) :])
+    return refs & keys
+
+
+def delete_unreferenced(keys) -> int:
+    """Delete the given keys from storage unless a row still references them (e.g. after a draft is deleted)."""
+    keys = {k for k in keys if k}
+    orphans = keys - referenced_keys(keys)
+    for key in orphans:
+        default_storage.delete(key)
+    return len(orphans)
+
+
+def _expire_multipart(root: Path, cutoff: float, dry_run: bool) -> int:
+    expired = 0
+    try:
+        entries = os.scandir(root / MULTIPART_DIR)
+    except FileNotFoundError:
+        return 0
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                expired += 1
+                if not dry_run:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+    return expired
+
+
+def collect_orphans(
+    grace_hours: int | None = None,
+    batch_size: int | None = None,
+    dry_run: bool = False,
+    throttle_every: int | None = None,
+    throttle_seconds: float | None = None,
+    report=None,
+) -> dict:
+    """
+    Delete unreferenced files under GC_PREFIXES older than grace_hours.
+    With dry_run nothing is deleted; report(key, size) is called for every orphan either way.
+    """
+    if settings.USE_S3_STORAGE:
+        raise ImproperlyConfigured("Orphan collection walks MEDIA_ROOT; use bucket lifecycle rules with S3 storage")
+    grace_hours = grace_hours if grace_hours is not None else settings.STORAGE_GC_GRACE_HOURS
+    batch_size = batch_size or settings.STORAGE_GC_BATCH_SIZE
+    throttle_every = throttle_every or settings.STORAGE_GC_THROTTLE_EVERY
+    throttle_seconds = throttle_seconds if throttle_seconds is not None else settings.STORAGE_GC_THROTTLE_SECONDS
+    root = Path(settings.MEDIA_ROOT)
+    cutoff = time.time() - grace_hours * 3600
+    result = {"scanned": 0, "orphaned": 0, "deleted": 0, "bytes": 0, "multipart_expired": 0}
+
+    def sweep(batch):
+        refs = referenced_keys(batch)
+        for key, (path, size) in batch.items():
+            if key in refs:
+                continue
+            result["orphaned"] += 1
+            result["bytes"] += size
+            if report:
+                report(key, size)
+            if not dry_run:
+                try:
+                    os.remove(path)
+                    result["deleted"] += 1
+                except FileNotFoundError:
+                    pass
+
+    batch = {}
+    for prefix in GC_PREFIXES:
+        for entry in _walk(str(root / prefix)):
+            result["scanned"] += 1
+            if result["scanned"] % throttle_every == 0 and throttle_seconds:
+                time.sleep(throttle_seconds)
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime >= cutoff:
+                continue
+            batch[Path(entry.path).relative_to(root).as_posix()] = (entry.path, stat.st_size)
+            if len(batch) >= batch_size:
+                sweep(batch)
+                batch = {}
+    if batch:
+        sweep(batch)
+    result["multipart_expired"] = _expire_multipart(root, cutoff, dry_run)
+    return result
@@ -0,0 +1,56 @@
+"""Integration serializers."""
+from rest_framework import serializers
+
+from .models import OrcidAffiliation, OrcidRecord, OrcidWork
+
+
+class PresignUploadSerializer(serializers.Serializer):
+    """Body of a presign request: what the client is about to upload."""
+
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+    sha256 = serializers.RegexField(r"^[0-9a-fA-F]{64}$")
+    content_type = serializers.CharField(max_length=100, required=False, default="application/octet-stream")
+    part_sha256 = serializers.ListField(
+        child=serializers.RegexField(r"^[0-9a-fA-F]{64}$"), required=False, max_length=10000
+    )
+
+
+class CompleteUploadSerializer(serializers.Serializer):
+    """Body of a complete request: the ticket returned by presign."""
+
+    ticket = serializers.CharField()
+
+
+class OrcidAffiliationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OrcidAffiliation
+        fields = ["kind", "organization", "department", "role", "start_year", "end_year"]
+
+
+class OrcidWorkSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OrcidWork
+        fields = ["put_code", "title", "work_type", "journal", "year", "doi"]
+
+
+class OrcidRecordSerializer(serializers.ModelSerializer):
+    """Cached public ORCID record with its affiliations and works."""
+
+    affiliations = OrcidAffiliationSerializer(many=True, read_only=True)
+    works = OrcidWorkSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = OrcidRecord
+        fields = [
+            "orcid_id",
+            "given_names",
+            "family_name",
+            "credit_name",
+            "status",
+            "fetched_at",
+            "changed_at",
+            "affiliations",
+            "works",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,373 @@
+"""
+Direct-to-storage uploads.
+
+start_upload() checks the declared size and SHA-256, then returns presigned PUT
+URLs (one, or one per part above UPLOAD_MULTIPART_THRESHOLD_MB) plus a signed
+ticket. The client sends the bytes straight to storage and calls finish_upload()
+with the ticket. The stored object's size and checksum are verified before its
+key is handed back for the caller to record; nothing is recorded for objects that
+fail verification (they are deleted). Tickets are single-use: a repeated
+finish_upload() returns the first result without touching the object again.
+
+USE_S3_STORAGE selects S3PresignBackend (boto3, any S3-compatible endpoint). The
+signed Content-Length and x-amz-checksum-sha256 make S3 itself reject a
+mismatching PUT; multipart parts carry their own SHA-256 the same way.
+Otherwise LocalPresignBackend implements the same protocol in Django: signed PUT
+URLs under /api/storage/local/ that stream into MEDIA_ROOT, so the flow works on
+premise, offline and in tests.
+"""
+import base64
+import hashlib
+import math
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django.utils import timezone
+
+MB = 1024 * 1024
+TICKET_SALT = "integrations.storage.upload"
+LOCAL_PUT_SALT = "integrations.storage.local-put"
+CHUNK_SIZE = 64 * 1024
+FINISH_PENDING = "pending"
+FINISH_PENDING_SECONDS = 600
+
+
+class UploadError(Exception):
+    """The upload request or the uploaded object failed validation."""
+
+
+def max_upload_size(file_type: str) -> int:
+    """Size limit in bytes for a file type (manuscript, supplementary, other)."""
+    limits = settings.UPLOAD_MAX_SIZE_MB
+    return limits.get(file_type, limits["other"]) * MB
+
+
+def _b64(hex_digest: str) -> str:
+    return base64.b64encode(bytes.fromhex(hex_digest)).decode()
+
+
+def _is_sha256(value) -> bool:
+    return isinstance(value, str) and len(value) == 64 and all(c in "0123456789abcdef" for c in value.lower())
+
+
+@dataclass
+class PresignedUpload:
+    """What the client needs to send the bytes: a ticket for finish_upload() and PUT targets."""
+
+    key: str
+    ticket: str
+    expires_at: object
+    url: str | None = None  # single PUT
+    headers: dict | None = None
+    part_size: int | None = None  # multipart
+    parts: list | None = None  # [{"part_number", "url", "headers"}]
+
+    def as_dict(self) -> dict:
+        data = {"key": self.key, "ticket": self.ticket, "expires_at": self.expires_at.isoformat(), "method": "PUT"}
+        if self.parts is None:
+            data.update(url=self.url, headers=self.headers)
+        else:
+            data.update(part_size=self.part_size, parts=self.parts)
+        return data
+
+
+class LocalPresignBackend:
+    """Filesystem stand-in: presigned URLs point at LocalUploadView, objects live under MEDIA_ROOT."""
+
+    def _path(self, key: str) -> Path:
+        root = Path(settings.MEDIA_ROOT).resolve()
+        path = (root / key).resolve()
+        if root not in path.parents:
+            raise UploadError("Invalid key.")
+        return path
+
+    def _parts_dir(self, upload_id: str) -> Path:
+        return Path(settings.MEDIA_ROOT) / ".multipart" / upload_id
+
+    def _url(self, claims: dict) -> str:
+        token = signing.dumps(claims, salt=LOCAL_PUT_SALT)
+        return reverse("storage-local-put", args=[token])
+
+    def presign_put(self, key, size, sha256, content_type, expires):
+        claims = {"key": key, "size": size, "sha256": sha256, "exp": int(expires.timestamp())}
+        return self._url(claims), {"Content-Type": content_type, "x-amz-checksum-sha256": _b64(sha256)}
+
+    def create_multipart(self, key, content_type) -> str:
+        upload_id = uuid.uuid4().hex
+        self._parts_dir(upload_id).mkdir(parents=True, exist_ok=True)
+        return upload_id
+
+    def presign_part(self, key, upload_id, part_number, size, sha256, expires):
+        claims = {
+            "key": key,
+            "upload_id": upload_id,
+            "part": part_number,
+            "size": size,
+            "sha256": sha256,
+            "exp": int(expires.timestamp()),
+        }
+        return self._url(claims), {"x-amz-checksum-sha256": _b64(sha256)}
+
+    def receive(self, claims: dict, stream, content_length: int | None) -> None:
+        """Write one PUT body (object or part), enforcing the signed size and checksum."""
+        if claims["exp"] < timezone.now().timestamp():
+            raise UploadError("Upload URL expired.")
+        if content_length is not None and content_length != claims["size"]:
+            raise UploadError("Content-Length does not match the presigned size.")
+        if claims.get("upload_id"):
+            target = self._parts_dir(claims["upload_id"]) / str(claims["part"])
+        else:
+            target = self._path(claims["key"])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".partial")
+        digest, written = hashlib.sha256(), 0
+        try:
+            with open(tmp, "wb") as out:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    if written > claims["size"]:
+                        raise UploadError("Body larger than the presigned size.")
+                    digest.update(chunk)
+                    out.write(chunk)
+            if written != claims["size"]:
+                raise UploadError("Body size does not match the presigned size.")
+            if digest.hexdigest() != claims["sha256"]:
+                raise UploadError("SHA-256 mismatch.")
+            os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def complete_multipart(self, key, upload_id, part_count) -> None:
+        parts_dir = self._parts_dir(upload_id)
+        target = self._path(key)
+        if not parts_dir.is_dir():
+            # Completed (or abandoned) earlier: never truncate an object that is already there
+            if target.exists():
+                return
+            raise UploadError("Multipart upload not found.")
+        tmp = target.with_name(target.name + ".partial")
+        try:
+            parts = [parts_dir / str(number) for number in range(1, part_count + 1)]
+            for number, part in enumerate(parts, 1):
+                if not part.exists():
+                    raise UploadError(f"Part {number} was not uploaded.")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as out:
+                for part in parts:
+                    with open(part, "rb") as f:
+                        shutil.copyfileobj(f, out, CHUNK_SIZE)
+            os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+    def stat(self, key):
+        """(size, sha256 hex) of a stored object, or None if it does not exist."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return path.stat().st_size, digest.hexdigest()
+
+    def delete(self, key) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class S3PresignBackend:
+    """Presigned PUT/multipart uploads against S3 or an S3-compatible store (MinIO, Ceph)."""
+
+    def __init__(self):
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImproperlyConfigured("USE_S3_STORAGE needs boto3: pip install boto3 django-storages") from e
+        self.bucket = settings.AWS_STORAGE_BUCKET_NAME
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+            region_name=settings.AWS_S3_REGION_NAME or None,
+        )
+
+    def _expires_in(self, expires) -> int:
+        return max(int((expires - timezone.now()).total_seconds()), 1)
+
+    def presign_put(self, key, size, sha256, content_type, expires):
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ContentType": content_type,
+                "ContentLength": size,
+                "ChecksumSHA256": _b64(sha256),
+            },
+            ExpiresIn=self._expires_in(expires),
+        )
+        return url, {"Content-Type": content_type, "x-amz-checksum-sha256": _b64(sha256)}
+
+    def create_multipart(self, key, content_type) -> str:
+        resp = self.client.create_multipart_upload(
+            Bucket=self.bucket, Key=key, ContentType=content_type, ChecksumAlgorithm="SHA256"
+        )
+        return resp["UploadId"]
+
+    def presign_part(self, key, upload_id, part_number, size, sha256, expires):
+        url = self.client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+                "ContentLength": size,
+                "ChecksumSHA256": _b64(sha256),
+            },
+            ExpiresIn=self._expires_in(expires),
+        )
+        return url, {"x-amz-checksum-sha256": _b64(sha256)}
+
+    def complete_multipart(self, key, upload_id, part_count) -> None:
+        try:
+            parts = self.client.list_parts(Bucket=self.bucket, Key=key, UploadId=upload_id).get("Parts", [])
+        except self.client.exceptions.NoSuchUpload:
+            # Completed (or aborted) earlier
+            if self.stat(key) is not None:
+                return
+            raise UploadError("Multipart upload not found.")
+        if len(parts) != part_count:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            raise UploadError("Not all parts were uploaded.")
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": p["PartNumber"], "ETag": p["ETag"], "ChecksumSHA256": p["ChecksumSHA256"]}
+                    for p in parts
+                ]
+            },
+        )
+
+    def stat(self, key):
+        """(size, sha256 hex or None) from HEAD; multipart objects only carry a composite checksum."""
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=key, ChecksumMode="ENABLED")
+        except self.client.exceptions.ClientError:
+            return None
+        checksum = head.get("ChecksumSHA256") or ""
+        sha256 = None if "-" in checksum or not checksum else base64.b64decode(checksum).hex()
+        return head["ContentLength"], sha256
+
+    def delete(self, key) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+
+def get_backend():
+    return S3PresignBackend() if settings.USE_S3_STORAGE else LocalPresignBackend()
+
+
+def start_upload(
+    prefix: str,
+    filename: str,
+    size: int,
+    sha256: str,
+    content_type: str = "application/octet-stream",
+    file_type: str = "other",
+    part_sha256: list | None = None,
+    scope: str = "",
+) -> PresignedUpload:
+    """
+    Presign an upload of `size` bytes under prefix/. Files above the multipart
+    threshold need part_sha256: the SHA-256 of each UPLOAD_PART_SIZE_MB slice.
+    scope is stored in the ticket and must match on finish (e.g. "submission:12").
+    """
+    sha256 = (sha256 or "").lower()
+    if size <= 0:
+        raise UploadError("size must be positive.")
+    if size > max_upload_size(file_type):
+        raise UploadError(f"File exceeds the {max_upload_size(file_type) // MB} MB limit for {file_type} files.")
+    if not _is_sha256(sha256):
+        raise UploadError("sha256 must be a hex SHA-256 digest.")
+
+    name = os.path.basename(filename or "file").replace(" ", "_")[-100:] or "file"
+    key = f"{prefix.rstrip('/')}/{uuid.uuid4().hex}_{name}"
+    expires = timezone.now() + timedelta(seconds=settings.UPLOAD_PRESIGN_EXPIRES_SECONDS)
+    backend = get_backend()
+    ticket = {"key": key, "size": size, "sha256": sha256, "file_type": file_type, "name": name, "scope": scope}
+
+    if size <= settings.UPLOAD_MULTIPART_THRESHOLD_MB * MB:
+        url, headers = backend.presign_put(key, size, sha256, content_type, expires)
+        return PresignedUpload(key, signing.dumps(ticket, salt=TICKET_SALT), expires, url=url, headers=headers)
+
+    part_size = settings.UPLOAD_PART_SIZE_MB * MB
+    count = math.ceil(size / part_size)
+    part_sha256 = [p.lower() for p in (part_sha256 or [])]
+    if len(part_sha256) != count or not all(_is_sha256(p) for p in part_sha256):
+        raise UploadError(f"part_sha256 must list {count} SHA-256 digests of {part_size // MB} MB parts.")
+    upload_id = backend.create_multipart(key, content_type)
+    parts = []
+    for number in range(1, count + 1):
+        part_bytes = min(part_size, size - (number - 1) * part_size)
+        url, headers = backend.presign_part(key, upload_id, number, part_bytes, part_sha256[number - 1], expires)
+        parts.append({"part_number": number, "url": url, "headers": headers})
+    ticket.update(upload_id=upload_id, parts=count)
+    return PresignedUpload(
+        key, signing.dumps(ticket, salt=TICKET_SALT), expires, part_size=part_size, parts=parts
+    )
+
+
+def finish_upload(ticket: str, scope: str = "") -> dict:
+    """
+    Verify the uploaded object against the ticket and return {"key", "size",
+    "sha256", "file_type", "name"} for the caller to record. A mismatching object
+    is deleted and UploadError raised. Completing a ticket again returns the
+    stored result (callers must record it idempotently, keyed by "key").
+    """
+    max_age = settings.UPLOAD_PRESIGN_EXPIRES_SECONDS + 3600
+    try:
+        claims = signing.loads(ticket, salt=TICKET_SALT, max_age=max_age)
+    except signing.BadSignature as e:
+        raise UploadError("Invalid or expired upload ticket.") from e
+    if claims["scope"] != scope:
+        raise UploadError("Upload ticket was issued for a different target.")
+
+    key = claims["key"]
+    marker = f"uploads:finished:{key}"
+    if not cache.add(marker, FINISH_PENDING, FINISH_PENDING_SECONDS):
+        previous = cache.get(marker)
+        if isinstance(previous, dict):
+            return previous
+        raise UploadError("This upload is already being completed; retry shortly.")
+    try:
+        backend = get_backend()
+        if claims.get("upload_id"):
+            backend.complete_multipart(key, claims["upload_id"], claims["parts"])
+        found = backend.stat(key)
+        if found is None:
+            raise UploadError("Object not found; upload the file before completing.")
+        size, sha256 = found
+        if size != claims["size"] or (sha256 is not None and sha256 != claims["sha256"]):
+            backend.delete(key)
+            raise UploadError("Uploaded object does not match the declared size and SHA-256.")
+    except Exception:
+        cache.delete(marker)  # nothing was verified; the client may retry
+        raise
+    result = {k: claims[k] for k in ("key", "size", "sha256", "file_type", "name")}
+    cache.set(marker, result, max_age)
+    return result
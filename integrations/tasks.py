@@ -0,0 +1,21 @@
+"""Celery tasks for integrations."""
+from celery import shared_task
+from django.conf import settings
+
+
+@shared_task
+def collect_orphaned_files():
+    """Periodic maintenance: delete stored files no row references (past STORAGE_GC_GRACE_HOURS)."""
+    if settings.USE_S3_STORAGE:
+        return {"status": "skipped", "reason": "S3 storage; use bucket lifecycle rules"}
+    from .orphans import collect_orphans
+
+    return {"status": "collected", **collect_orphans()}
+
+
+@shared_task
+def sync_orcid_records(user_ids=None):
+    """Refresh cached ORCID records: the given users, or a batch of the stalest (periodic)."""
+    from .orcid import sync_orcid_records as run
+
+    return {"status": "synced", **run(user_ids)}
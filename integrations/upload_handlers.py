@@ -0,0 +1,186 @@
+"""
+Streaming checks for multipart uploads.
+
+StreamingValidationUploadHandler is installed per request by expect_upload(),
+ahead of the memory/temp-file handlers, and sees every chunk before they store
+it: it hashes (SHA-256),
+counts bytes against the size limit and sniffs the magic bytes of the first
+chunk, so an oversized or mislabelled file is refused as soon as it shows, not
+after the whole body has been buffered. A request whose Content-Length is
+already over the limit is refused before its body is read.
+
+Views declare what they accept with expect_upload() before touching
+request.data/FILES; the result of each file's checks is available afterwards
+via upload_check(), and a refused upload via upload_rejection(). Requests whose
+view did not opt in (the Django admin, other forms) are not checked at all.
+"""
+import hashlib
+from dataclasses import dataclass
+
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+from .storage import max_upload_size
+
+PDF = "application/pdf"
+OCTET_STREAM = "application/octet-stream"
+SNIFF_BYTES = 1024  # PDF readers accept the header anywhere in the first KB
+MAGIC = [
+    (b"PK\x03\x04", "application/zip"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x1f\x8b", "application/gzip"),
+]
+# Room for boundaries, part headers and small form fields next to the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def sniff(head: bytes) -> str:
+    """Content type from the leading bytes of a file."""
+    if b"%PDF-" in head[:SNIFF_BYTES]:
+        return PDF
+    for magic, content_type in MAGIC:
+        if head.startswith(magic):
+            return content_type
+    return OCTET_STREAM
+
+
+def claims_pdf(file_name: str, content_type: str | None) -> bool:
+    return (file_name or "").lower().endswith(".pdf") or (content_type or "").lower() == PDF
+
+
+class UploadRejected(Exception):
+    """The file breaks the declared limits; status_code is 413 or 415."""
+
+    def __init__(self, detail: str, status_code: int):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+@dataclass
+class UploadCheck:
+    """What was measured while the file streamed in."""
+
+    name: str
+    size: int
+    sha256: str
+    content_type: str  # sniffed, not the client's claim
+
+
+class UploadInspector:
+    """Incremental hash, size and type checks for one file."""
+
+    def __init__(self, file_name: str, declared_type: str | None, limit: int, require_pdf: bool = False):
+        self.file_name = file_name
+        self.limit = limit
+        self.require_pdf = require_pdf or claims_pdf(file_name, declared_type)
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.head = b""
+        self.content_type = None
+
+    def feed(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.limit:
+            raise UploadRejected(f"File exceeds the {self.limit // (1024 * 1024)} MB limit.", 413)
+        self.digest.update(chunk)
+        if self.content_type is None:
+            self.head += chunk[: SNIFF_BYTES - len(self.head)]
+            if len(self.head) >= SNIFF_BYTES:
+                self._sniff()
+
+    def _sniff(self):
+        self.content_type = sniff(self.head)
+        if self.require_pdf and self.content_type != PDF:
+            raise UploadRejected("File is not a PDF.", 415)
+
+    def finish(self) -> UploadCheck:
+        if self.content_type is None:
+            self._sniff()
+        return UploadCheck(self.file_name, self.size, self.digest.hexdigest(), self.content_type)
+
+
+def inspect_bytes(content: bytes, file_name: str, file_type: str, require_pdf: bool = False) -> UploadCheck:
+    """The same checks for content that arrived in one piece (base64 JSON uploads)."""
+    inspector = UploadInspector(file_name, None, max_upload_size(file_type), require_pdf)
+    inspector.feed(content)
+    return inspector.finish()
+
+
+def expect_upload(request, file_types, require_pdf: bool = False):
+    """
+    Declare the file types a view accepts before the body is parsed.
+    The streaming limit is the largest of theirs; check the exact one afterwards.
+    """
+    django_request = getattr(request, "_request", request)
+    django_request.upload_limit = max(max_upload_size(t) for t in file_types)
+    django_request.upload_require_pdf = require_pdf
+    handlers = django_request.upload_handlers
+    if not any(isinstance(h, StreamingValidationUploadHandler) for h in handlers):
+        handlers.insert(0, StreamingValidationUploadHandler(django_request))
+
+
+def upload_check(request, field_name: str = "file") -> UploadCheck | None:
+    return getattr(getattr(request, "_request", request), "upload_checks", {}).get(field_name)
+
+
+def upload_rejection(request) -> UploadRejected | None:
+    return getattr(getattr(request, "_request", request), "upload_rejection", None)
+
+
+class StreamingValidationUploadHandler(FileUploadHandler):
+    """
+    Passes chunks through to the next handler after checking them; see the module
+    docstring. A pass-through for requests that did not call expect_upload().
+    """
+
+    def _active(self):
+        return getattr(self.request, "upload_limit", None) is not None
+
+    def _limit(self):
+        return self.request.upload_limit
+
+    def _reject(self, error: UploadRejected):
+        self.request.upload_rejection = error
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if self._active() and content_length > self._limit() + MULTIPART_OVERHEAD:
+            self._reject(UploadRejected(f"Upload exceeds the {self._limit() // (1024 * 1024)} MB limit.", 413))
+            # Claim the request so the body is never read
+            return QueryDict(encoding=encoding), MultiValueDict()
+        return None
+
+    def new_file(self, field_name, file_name, content_type, content_length, *args, **kwargs):
+        super().new_file(field_name, file_name, content_type, content_length, *args, **kwargs)
+        self.inspector = None
+        if self._active():
+            self.inspector = UploadInspector(
+                file_name, content_type, self._limit(), getattr(self.request, "upload_require_pdf", False)
+            )
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.inspector is None:
+            return raw_data
+        try:
+            self.inspector.feed(raw_data)
+        except UploadRejected as e:
+            self._reject(e)
+            raise StopUpload(connection_reset=True)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.inspector is None:
+            return None
+        try:
+            check = self.inspector.finish()
+        except UploadRejected as e:
+            # Files under SNIFF_BYTES are only sniffed here; the view sees the rejection
+            self._reject(e)
+            check = None
+        if check is not None:
+            if not hasattr(self.request, "upload_checks"):
+                self.request.upload_checks = {}
+            self.request.upload_checks[self.field_name] = check
+        return None  # the next handler builds the UploadedFile
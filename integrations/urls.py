@@ -1,9 +1,20 @@
 """Integration URL routes."""
 from django.urls import path
 
-from .views import OrcidConnectView, UploadFileView
+from .views import (
+    CompleteUploadView,
+    LocalUploadView,
+    OrcidConnectView,
+    OrcidRecordView,
+    PresignUploadView,
+    UploadFileView,
+)
 
 urlpatterns = [
     path("upload-file", UploadFileView.as_view(), name="upload-file"),
+    path("uploads/presign", PresignUploadView.as_view(), name="upload-presign"),
+    path("uploads/complete", CompleteUploadView.as_view(), name="upload-complete"),
+    path("storage/local/<str:token>", LocalUploadView.as_view(), name="storage-local-put"),
     path("orcid/connect", OrcidConnectView.as_view(), name="orcid-connect"),
+    path("orcid/record", OrcidRecordView.as_view(), name="orcid-record"),
 ]
@@ -2,25 +2,51 @@
 import base64
 import uuid
 
+from django.core import signing
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.db import transaction
 from rest_framework import status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .models import OrcidRecord
+from .orcid import normalize_orcid_id
+from .serializers import CompleteUploadSerializer, OrcidRecordSerializer, PresignUploadSerializer
+from .storage import LOCAL_PUT_SALT, LocalPresignBackend, UploadError, finish_upload, start_upload
+from .upload_handlers import UploadRejected, expect_upload, inspect_bytes, upload_check, upload_rejection
+
+
+def presigned_response(request, upload):
+    """Presign payload with stand-in URLs made absolute."""
+    data = upload.as_dict()
+    targets = data.get("parts") or [data]
+    for target in targets:
+        if target["url"].startswith("/"):
+            target["url"] = request.build_absolute_uri(target["url"])
+    return data
+
 
 class UploadFileView(APIView):
-    """POST /api/upload-file - Upload a file, get back its URL. Use form-data (file) or JSON (file_base64, filename)."""
+    """
+    POST /api/upload-file - Upload a file, get back its URL, size and SHA-256.
+    Use form-data (file) or JSON (file_base64, filename). Limit: UPLOAD_MAX_SIZE_MB["other"].
+    """
 
     permission_classes = [IsAuthenticated]
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
     def post(self, request):
+        expect_upload(request, ["other"])
         file_obj = request.FILES.get("file")
+        rejected = upload_rejection(request)
+        if rejected:
+            return Response({"detail": rejected.detail}, status=rejected.status_code)
         if file_obj:
             filename = file_obj.name or "file"
+            check = upload_check(request)
             safe_name = f"{uuid.uuid4().hex}_{filename}"
             path = default_storage.save(f"uploads/{safe_name}", file_obj)
         else:
@@ -37,17 +63,25 @@ class UploadFileView(APIView):
                 return Response({"detail": "Invalid base64 encoding."}, status=status.HTTP_400_BAD_REQUEST)
             if not content:
                 return Response({"detail": "Empty file content."}, status=status.HTTP_400_BAD_REQUEST)
+            try:
+                check = inspect_bytes(content, filename, "other")
+            except UploadRejected as e:
+                return Response({"detail": e.detail}, status=e.status_code)
             safe_name = f"{uuid.uuid4().hex}_{filename}"
             path = default_storage.save(f"uploads/{safe_name}", ContentFile(content))
 
         url = request.build_absolute_uri(default_storage.url(path))
-        return Response({"url": url}, status=status.HTTP_201_CREATED)
+        return Response(
+            {"url": url, "size": check.size, "sha256": check.sha256, "content_type": check.content_type},
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class OrcidConnectView(APIView):
     """
     POST /api/orcid/connect - Stub for ORCID OAuth connection.
     When implemented: complete OAuth flow and store orcid_id on user.
+    The iD's checksum is validated and its public record is synced in the background.
     """
 
     permission_classes = [IsAuthenticated]
@@ -59,10 +93,92 @@ class OrcidConnectView(APIView):
                 {"detail": "orcid_id is required."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        orcid_id = normalize_orcid_id(orcid_id)
+        if orcid_id is None:
+            return Response({"detail": "orcid_id is not a valid ORCID iD."}, status=status.HTTP_400_BAD_REQUEST)
         # Stub: store orcid_id directly; real impl would validate via OAuth
         request.user.orcid_id = orcid_id
         request.user.save(update_fields=["orcid_id"])
+        from .tasks import sync_orcid_records
+
+        user_id = request.user.id
+        transaction.on_commit(lambda: sync_orcid_records.delay([user_id]))
         return Response(
             {"orcid_id": request.user.orcid_id, "message": "ORCID connected (stub)."},
             status=status.HTTP_200_OK,
         )
+
+
+class OrcidRecordView(APIView):
+    """GET /api/orcid/record - The current user's cached public ORCID record (name, affiliations, works)."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        record = (
+            OrcidRecord.objects.filter(user_id=request.user.id)
+            .prefetch_related("affiliations", "works")
+            .first()
+        )
+        if record is None:
+            return Response({"detail": "No ORCID record synced yet."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(OrcidRecordSerializer(record).data)
+
+
+class PresignUploadView(APIView):
+    """
+    POST /api/uploads/presign - Presigned PUT URL(s) for a direct upload to storage.
+    Body: filename, size, sha256 (hex), content_type; part_sha256 for multipart sizes.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = PresignUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = start_upload(
+                f"uploads/{request.user.id}", scope=f"user:{request.user.id}", **serializer.validated_data
+            )
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(presigned_response(request, upload), status=status.HTTP_201_CREATED)
+
+
+class CompleteUploadView(APIView):
+    """POST /api/uploads/complete - Verify a direct upload (body: ticket) and get back its URL."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = CompleteUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            stored = finish_upload(serializer.validated_data["ticket"], scope=f"user:{request.user.id}")
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        url = request.build_absolute_uri(default_storage.url(stored["key"]))
+        return Response({"url": url, "key": stored["key"], "size": stored["size"], "sha256": stored["sha256"]})
+
+
+class LocalUploadView(APIView):
+    """
+    PUT /api/storage/local/{token} - Filesystem stand-in for presigned object storage
+    URLs (used when USE_S3_STORAGE is off). The signed token authorizes the PUT.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def put(self, request, token):
+        try:
+            claims = signing.loads(token, salt=LOCAL_PUT_SALT)
+        except signing.BadSignature:
+            return Response({"detail": "Invalid upload URL."}, status=status.HTTP_403_FORBIDDEN)
+        content_length = request.META.get("CONTENT_LENGTH")
+        try:
+            # Read the raw body in chunks; request.data would buffer and parse it
+            LocalPresignBackend().receive(claims, request._request, int(content_length) if content_length else None)
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(status=status.HTTP_200_OK)
@@ -0,0 +1,13 @@
+"""Monitoring app configuration."""
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    """Monitoring app config."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "monitoring"
+    verbose_name = "Monitoring"
+
+    def ready(self):
+        from . import celery_hooks  # noqa: F401  (connects Celery signals)
@@ -0,0 +1,62 @@
+"""
+Celery signal handlers recording queue wait and run time of selected tasks.
+
+The publisher stamps each message with an enqueued_at header; the worker measures
+from it (or from the ETA, for delayed tasks and retries) to the start of the task.
+Only tasks named in METRICS_CELERY_TASKS are tracked.
+"""
+import time
+from datetime import datetime
+
+from celery.signals import before_task_publish, task_postrun, task_prerun, worker_process_shutdown
+from django.conf import settings
+
+from . import metrics
+
+_started = {}  # task_id -> perf_counter() at task start
+
+
+def _tracked(name) -> bool:
+    return settings.METRICS_ENABLED and name in settings.METRICS_CELERY_TASKS
+
+
+def _ready_at(request):
+    """Epoch seconds from which the task could have run: its ETA, else when it was published."""
+    eta = getattr(request, "eta", None)
+    if eta:
+        try:
+            return (eta if isinstance(eta, datetime) else datetime.fromisoformat(eta)).timestamp()
+        except (TypeError, ValueError):
+            pass
+    enqueued_at = getattr(request, "enqueued_at", None) or (getattr(request, "headers", None) or {}).get("enqueued_at")
+    return float(enqueued_at) if enqueued_at else None
+
+
+@before_task_publish.connect(weak=False)
+def stamp_enqueued_at(sender=None, headers=None, **kwargs):
+    if headers is not None and _tracked(sender):
+        headers["enqueued_at"] = time.time()
+
+
+@task_prerun.connect(weak=False)
+def task_started(task_id=None, task=None, **kwargs):
+    if task is None or not _tracked(task.name):
+        return
+    _started[task_id] = time.perf_counter()
+    ready_at = _ready_at(task.request)
+    if ready_at is not None:
+        metrics.TASK_QUEUE_WAIT.observe(max(time.time() - ready_at, 0.0), task=task.name)
+
+
+@task_postrun.connect(weak=False)
+def task_finished(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if task is None or started is None:
+        return
+    metrics.TASK_RUNTIME.observe(time.perf_counter() - started, task=task.name, state=state or "UNKNOWN")
+    metrics.flush()
+
+
+@worker_process_shutdown.connect(weak=False)
+def flush_on_shutdown(**kwargs):
+    metrics.flush(force=True)
@@ -0,0 +1,171 @@
+"""
+Prometheus metrics shared across processes.
+
+Every process (gunicorn worker, Celery worker child) records into in-memory
+histograms and writes a snapshot to its own file under METRICS_DIR at most every
+METRICS_FLUSH_SECONDS (write to a temp file, then rename). The /metrics view sums
+all files with the live values of the serving process and renders the Prometheus
+text format (0.0.4). File names carry the pid and the process start time, so a
+restarted worker never overwrites another's totals; gunicorn.conf.py empties the
+directory when the master starts. Without METRICS_DIR only the serving process's
+own values are reported (runserver, tests).
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_registry = {}  # name -> Histogram
+_state = {"pid": None, "started": 0, "last_flush": 0.0}
+
+
+class Histogram:
+    """A labelled histogram; each series is [bucket counts..., sum, count]."""
+
+    def __init__(self, name: str, documentation: str, labelnames, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(float(b) for b in buckets)
+        self.series = {}
+        _registry[name] = self
+
+    def observe(self, value: float, **labels):
+        key = json.dumps([str(labels[name]) for name in self.labelnames])
+        with _lock:
+            _check_fork()
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+
+def _check_fork():
+    """Start from zero in a forked child (Celery prefork) instead of re-reporting the parent's values."""
+    pid = os.getpid()
+    if _state["pid"] != pid:
+        if _state["pid"] is not None:
+            for metric in _registry.values():
+                metric.series = {}
+        _state.update(pid=pid, started=time.time_ns(), last_flush=0.0)
+
+
+def snapshot() -> dict:
+    """This process's values: {name: {labels_json: series}}."""
+    with _lock:
+        _check_fork()
+        return {name: {k: list(v) for k, v in metric.series.items()} for name, metric in _registry.items()}
+
+
+def _own_file(directory: Path) -> Path:
+    return directory / f"{_state['pid']}-{_state['started']}.json"
+
+
+def flush(force: bool = False):
+    """Write this process's snapshot to METRICS_DIR (rate-limited unless force)."""
+    if not settings.METRICS_DIR:
+        return
+    now = time.monotonic()
+    if not force and now - _state["last_flush"] < settings.METRICS_FLUSH_SECONDS:
+        return
+    data = snapshot()
+    _state["last_flush"] = now
+    directory = Path(settings.METRICS_DIR)
+    path = _own_file(directory)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("Could not write metrics to %s", path, exc_info=True)
+
+
+def collect() -> dict:
+    """Values of all processes, summed series by series."""
+    merged = snapshot()
+    if settings.METRICS_DIR:
+        own = _own_file(Path(settings.METRICS_DIR)).name
+        for path in Path(settings.METRICS_DIR).glob("*.json"):
+            if path.name == own:
+                continue
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # being replaced or from an older layout
+            for name, series in data.items():
+                target = merged.setdefault(name, {})
+                for key, values in series.items():
+                    current = target.get(key)
+                    if current is None:
+                        target[key] = list(values)
+                    elif len(current) == len(values):  # else the bucket layout changed; skip
+                        target[key] = [a + b for a, b in zip(current, values)]
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs, le=None) -> str:
+    if le is not None:
+        pairs = [*pairs, f'le="{le}"']
+    return "{" + ",".join(pairs) + "}"
+
+
+def render(values: dict | None = None) -> str:
+    """Prometheus text exposition of collect() (or the given values)."""
+    values = collect() if values is None else values
+    lines = []
+    for name, metric in sorted(_registry.items()):
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, series in sorted(values.get(name, {}).items()):
+            pairs = [f'{label}="{_escape(v)}"' for label, v in zip(metric.labelnames, json.loads(key))]
+            labels = _labels(pairs)
+            cumulative = 0
+            for bound, count in zip(metric.buckets, series):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(pairs, le=repr(bound))} {cumulative}")
+            lines.append(f"{name}_bucket{_labels(pairs, le='+Inf')} {series[-1]}")
+            lines.append(f"{name}_sum{labels} {series[-2]}")
+            lines.append(f"{name}_count{labels} {series[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "Request latency by view.", ["view", "method", "status"])
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries per request by view.",
+    ["view"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+REQUEST_DB_TIME = Histogram("http_request_db_seconds", "Time spent in database queries per request by view.", ["view"])
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size by view.",
+    ["view"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216),
+)
+TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time from publish to start by task.",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+TASK_RUNTIME = Histogram("celery_task_runtime_seconds", "Task run time by task and final state.", ["task", "state"])
@@ -0,0 +1,57 @@
+"""Request metrics middleware."""
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+class _QueryTimer:
+    """connection.execute_wrapper() hook counting statements and their time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """
+    Record latency, query count/time and response size per view (the URL name,
+    so label values stay bounded). Place first in MIDDLEWARE to time the whole stack.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+        timer = _QueryTimer()
+        start = time.perf_counter()
+        with connections["default"].execute_wrapper(timer):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name or match._func_path) if match else "<unresolved>"
+        if view == "metrics":
+            return response
+        method = request.method if request.method in METHODS else "other"
+        metrics.REQUEST_LATENCY.observe(elapsed, view=view, method=method, status=response.status_code)
+        metrics.REQUEST_QUERIES.observe(timer.count, view=view)
+        metrics.REQUEST_DB_TIME.observe(timer.seconds, view=view)
+        if not response.streaming:
+            metrics.RESPONSE_SIZE.observe(len(response.content), view=view)
+        metrics.flush()
+        return response
@@ -0,0 +1,235 @@
+"""
+On-demand request profiling.
+
+A request is profiled when it carries a token from POST /api/admin/profiles/token
+(X-Profile header or ?_profile= query parameter), or when it is picked by
+PROFILING_SAMPLE_RATE. Tokens are signed, expire after PROFILING_TOKEN_MAX_AGE
+seconds and work for one request. A profiled request runs under cProfile with
+every SQL statement timed. Afterwards the slowest SELECTs are EXPLAINed, and
+<id>.pstats (for snakeviz / python -m pstats) plus <id>.json (summary, SQL,
+plans) are written to PROFILING_DIR, keeping the newest PROFILING_MAX_ARTIFACTS.
+Stored SQL keeps its placeholders; parameter values are only used for EXPLAIN.
+
+Requests that are not profiled cost a header lookup (and a random() call while
+sampling); with PROFILING_ENABLED off the middleware is not loaded at all.
+"""
+import cProfile
+import json
+import logging
+import pstats
+import random
+import re
+import secrets
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+HEADER = "X-Profile"
+QUERY_PARAM = "_profile"
+TOKEN_SALT = "monitoring.profiling"
+ARTIFACT_ID_RE = re.compile(r"^\d{8}T\d{12}-[0-9a-f]{8}$")
+TOP_FUNCTIONS = 40
+TOP_REPEATED = 10
+
+
+def issue_token(user) -> str:
+    """A single-use profiling token on behalf of user (an admin)."""
+    return signing.dumps({"user": user.pk, "nonce": secrets.token_hex(8)}, salt=TOKEN_SALT)
+
+
+def redeem_token(token: str) -> dict | None:
+    """The token's claims if it is valid and unused (marking it used), else None."""
+    try:
+        claims = signing.loads(token, salt=TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+        if cache.add(f"profiling:token:{claims['nonce']}", 1, settings.PROFILING_TOKEN_MAX_AGE):
+            return claims
+    except signing.BadSignature:
+        pass
+    except Exception:
+        logger.warning("Could not redeem profiling token", exc_info=True)
+    return None
+
+
+class _QueryLog:
+    """connection.execute_wrapper() hook keeping (seconds, sql, params, many, alias) per statement."""
+
+    def __init__(self, alias: str):
+        self.alias = alias
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((time.perf_counter() - start, sql, params, many, self.alias))
+
+
+def explain(alias: str, sql: str, params) -> list[str] | None:
+    """The database's plan for a SELECT (EXPLAIN without ANALYZE, so nothing runs twice)."""
+    if not sql.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            return [" ".join(str(col) for col in row) for row in cursor.fetchall()]
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+
+
+def _sql_summary(queries) -> dict:
+    by_statement = defaultdict(lambda: [0, 0.0])
+    for seconds, sql, _params, _many, _alias in queries:
+        by_statement[sql][0] += 1
+        by_statement[sql][1] += seconds
+    slowest = sorted(queries, key=lambda q: q[0], reverse=True)[: settings.PROFILING_EXPLAIN_TOP]
+    repeated = sorted(by_statement.items(), key=lambda item: item[1][0], reverse=True)[:TOP_REPEATED]
+    return {
+        "count": len(queries),
+        "total_ms": round(sum(q[0] for q in queries) * 1000, 3),
+        "slowest": [
+            {
+                "sql": sql,
+                "duration_ms": round(seconds * 1000, 3),
+                "explain": None if many else explain(alias, sql, params),
+            }
+            for seconds, sql, params, many, alias in slowest
+        ],
+        "repeated": [
+            {"sql": sql, "count": count, "total_ms": round(total * 1000, 3)}
+            for sql, (count, total) in repeated
+            if count > 1
+        ],
+    }
+
+
+def _function_summary(profiler) -> list[dict]:
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:TOP_FUNCTIONS]
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "total_ms": round(tottime * 1000, 3),
+            "cumulative_ms": round(cumtime * 1000, 3),
+        }
+        for (filename, line, name), (_cc, calls, tottime, cumtime, _callers) in rows
+    ]
+
+
+def _prune(directory: Path):
+    """Keep the newest PROFILING_MAX_ARTIFACTS profiles (ids sort by time)."""
+    ids = sorted({p.stem for p in directory.glob("*.json")}, reverse=True)
+    for artifact_id in ids[settings.PROFILING_MAX_ARTIFACTS :]:
+        for suffix in (".json", ".pstats"):
+            (directory / f"{artifact_id}{suffix}").unlink(missing_ok=True)
+
+
+def save_artifact(summary: dict, profiler) -> str:
+    """Write <id>.pstats and <id>.json to PROFILING_DIR; returns the id."""
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    artifact_id = f"{timezone.now():%Y%m%dT%H%M%S%f}-{secrets.token_hex(4)}"
+    summary = {"id": artifact_id, "created_at": timezone.now().isoformat(), **summary}
+    if profiler is not None:
+        profiler.dump_stats(directory / f"{artifact_id}.pstats")
+        summary["functions"] = _function_summary(profiler)
+    (directory / f"{artifact_id}.json").write_text(json.dumps(summary, default=str))
+    _prune(directory)
+    return artifact_id
+
+
+def artifact_path(artifact_id: str, suffix: str) -> Path | None:
+    """Path of an existing artifact file, or None (also for ids that are not ours)."""
+    if not ARTIFACT_ID_RE.match(artifact_id):
+        return None
+    path = Path(settings.PROFILING_DIR) / f"{artifact_id}{suffix}"
+    return path if path.is_file() else None
+
+
+def list_artifacts() -> list[dict]:
+    """Summaries of stored profiles, newest first (without SQL and function detail)."""
+    directory = Path(settings.PROFILING_DIR)
+    rows = []
+    for path in sorted(directory.glob("*.json"), reverse=True):
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue  # pruned meanwhile
+        rows.append(
+            {
+                **{k: data.get(k) for k in ("id", "created_at", "trigger", "method", "path", "view", "status")},
+                "duration_ms": data.get("duration_ms"),
+                "queries": data.get("sql", {}).get("count"),
+                "pstats": (directory / f"{path.stem}.pstats").exists(),
+            }
+        )
+    return rows
+
+
+class ProfilingMiddleware:
+    """Profile requests carrying a profiling token, or a PROFILING_SAMPLE_RATE sample of all requests."""
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def _trigger(self, request):
+        token = request.headers.get(HEADER)
+        if token is None and QUERY_PARAM in request.META.get("QUERY_STRING", ""):
+            token = request.GET.get(QUERY_PARAM)
+        if token:
+            claims = redeem_token(token)
+            return ("token", claims["user"]) if claims else None
+        rate = settings.PROFILING_SAMPLE_RATE
+        if rate and random.random() < rate:
+            return ("sample", None)
+        return None
+
+    def __call__(self, request):
+        trigger = self._trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        log = _QueryLog("default")
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            profiler = None  # another profiler is active in this thread
+        start = time.perf_counter()
+        try:
+            with connections["default"].execute_wrapper(log):
+                response = self.get_response(request)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+        elapsed = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        summary = {
+            "trigger": trigger[0],
+            "requested_by": trigger[1],
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "duration_ms": round(elapsed * 1000, 3),
+        }
+        try:
+            summary["sql"] = _sql_summary(log.queries)
+            response["X-Profile-Id"] = save_artifact(summary, profiler)
+        except Exception:
+            logger.warning("Could not store profile of %s %s", request.method, request.path, exc_info=True)
+        return response
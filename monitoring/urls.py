@@ -0,0 +1,11 @@
+"""Profiling API URL routes (mounted at /api/admin/)."""
+from django.urls import path
+
+from .views import ProfileDetailView, ProfileListView, ProfileStatsView, ProfileTokenView
+
+urlpatterns = [
+    path("profiles", ProfileListView.as_view(), name="admin-profiles"),
+    path("profiles/token", ProfileTokenView.as_view(), name="admin-profile-token"),
+    path("profiles/<str:artifact_id>", ProfileDetailView.as_view(), name="admin-profile-detail"),
+    path("profiles/<str:artifact_id>/pstats", ProfileStatsView.as_view(), name="admin-profile-pstats"),
+]
@@ -0,0 +1,81 @@
+"""Prometheus scrape endpoint and request profile API."""
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import metrics, profiling
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@require_GET
+def metrics_view(request):
+    """Metrics of all worker processes; requires `Authorization: Bearer METRICS_TOKEN`.
+
+    Without a token scrapes are refused, unless METRICS_ALLOW_ANONYMOUS is set (dev settings).
+    """
+    if not settings.METRICS_TOKEN:
+        if not settings.METRICS_ALLOW_ANONYMOUS:
+            return HttpResponse(status=403)
+    else:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not constant_time_compare(token.strip(), settings.METRICS_TOKEN):
+            return HttpResponse(status=401)
+    return HttpResponse(metrics.render(), content_type=CONTENT_TYPE)
+
+
+class ProfileTokenView(APIView):
+    """POST /api/admin/profiles/token - Single-use token that profiles the request it is sent with."""
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        if not settings.PROFILING_ENABLED:
+            return Response({"detail": "Profiling is disabled."}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            {
+                "token": profiling.issue_token(request.user),
+                "header": profiling.HEADER,
+                "query_param": profiling.QUERY_PARAM,
+                "expires_in": settings.PROFILING_TOKEN_MAX_AGE,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ProfileListView(APIView):
+    """GET /api/admin/profiles - Stored request profiles, newest first."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({"results": profiling.list_artifacts()})
+
+
+class ProfileDetailView(APIView):
+    """GET /api/admin/profiles/{id} - Summary, slowest SQL with plans and top functions of one profile."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, artifact_id):
+        path = profiling.artifact_path(artifact_id, ".json")
+        if path is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(path.open("rb"), content_type="application/json")
+
+
+class ProfileStatsView(APIView):
+    """GET /api/admin/profiles/{id}/pstats - The cProfile dump (python -m pstats, snakeviz)."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, artifact_id):
+        path = profiling.artifact_path(artifact_id, ".pstats")
+        if path is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(path.open("rb"), as_attachment=True, filename=path.name, content_type="application/octet-stream")
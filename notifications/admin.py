@@ -1,11 +1,11 @@
 """Notification admin."""
 from django.contrib import admin
-from .models import EmailLog, Notification
+from .models import CoalescedStatusChange, DeadLetterEmail, EmailLog, Notification, PendingDigestItem
 
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
-    list_display = ["id", "event_type", "user", "status", "idempotency_key", "sent_at"]
+    list_display = ["id", "event_type", "user", "status", "idempotency_key", "sent_at", "created_at", "read_at"]
     list_filter = ["event_type", "status"]
 
 
@@ -13,3 +13,20 @@ class NotificationAdmin(admin.ModelAdmin):
 class EmailLogAdmin(admin.ModelAdmin):
     list_display = ["id", "to_email", "subject", "status", "created_at"]
     list_filter = ["status"]
+
+
+@admin.register(PendingDigestItem)
+class PendingDigestItemAdmin(admin.ModelAdmin):
+    list_display = ["id", "user", "frequency", "event_type", "subject", "created_at"]
+    list_filter = ["frequency", "event_type"]
+
+
+@admin.register(CoalescedStatusChange)
+class CoalescedStatusChangeAdmin(admin.ModelAdmin):
+    list_display = ["id", "recipient_email", "submission_id", "old_status", "new_status", "transitions", "created_at"]
+
+
+@admin.register(DeadLetterEmail)
+class DeadLetterEmailAdmin(admin.ModelAdmin):
+    list_display = ["id", "event_type", "to_email", "exception_type", "attempts", "created_at", "replayed_at"]
+    list_filter = ["event_type", "exception_type"]
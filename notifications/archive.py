@@ -0,0 +1,92 @@
+"""Retention for notifications and email logs: archive old rows to NDJSON and delete them."""
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ejournal.archive import archive_queryset, iter_archive
+
+from .models import EmailLog, Notification, UnreadCounter
+
+# table name -> (model, archived fields)
+ARCHIVED_TABLES = {
+    "notification": (
+        Notification,
+        ["user_id", "event_type", "payload", "submission_id", "status", "idempotency_key", "sent_at", "created_at", "read_at"],
+    ),
+    "emaillog": (
+        EmailLog,
+        ["to_email", "subject", "body", "provider_message_id", "status", "error", "created_at"],
+    ),
+}
+
+
+def archive_dir() -> Path:
+    """Directory holding notification archives."""
+    return Path(settings.ARCHIVE_ROOT) / "notifications"
+
+
+def _release_unread(rows):
+    """Keep unread counters in step when unread notifications are archived."""
+    counts = Counter(r["user_id"] for r in rows if r["user_id"] and r["read_at"] is None)
+    for user_id, n in counts.items():
+        UnreadCounter.objects.filter(user_id=user_id).update(unread=Greatest(F("unread") - n, 0))
+
+
+def archive_old_rows(
+    days: int | None = None,
+    chunk_size: int | None = None,
+    tables=None,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """
+    Move rows older than `days` (default NOTIFICATION_RETENTION_DAYS) to
+    ARCHIVE_ROOT/notifications/<table>-<timestamp>.ndjson.gz and delete them in
+    bounded batches. With dry_run, only count what would be archived.
+    """
+    days = days if days is not None else settings.NOTIFICATION_RETENTION_DAYS
+    chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+    cutoff = timezone.now() - timedelta(days=days)
+    stamp = timezone.now().strftime("%Y%m%dT%H%M%S")
+
+    results = {}
+    for name in tables or ARCHIVED_TABLES:
+        model, fields = ARCHIVED_TABLES[name]
+        qs = model.objects.filter(created_at__lt=cutoff)
+        if dry_run:
+            results[name] = qs.count()
+            continue
+        results[name] = archive_queryset(
+            qs,
+            archive_dir() / f"{name}-{stamp}.ndjson.gz",
+            fields,
+            chunk_size=chunk_size,
+            before_delete=_release_unread if name == "notification" else None,
+        )
+    return results
+
+
+def search_archive(table: str, since=None, until=None, contains: str = "", **filters):
+    """
+    Yield archived rows of `table` matching exact field filters, an optional
+    created_at range and a case-insensitive substring in subject/body/payload.
+    """
+    contains = contains.lower()
+    paths = sorted(archive_dir().glob(f"{table}-*.ndjson.gz"))
+    for row in iter_archive(paths):
+        if any(str(row.get(k)) != str(v) for k, v in filters.items()):
+            continue
+        if since or until:
+            created = parse_datetime(row["created_at"])
+            if (since and created < since) or (until and created >= until):
+                continue
+        if contains:
+            haystack = " ".join(str(row.get(k, "")) for k in ("subject", "body", "payload")).lower()
+            if contains not in haystack:
+                continue
+        yield row
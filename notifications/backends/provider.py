@@ -27,15 +27,16 @@ class ProviderBackend(EmailBackend):
         )
         region = getattr(settings, "AWS_SES_REGION", "us-east-1")
         client = boto3.client("ses", region_name=region)
+        message_body = {"Text": {"Data": body, "Charset": "UTF-8"}}
+        if kwargs.get("html_message"):
+            message_body["Html"] = {"Data": kwargs["html_message"], "Charset": "UTF-8"}
         try:
             response = client.send_email(
                 Source=from_email,
                 Destination={"ToAddresses": [to_email]},
                 Message={
                     "Subject": {"Data": subject, "Charset": "UTF-8"},
-                    "Body": {
-                        "Text": {"Data": body, "Charset": "UTF-8"},
-                    },
+                    "Body": message_body,
                 },
             )
             return response.get("MessageId")
@@ -1,7 +1,10 @@
 """SMTP email backend using Django's email system."""
+from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
+from django.core.validators import validate_email
 from django.conf import settings
 
+from ..delivery import PermanentEmailError
 from .base import EmailBackend
 
 
@@ -12,6 +15,10 @@ class SMTPBackend(EmailBackend):
         from_email = kwargs.get("from_email") or getattr(
             settings, "DEFAULT_FROM_EMAIL", "noreply@ejournal.local"
         )
+        try:
+            validate_email(to_email)
+        except ValidationError as e:
+            raise PermanentEmailError(f"Invalid recipient address: {to_email!r}") from e
         send_mail(
             subject=subject,
             message=body,
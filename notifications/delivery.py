@@ -0,0 +1,141 @@
+"""Retry policies and circuit breaker for outbound email."""
+import random
+import smtplib
+import socket
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import BadHeaderError
+
+
+class PermanentEmailError(Exception):
+    """Send failure that retrying will not fix (bad address, rejected content); backends raise it."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter: delay is drawn from [cap / 2, cap]."""
+
+    max_retries: int
+    base_delay: int
+    max_delay: int
+
+    def countdown(self, retries: int) -> float:
+        cap = min(self.max_delay, self.base_delay * 2**retries)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+# Provider unreachable: back off long enough to ride out an outage
+CONNECTION_POLICY = RetryPolicy(max_retries=8, base_delay=30, max_delay=3600)
+# SMTP 4xx (greylisting, rate limits): the provider asked us to come back later
+THROTTLED_POLICY = RetryPolicy(max_retries=6, base_delay=60, max_delay=1800)
+# Anything unclassified (SES client errors, DB hiccups)
+DEFAULT_POLICY = RetryPolicy(max_retries=5, base_delay=60, max_delay=900)
+
+CONNECTION_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+)
+PERMANENT_ERRORS = (
+    PermanentEmailError,
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPAuthenticationError,
+    smtplib.SMTPNotSupportedError,
+    BadHeaderError,  # newline in a header (subject): the same message fails every time
+)
+
+
+def retry_policy_for(exc: Exception) -> RetryPolicy | None:
+    """Return the retry policy for a send failure, or None if it is permanent."""
+    if isinstance(exc, PERMANENT_ERRORS):
+        return None
+    if isinstance(exc, smtplib.SMTPConnectError):
+        return CONNECTION_POLICY
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return THROTTLED_POLICY if 400 <= exc.smtp_code < 500 else None
+    if isinstance(exc, CONNECTION_ERRORS):
+        return CONNECTION_POLICY
+    return DEFAULT_POLICY
+
+
+class CircuitBreaker:
+    """
+    Failure counter shared by all workers through the default cache (Redis).
+    EMAIL_CIRCUIT_FAILURE_THRESHOLD transient failures within
+    EMAIL_CIRCUIT_WINDOW_SECONDS open the circuit for EMAIL_CIRCUIT_COOLDOWN_SECONDS;
+    after that a single probe send is let through to decide whether to close it.
+    Cache errors never block sending.
+    """
+
+    def __init__(self, name: str):
+        self.failures_key = f"circuit:{name}:failures"
+        self.open_until_key = f"circuit:{name}:open_until"
+        self.probe_key = f"circuit:{name}:probe"
+
+    @property
+    def threshold(self) -> int:
+        return getattr(settings, "EMAIL_CIRCUIT_FAILURE_THRESHOLD", 10)
+
+    @property
+    def window(self) -> int:
+        return getattr(settings, "EMAIL_CIRCUIT_WINDOW_SECONDS", 60)
+
+    @property
+    def cooldown(self) -> int:
+        return getattr(settings, "EMAIL_CIRCUIT_COOLDOWN_SECONDS", 120)
+
+    def blocked_for(self) -> float:
+        """Seconds until a send may be attempted; 0 when the circuit allows it."""
+        try:
+            open_until = cache.get(self.open_until_key)
+            if open_until is None:
+                return 0
+            remaining = open_until - time.time()
+            if remaining > 0:
+                return remaining
+            # Half-open: exactly one worker gets to probe the provider
+            if cache.add(self.probe_key, 1, timeout=self.cooldown):
+                return 0
+            return self.cooldown
+        except Exception:
+            return 0
+
+    def record_success(self):
+        try:
+            cache.delete_many([self.failures_key, self.open_until_key, self.probe_key])
+        except Exception:
+            pass
+
+    def record_failure(self):
+        try:
+            cache.add(self.failures_key, 0, timeout=self.window)
+            failures = cache.incr(self.failures_key)
+            probing = cache.get(self.probe_key) is not None
+            if failures >= self.threshold or probing:
+                cache.set(self.open_until_key, time.time() + self.cooldown, timeout=self.cooldown * 10)
+                cache.delete_many([self.failures_key, self.probe_key])
+        except Exception:
+            pass
+
+
+email_circuit = CircuitBreaker("email")
+
+
+def dead_letter(task_kwargs: dict, exc: Exception, attempts: int):
+    """Park a failed email in the dead-letter table for manual replay."""
+    from .models import DeadLetterEmail
+
+    return DeadLetterEmail.objects.create(
+        event_type=task_kwargs["event_type"],
+        to_email=task_kwargs["to_email"],
+        task_kwargs=task_kwargs,
+        exception_type=f"{type(exc).__module__}.{type(exc).__qualname__}",
+        error=str(exc),
+        attempts=attempts,
+    )
@@ -0,0 +1,51 @@
+"""In-app inbox helpers: unread counters and bulk mark-read."""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import Notification, UnreadCounter
+
+
+def _count_unread(user_id: int) -> int:
+    return Notification.objects.filter(user_id=user_id, read_at__isnull=True).count()
+
+
+def increment_unread(user_id: int, by: int = 1):
+    """Bump the user's unread counter; the first call seeds it from the table."""
+    if UnreadCounter.objects.filter(user_id=user_id).update(unread=F("unread") + by):
+        return
+    try:
+        with transaction.atomic():
+            UnreadCounter.objects.create(user_id=user_id, unread=_count_unread(user_id))
+    except IntegrityError:
+        # Created concurrently; fall back to a plain increment
+        UnreadCounter.objects.filter(user_id=user_id).update(unread=F("unread") + by)
+
+
+def get_unread_count(user_id: int) -> int:
+    """Return cached unread count (seeds the counter on first access)."""
+    unread = UnreadCounter.objects.filter(user_id=user_id).values_list("unread", flat=True).first()
+    if unread is not None:
+        return unread
+    counter, _ = UnreadCounter.objects.get_or_create(
+        user_id=user_id, defaults={"unread": _count_unread(user_id)}
+    )
+    return counter.unread
+
+
+def mark_read(user_id: int, up_to_id: int | None = None, ids: list[int] | None = None) -> int:
+    """
+    Mark the user's unread notifications as read with one UPDATE.
+    Limits to id <= up_to_id and/or the given ids. Returns number of rows marked.
+    """
+    qs = Notification.objects.filter(user_id=user_id, read_at__isnull=True)
+    if up_to_id is not None:
+        qs = qs.filter(id__lte=up_to_id)
+    if ids is not None:
+        qs = qs.filter(id__in=ids)
+    with transaction.atomic():
+        marked = qs.update(read_at=timezone.now())
+        if marked:
+            UnreadCounter.objects.filter(user_id=user_id).update(unread=Greatest(F("unread") - marked, 0))
+    return marked
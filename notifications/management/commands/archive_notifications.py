@@ -0,0 +1,32 @@
+"""Archive and delete old notifications and email logs."""
+from django.core.management.base import BaseCommand
+
+from notifications.archive import ARCHIVED_TABLES, archive_dir, archive_old_rows
+
+
+class Command(BaseCommand):
+    help = "Move notifications/email logs older than N days to compressed NDJSON archives"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Retention in days (default NOTIFICATION_RETENTION_DAYS)")
+        parser.add_argument("--chunk-size", type=int, help="Rows per batch (default ARCHIVE_CHUNK_SIZE)")
+        parser.add_argument(
+            "--table",
+            action="append",
+            choices=list(ARCHIVED_TABLES),
+            help="Limit to a table (repeatable; default all)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would be archived")
+
+    def handle(self, *args, **options):
+        results = archive_old_rows(
+            days=options["days"],
+            chunk_size=options["chunk_size"],
+            tables=options["table"],
+            dry_run=options["dry_run"],
+        )
+        verb = "would archive" if options["dry_run"] else "archived"
+        for table, count in results.items():
+            self.stdout.write(f"  {table}: {verb} {count} rows")
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Archives written to {archive_dir()}"))
@@ -0,0 +1,43 @@
+"""Re-queue emails from the dead-letter table."""
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ejournal.celery import QUEUE_BULK
+from notifications.models import DeadLetterEmail
+from notifications.tasks import send_notification_email
+
+
+class Command(BaseCommand):
+    help = "Re-queue dead-lettered emails (not yet replayed) through send_notification_email"
+
+    def add_arguments(self, parser):
+        parser.add_argument("ids", nargs="*", type=int, help="Dead letter ids (default: all pending)")
+        parser.add_argument("--event-type", help="Only replay this event type")
+        parser.add_argument("--limit", type=int, help="Replay at most N letters, oldest first")
+        parser.add_argument("--dry-run", action="store_true", help="Only list what would be replayed")
+
+    def handle(self, *args, **options):
+        letters = DeadLetterEmail.objects.filter(replayed_at__isnull=True).order_by("created_at", "id")
+        if options["ids"]:
+            letters = letters.filter(id__in=options["ids"])
+        if options["event_type"]:
+            letters = letters.filter(event_type=options["event_type"])
+        if options["limit"] is not None:
+            if options["limit"] < 1:
+                raise CommandError("--limit must be positive")
+            letters = letters[: options["limit"]]
+
+        replayed = 0
+        for letter in letters:
+            self.stdout.write(f"  #{letter.id} {letter.event_type} -> {letter.to_email} ({letter.exception_type})")
+            if options["dry_run"]:
+                continue
+            # Replays are a bulk sweep; keep them off the transactional queue
+            send_notification_email.apply_async(kwargs=letter.task_kwargs, queue=QUEUE_BULK)
+            DeadLetterEmail.objects.filter(id=letter.id).update(replayed_at=timezone.now())
+            replayed += 1
+
+        if options["dry_run"]:
+            self.stdout.write("Dry run: nothing queued")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Re-queued {replayed} emails"))
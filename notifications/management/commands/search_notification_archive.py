@@ -0,0 +1,40 @@
+"""Search archived notifications and email logs."""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from notifications.archive import ARCHIVED_TABLES, search_archive
+
+
+class Command(BaseCommand):
+    help = "Search notification/email log archives; prints matching rows as NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("table", choices=list(ARCHIVED_TABLES))
+        parser.add_argument("--to-email", help="Exact recipient (emaillog)")
+        parser.add_argument("--user-id", type=int, help="Exact user id (notification)")
+        parser.add_argument("--event-type", help="Exact event type (notification)")
+        parser.add_argument("--contains", default="", help="Substring in subject/body/payload")
+        parser.add_argument("--since", help="ISO datetime, inclusive")
+        parser.add_argument("--until", help="ISO datetime, exclusive")
+        parser.add_argument("--limit", type=int, default=100)
+
+    def handle(self, *args, **options):
+        since = parse_datetime(options["since"]) if options["since"] else None
+        until = parse_datetime(options["until"]) if options["until"] else None
+        if (options["since"] and not since) or (options["until"] and not until):
+            raise CommandError("--since/--until must be ISO datetimes, e.g. 2025-01-31T00:00:00+00:00")
+
+        filters = {
+            field: options[opt]
+            for opt, field in (("to_email", "to_email"), ("user_id", "user_id"), ("event_type", "event_type"))
+            if options[opt] is not None
+        }
+        shown = 0
+        for row in search_archive(options["table"], since=since, until=until, contains=options["contains"], **filters):
+            self.stdout.write(json.dumps(row))
+            shown += 1
+            if shown >= options["limit"]:
+                break
+        self.stderr.write(f"{shown} row(s)")
@@ -0,0 +1,54 @@
+"""Add digest event type and pending digest items."""
+from django.conf import settings
+from django.db import migrations, models
+
+EVENT_CHOICES = [
+    ("submission_submitted", "Submission Submitted"),
+    ("status_changed", "Status Changed"),
+    ("reviewer_invited", "Reviewer Invited"),
+    ("reviewer_accepted", "Reviewer Accepted"),
+    ("reviewer_declined", "Reviewer Declined"),
+    ("review_submitted", "Review Submitted"),
+    ("revision_requested", "Revision Requested"),
+    ("submission_accepted", "Submission Accepted"),
+    ("submission_rejected", "Submission Rejected"),
+    ("submission_published", "Submission Published"),
+    ("review_reminder", "Review Reminder"),
+    ("digest", "Digest"),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("notifications", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notification",
+            name="event_type",
+            field=models.CharField(choices=EVENT_CHOICES, max_length=50),
+        ),
+        migrations.CreateModel(
+            name="PendingDigestItem",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("frequency", models.CharField(max_length=20)),
+                ("event_type", models.CharField(choices=EVENT_CHOICES, max_length=50)),
+                ("subject", models.CharField(max_length=500)),
+                ("body", models.TextField(blank=True)),
+                ("payload", models.JSONField(default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("user", models.ForeignKey(on_delete=models.CASCADE, related_name="pending_digest_items", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "notifications_pending_digest_item",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="pendingdigestitem",
+            index=models.Index(fields=["frequency", "user", "created_at"], name="notif_digest_freq_user_idx"),
+        ),
+    ]
@@ -0,0 +1,35 @@
+"""Add coalescing buffer for status change notifications."""
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("notifications", "0002_pendingdigestitem"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CoalescedStatusChange",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("recipient_email", models.EmailField(max_length=254)),
+                ("submission_id", models.BigIntegerField()),
+                ("old_status", models.CharField(max_length=30)),
+                ("new_status", models.CharField(max_length=30)),
+                ("transitions", models.PositiveIntegerField(default=1)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=models.CASCADE, related_name="coalesced_status_changes", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "db_table": "notifications_coalesced_status_change",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="coalescedstatuschange",
+            constraint=models.UniqueConstraint(fields=("recipient_email", "submission_id"), name="notif_coalesce_recipient_submission_uniq"),
+        ),
+    ]
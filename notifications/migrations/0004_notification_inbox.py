@@ -0,0 +1,44 @@
+"""Add inbox fields, indexes and unread counters to notifications."""
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("notifications", "0003_coalescedstatuschange"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="read_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["user", "-created_at"], name="notif_user_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(condition=models.Q(read_at__isnull=True), fields=["user", "id"], name="notif_user_unread_idx"),
+        ),
+        migrations.CreateModel(
+            name="UnreadCounter",
+            fields=[
+                ("user", models.OneToOneField(on_delete=models.CASCADE, primary_key=True, related_name="unread_counter", serialize=False, to=settings.AUTH_USER_MODEL)),
+                ("unread", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "notifications_unread_counter",
+            },
+        ),
+    ]
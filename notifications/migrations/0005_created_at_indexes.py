@@ -0,0 +1,20 @@
+"""Index created_at on notifications and email logs for retention scans."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0004_notification_inbox"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["created_at"], name="notif_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="emaillog",
+            index=models.Index(fields=["created_at"], name="notif_emaillog_created_idx"),
+        ),
+    ]
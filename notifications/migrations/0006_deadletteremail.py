@@ -0,0 +1,47 @@
+"""Dead-letter table for emails that exhausted their retries."""
+from django.db import migrations, models
+
+EVENT_CHOICES = [
+    ("submission_submitted", "Submission Submitted"),
+    ("status_changed", "Status Changed"),
+    ("reviewer_invited", "Reviewer Invited"),
+    ("reviewer_accepted", "Reviewer Accepted"),
+    ("reviewer_declined", "Reviewer Declined"),
+    ("review_submitted", "Review Submitted"),
+    ("revision_requested", "Revision Requested"),
+    ("submission_accepted", "Submission Accepted"),
+    ("submission_rejected", "Submission Rejected"),
+    ("submission_published", "Submission Published"),
+    ("review_reminder", "Review Reminder"),
+    ("digest", "Digest"),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0005_created_at_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeadLetterEmail",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("event_type", models.CharField(choices=EVENT_CHOICES, max_length=50)),
+                ("to_email", models.EmailField(max_length=254)),
+                ("task_kwargs", models.JSONField(default=dict)),
+                ("exception_type", models.CharField(max_length=255)),
+                ("error", models.TextField(blank=True)),
+                ("attempts", models.PositiveIntegerField(default=1)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("replayed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "notifications_dead_letter_email",
+                "indexes": [
+                    models.Index(fields=["replayed_at", "created_at"], name="notif_deadletter_pending_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+"""Indexed submission_id on notifications, backfilled from payloads."""
+from django.db import migrations, models
+
+BATCH = 1000
+
+
+def backfill_submission_id(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+    ReviewAssignment = apps.get_model("reviews", "ReviewAssignment")
+    last_id = 0
+    while True:
+        batch = list(Notification.objects.filter(id__gt=last_id).order_by("id").only("id", "payload")[:BATCH])
+        if not batch:
+            break
+        assignment_ids = {
+            n.payload["assignment_id"]
+            for n in batch
+            if isinstance(n.payload, dict) and "submission_id" not in n.payload and n.payload.get("assignment_id")
+        }
+        by_assignment = dict(
+            ReviewAssignment.objects.filter(id__in=assignment_ids).values_list("id", "submission_id")
+        )
+        changed = []
+        for n in batch:
+            payload = n.payload if isinstance(n.payload, dict) else {}
+            n.submission_id = payload.get("submission_id") or by_assignment.get(payload.get("assignment_id"))
+            if n.submission_id:
+                changed.append(n)
+        Notification.objects.bulk_update(changed, ["submission_id"])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0006_deadletteremail"),
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="submission_id",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_submission_id, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["submission_id", "-created_at"], name="notif_submission_created_idx"),
+        ),
+    ]
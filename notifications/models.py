@@ -15,6 +15,7 @@ EVENT_SUBMISSION_ACCEPTED = "submission_accepted"
 EVENT_SUBMISSION_REJECTED = "submission_rejected"
 EVENT_SUBMISSION_PUBLISHED = "submission_published"
 EVENT_REVIEW_REMINDER = "review_reminder"
+EVENT_DIGEST = "digest"
 
 EVENT_CHOICES = [
     (EVENT_SUBMISSION_SUBMITTED, "Submission Submitted"),
@@ -28,8 +29,12 @@ EVENT_CHOICES = [
     (EVENT_SUBMISSION_REJECTED, "Submission Rejected"),
     (EVENT_SUBMISSION_PUBLISHED, "Submission Published"),
     (EVENT_REVIEW_REMINDER, "Review Reminder"),
+    (EVENT_DIGEST, "Digest"),
 ]
 
+# Events that users may receive batched into an hourly/daily digest
+DIGEST_EVENT_TYPES = {EVENT_REVIEWER_ACCEPTED, EVENT_REVIEW_SUBMITTED, EVENT_STATUS_CHANGED}
+
 STATUS_QUEUED = "queued"
 STATUS_SENT = "sent"
 STATUS_FAILED = "failed"
@@ -53,6 +58,8 @@ class Notification(models.Model):
     )
     event_type = models.CharField(max_length=50, choices=EVENT_CHOICES)
     payload = models.JSONField(default=dict)
+    # Copied from payload (or resolved from payload.assignment_id) for indexed per-submission lookups
+    submission_id = models.BigIntegerField(null=True, blank=True)
     sent_at = models.DateTimeField(null=True, blank=True)
     status = models.CharField(
         max_length=20,
@@ -60,14 +67,41 @@ class Notification(models.Model):
         default=STATUS_QUEUED,
     )
     idempotency_key = models.CharField(max_length=128, blank=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "notifications_notification"
         indexes = [
             models.Index(fields=["event_type", "idempotency_key"]),
+            models.Index(fields=["created_at"], name="notif_created_idx"),
+            # Inbox keyset pagination and unread filtering
+            models.Index(fields=["user", "-created_at"], name="notif_user_created_idx"),
+            models.Index(
+                fields=["user", "id"],
+                condition=models.Q(read_at__isnull=True),
+                name="notif_user_unread_idx",
+            ),
+            # Submission activity timeline
+            models.Index(fields=["submission_id", "-created_at"], name="notif_submission_created_idx"),
         ]
 
 
+class UnreadCounter(models.Model):
+    """Per-user unread notification count, maintained by increments instead of COUNT(*)."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="unread_counter",
+    )
+    unread = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "notifications_unread_counter"
+
+
 class EmailLog(models.Model):
     """Log of sent email for audit and debugging."""
 
@@ -81,3 +115,81 @@ class EmailLog(models.Model):
 
     class Meta:
         db_table = "notifications_email_log"
+        indexes = [
+            models.Index(fields=["created_at"], name="notif_emaillog_created_idx"),
+        ]
+
+
+class PendingDigestItem(models.Model):
+    """Event held for a digest user until the periodic digest task sends it."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pending_digest_items",
+    )
+    frequency = models.CharField(max_length=20)  # accounts.models.DIGEST_HOURLY / DIGEST_DAILY
+    event_type = models.CharField(max_length=50, choices=EVENT_CHOICES)
+    subject = models.CharField(max_length=500)
+    body = models.TextField(blank=True)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "notifications_pending_digest_item"
+        indexes = [
+            models.Index(fields=["frequency", "user", "created_at"], name="notif_digest_freq_user_idx"),
+        ]
+
+
+class CoalescedStatusChange(models.Model):
+    """
+    Status change held for the coalescing window, one row per (recipient, submission).
+    Later transitions update new_status; the flush task sends a single summary.
+    """
+
+    recipient_email = models.EmailField()
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="coalesced_status_changes",
+        null=True,
+        blank=True,
+    )
+    submission_id = models.BigIntegerField()
+    old_status = models.CharField(max_length=30)
+    new_status = models.CharField(max_length=30)
+    transitions = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "notifications_coalesced_status_change"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recipient_email", "submission_id"],
+                name="notif_coalesce_recipient_submission_uniq",
+            ),
+        ]
+
+
+class DeadLetterEmail(models.Model):
+    """
+    Email that exhausted its retries or failed permanently.
+    task_kwargs holds the send_notification_email arguments so it can be replayed.
+    """
+
+    event_type = models.CharField(max_length=50, choices=EVENT_CHOICES)
+    to_email = models.EmailField()
+    task_kwargs = models.JSONField(default=dict)
+    exception_type = models.CharField(max_length=255)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    replayed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "notifications_dead_letter_email"
+        indexes = [
+            models.Index(fields=["replayed_at", "created_at"], name="notif_deadletter_pending_idx"),
+        ]
@@ -0,0 +1,93 @@
+"""
+Email template registry.
+
+Each event type has a subject template here and body templates at
+templates/notifications/email/<event_type>.txt (plain text, required) and .html
+(optional). Templates are compiled once per process and reused; render_many
+renders a fan-out event for many recipients against the same compiled templates.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.template import Context, TemplateDoesNotExist, engines
+from django.template.loader import get_template
+
+from .models import (
+    EVENT_DIGEST,
+    EVENT_REVIEW_REMINDER,
+    EVENT_REVIEW_SUBMITTED,
+    EVENT_REVIEWER_ACCEPTED,
+    EVENT_REVIEWER_DECLINED,
+    EVENT_REVIEWER_INVITED,
+    EVENT_REVISION_REQUESTED,
+    EVENT_STATUS_CHANGED,
+    EVENT_SUBMISSION_ACCEPTED,
+    EVENT_SUBMISSION_PUBLISHED,
+    EVENT_SUBMISSION_REJECTED,
+    EVENT_SUBMISSION_SUBMITTED,
+)
+
+SUBJECTS = {
+    EVENT_SUBMISSION_SUBMITTED: "Your submission has been received",
+    EVENT_STATUS_CHANGED: "Submission status update: {{ new_status }}",
+    EVENT_REVIEWER_INVITED: 'Review invitation: {{ submission_title|slice:":50" }}',
+    EVENT_REVIEWER_ACCEPTED: 'Reviewer accepted: {{ submission_title|slice:":50" }}',
+    EVENT_REVIEWER_DECLINED: 'Reviewer declined: {{ submission_title|slice:":50" }}',
+    EVENT_REVIEW_SUBMITTED: 'Review submitted: {{ submission_title|slice:":50" }}',
+    EVENT_REVISION_REQUESTED: "Revision requested for your submission",
+    EVENT_SUBMISSION_ACCEPTED: "Your submission has been accepted",
+    EVENT_SUBMISSION_REJECTED: "Update on your submission",
+    EVENT_SUBMISSION_PUBLISHED: "Your submission has been published",
+    EVENT_REVIEW_REMINDER: 'Reminder: Review due for submission - {{ submission_title|slice:":50" }}',
+    EVENT_DIGEST: "Your {{ frequency }} journal digest: {{ items|length }} update{{ items|length|pluralize }}",
+}
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """Rendered subject, plain-text body and optional HTML body."""
+
+    subject: str
+    body: str
+    html_body: str | None = None
+
+
+@lru_cache(maxsize=None)
+def _compiled(event_type: str):
+    """Return compiled (subject, text, html) templates for an event type; cached per process."""
+    if event_type not in SUBJECTS:
+        raise KeyError(f"No email template registered for event type: {event_type}")
+    subject = engines["django"].from_string(SUBJECTS[event_type]).template
+    text = get_template(f"notifications/email/{event_type}.txt").template
+    try:
+        html = get_template(f"notifications/email/{event_type}.html").template
+    except TemplateDoesNotExist:
+        html = None
+    return subject, text, html
+
+
+def render_many(event_type: str, contexts, shared: dict | None = None) -> list[RenderedEmail]:
+    """
+    Render one email per context dict in a single pass.
+    shared holds values common to all recipients; per-recipient contexts are
+    pushed on top of it so nothing is re-parsed or re-copied between recipients.
+    """
+    subject_tpl, text_tpl, html_tpl = _compiled(event_type)
+    plain = Context(dict(shared or {}), autoescape=False)
+    html = Context(dict(shared or {}))
+    rendered = []
+    for ctx in contexts:
+        with plain.push(ctx):
+            subject = " ".join(subject_tpl.render(plain).split())
+            body = text_tpl.render(plain).strip()
+        html_body = None
+        if html_tpl is not None:
+            with html.push(ctx, subject=subject):
+                html_body = html_tpl.render(html)
+        rendered.append(RenderedEmail(subject=subject, body=body, html_body=html_body))
+    return rendered
+
+
+def render_email(event_type: str, context: dict) -> RenderedEmail:
+    """Render a single email for event_type."""
+    return render_many(event_type, [context])[0]
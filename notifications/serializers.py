@@ -0,0 +1,25 @@
+"""Notification serializers."""
+from rest_framework import serializers
+
+from .models import Notification
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    """Serializer for in-app inbox items."""
+
+    class Meta:
+        model = Notification
+        fields = ["id", "event_type", "payload", "status", "created_at", "read_at"]
+        read_only_fields = fields
+
+
+class MarkReadSerializer(serializers.Serializer):
+    """Serializer for mark-read: everything, everything up to an id, or explicit ids."""
+
+    up_to_id = serializers.IntegerField(required=False, min_value=1)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=500,
+    )
@@ -1,15 +1,109 @@
 """Notification trigger helpers. Call these from views/signals to queue emails."""
-from .tasks import send_notification_email, send_review_reminder
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import (
+    DIGEST_EVENT_TYPES,
+    EVENT_REVIEW_SUBMITTED,
+    EVENT_REVIEWER_ACCEPTED,
+    EVENT_REVIEWER_DECLINED,
+    EVENT_REVIEWER_INVITED,
+    EVENT_REVISION_REQUESTED,
+    EVENT_STATUS_CHANGED,
+    EVENT_SUBMISSION_ACCEPTED,
+    EVENT_SUBMISSION_PUBLISHED,
+    EVENT_SUBMISSION_REJECTED,
+    EVENT_SUBMISSION_SUBMITTED,
+    CoalescedStatusChange,
+    PendingDigestItem,
+)
+from .rendering import RenderedEmail, render_email, render_many
+from .tasks import flush_status_change, send_notification_email, send_review_reminder
+
+
+def _editor_recipients(editor_emails: list[str]):
+    """Resolve editor emails to (email, user_id, digest preference) in one query."""
+    from accounts.models import DIGEST_IMMEDIATE, User
+
+    found = {
+        email: (user_id, digest)
+        for email, user_id, digest in User.objects.filter(email__in=editor_emails).values_list(
+            "email", "id", "notification_digest"
+        )
+    }
+    return [(email, *found.get(email, (None, DIGEST_IMMEDIATE))) for email in editor_emails]
+
+
+def _dispatch(
+    event_type: str,
+    user_id: int | None,
+    to_email: str,
+    email: RenderedEmail,
+    payload: dict,
+    idempotency_key: str | None = None,
+    digest: str | None = None,
+):
+    """
+    Queue an email now, or hold it for the user's hourly/daily digest.
+    Pass digest when the caller already knows the recipient's preference.
+    """
+    from accounts.models import DIGEST_IMMEDIATE, User
+
+    if event_type in DIGEST_EVENT_TYPES and user_id:
+        if digest is None:
+            digest = User.objects.filter(id=user_id).values_list("notification_digest", flat=True).first()
+        if digest and digest != DIGEST_IMMEDIATE:
+            PendingDigestItem.objects.create(
+                user_id=user_id,
+                frequency=digest,
+                event_type=event_type,
+                subject=email.subject,
+                body=email.body,
+                payload=payload,
+            )
+            return
+    send_notification_email.delay(
+        event_type=event_type,
+        user_id=user_id,
+        to_email=to_email,
+        subject=email.subject,
+        body=email.body,
+        html_body=email.html_body,
+        payload=payload,
+        idempotency_key=idempotency_key,
+    )
+
+
+def _dispatch_to_editors(event_type: str, editor_emails: list[str], context: dict, payload: dict):
+    """Render a fan-out event for all editors in one pass and dispatch each copy."""
+    recipients = _editor_recipients(editor_emails)
+    rendered = render_many(event_type, ({"recipient_email": r[0]} for r in recipients), shared=context)
+    for (email, user_id, digest), message in zip(recipients, rendered):
+        _dispatch(event_type, user_id, email, message, payload, digest=digest)
+
+
+def _send(event_type: str, user_id: int | None, to_email: str, context: dict, payload: dict):
+    """Render and queue a single-recipient email."""
+    message = render_email(event_type, context)
+    send_notification_email.delay(
+        event_type=event_type,
+        user_id=user_id,
+        to_email=to_email,
+        subject=message.subject,
+        body=message.body,
+        html_body=message.html_body,
+        payload=payload,
+    )
 
 
 def queue_submission_submitted(submission_id: int, author_email: str, author_id: int):
     """Queue email when submission is submitted."""
-    send_notification_email.delay(
-        event_type="submission_submitted",
-        user_id=author_id,
-        to_email=author_email,
-        subject="Your submission has been received",
-        body=f"Your submission (ID: {submission_id}) has been received and is under review.",
+    _send(
+        EVENT_SUBMISSION_SUBMITTED,
+        author_id,
+        author_email,
+        {"submission_id": submission_id},
         payload={"submission_id": submission_id},
     )
 
@@ -22,91 +116,144 @@ def queue_status_changed(
     recipient_id: int | None,
     idempotency_key: str,
 ):
-    """Queue status change email (idempotent)."""
-    send_notification_email.delay(
-        event_type="status_changed",
-        user_id=recipient_id,
-        to_email=recipient_email,
-        subject=f"Submission status update: {new_status}",
-        body=f"Submission {submission_id} status changed from {old_status} to {new_status}.",
-        payload={"submission_id": submission_id, "old_status": old_status, "new_status": new_status},
+    """
+    Queue status change email (idempotent).
+    With NOTIFICATION_STATUS_COALESCE_SECONDS > 0 the change is held per
+    (recipient, submission); transitions arriving within the window replace it and
+    only the final old -> new summary is sent.
+    """
+    window = getattr(settings, "NOTIFICATION_STATUS_COALESCE_SECONDS", 0)
+    if window <= 0:
+        _dispatch_status_changed(
+            submission_id, old_status, new_status, recipient_email, recipient_id, idempotency_key
+        )
+        return
+
+    with transaction.atomic():
+        pending, created = CoalescedStatusChange.objects.select_for_update().get_or_create(
+            recipient_email=recipient_email,
+            submission_id=submission_id,
+            defaults={
+                "user_id": recipient_id,
+                "old_status": old_status,
+                "new_status": new_status,
+            },
+        )
+        if not created:
+            pending.new_status = new_status
+            pending.transitions = F("transitions") + 1
+            pending.save(update_fields=["new_status", "transitions", "updated_at"])
+    if created:
+        flush_status_change.apply_async(args=[pending.id], countdown=window)
+
+
+def _dispatch_status_changed(
+    submission_id: int,
+    old_status: str,
+    new_status: str,
+    recipient_email: str,
+    recipient_id: int | None,
+    idempotency_key: str,
+    transitions: int = 1,
+):
+    """Build and dispatch the status change email (immediate or digest)."""
+    payload = {"submission_id": submission_id, "old_status": old_status, "new_status": new_status}
+    message = render_email(EVENT_STATUS_CHANGED, payload)
+    if transitions > 1:
+        payload["transitions"] = transitions
+    _dispatch(
+        EVENT_STATUS_CHANGED,
+        recipient_id,
+        recipient_email,
+        message,
+        payload,
         idempotency_key=idempotency_key,
     )
 
 
+def send_coalesced_status_change(pending_id: int):
+    """Send the summary for a coalesced status change once its window has elapsed."""
+    with transaction.atomic():
+        pending = CoalescedStatusChange.objects.select_for_update().filter(id=pending_id).first()
+        if not pending:
+            return {"status": "skipped", "reason": "already_flushed"}
+        pending.delete()
+
+    if pending.old_status == pending.new_status:
+        return {"status": "skipped", "reason": "no_net_change"}
+    _dispatch_status_changed(
+        pending.submission_id,
+        pending.old_status,
+        pending.new_status,
+        pending.recipient_email,
+        pending.user_id,
+        idempotency_key=f"status_{pending.submission_id}_{pending.old_status}_{pending.new_status}",
+        transitions=pending.transitions,
+    )
+    return {"status": "queued", "transitions": pending.transitions}
+
+
 def queue_reviewer_invited(assignment_id: int, to_email: str, submission_title: str):
     """Queue reviewer invitation email."""
-    send_notification_email.delay(
-        event_type="reviewer_invited",
-        user_id=None,
-        to_email=to_email,
-        subject=f"Review invitation: {submission_title[:50]}",
-        body=f"You have been invited to review the submission: {submission_title}. Please log in to accept or decline.",
+    _send(
+        EVENT_REVIEWER_INVITED,
+        None,
+        to_email,
+        {"submission_title": submission_title},
         payload={"assignment_id": assignment_id},
     )
 
 
 def queue_reviewer_accepted(assignment_id: int, editor_emails: list[str], submission_title: str):
     """Queue email to editors when reviewer accepts."""
-    for email in editor_emails:
-        send_notification_email.delay(
-            event_type="reviewer_accepted",
-            user_id=None,
-            to_email=email,
-            subject=f"Reviewer accepted: {submission_title[:50]}",
-            body=f"A reviewer has accepted the invitation for submission: {submission_title}.",
-            payload={"assignment_id": assignment_id},
-        )
+    _dispatch_to_editors(
+        EVENT_REVIEWER_ACCEPTED,
+        editor_emails,
+        {"submission_title": submission_title},
+        payload={"assignment_id": assignment_id},
+    )
 
 
 def queue_reviewer_declined(assignment_id: int, editor_emails: list[str], submission_title: str):
     """Queue email to editors when reviewer declines."""
-    for email in editor_emails:
-        send_notification_email.delay(
-            event_type="reviewer_declined",
-            user_id=None,
-            to_email=email,
-            subject=f"Reviewer declined: {submission_title[:50]}",
-            body=f"A reviewer has declined the invitation for submission: {submission_title}.",
-            payload={"assignment_id": assignment_id},
-        )
+    _dispatch_to_editors(
+        EVENT_REVIEWER_DECLINED,
+        editor_emails,
+        {"submission_title": submission_title},
+        payload={"assignment_id": assignment_id},
+    )
 
 
 def queue_review_submitted(submission_id: int, editor_emails: list[str], submission_title: str):
     """Queue email when review is submitted."""
-    for email in editor_emails:
-        send_notification_email.delay(
-            event_type="review_submitted",
-            user_id=None,
-            to_email=email,
-            subject=f"Review submitted: {submission_title[:50]}",
-            body=f"A review has been submitted for: {submission_title}.",
-            payload={"submission_id": submission_id},
-        )
+    _dispatch_to_editors(
+        EVENT_REVIEW_SUBMITTED,
+        editor_emails,
+        {"submission_title": submission_title},
+        payload={"submission_id": submission_id},
+    )
 
 
 def queue_revision_requested(
     submission_id: int, author_email: str, author_id: int, decision_letter: str
 ):
     """Queue email when revision is requested."""
-    send_notification_email.delay(
-        event_type="revision_requested",
-        user_id=author_id,
-        to_email=author_email,
-        subject="Revision requested for your submission",
-        body=f"Revision has been requested for your submission (ID: {submission_id}).\n\n{decision_letter}",
+    _send(
+        EVENT_REVISION_REQUESTED,
+        author_id,
+        author_email,
+        {"submission_id": submission_id, "decision_letter": decision_letter},
         payload={"submission_id": submission_id},
     )
 
 
 def queue_submission_accepted(submission_id: int, author_email: str, author_id: int):
     """Queue email when submission is accepted."""
-    send_notification_email.delay(
-        event_type="submission_accepted",
-        user_id=author_id,
-        to_email=author_email,
-        subject="Your submission has been accepted",
-        body=f"Congratulations! Your submission (ID: {submission_id}) has been accepted.",
+    _send(
+        EVENT_SUBMISSION_ACCEPTED,
+        author_id,
+        author_email,
+        {"submission_id": submission_id},
         payload={"submission_id": submission_id},
     )
 
@@ -115,24 +262,22 @@ def queue_submission_rejected(
     submission_id: int, author_email: str, author_id: int, decision_letter: str
 ):
     """Queue email when submission is rejected."""
-    send_notification_email.delay(
-        event_type="submission_rejected",
-        user_id=author_id,
-        to_email=author_email,
-        subject="Update on your submission",
-        body=f"Your submission (ID: {submission_id}) was not accepted.\n\n{decision_letter}",
+    _send(
+        EVENT_SUBMISSION_REJECTED,
+        author_id,
+        author_email,
+        {"submission_id": submission_id, "decision_letter": decision_letter},
         payload={"submission_id": submission_id},
     )
 
 
 def queue_submission_published(submission_id: int, author_email: str, author_id: int):
     """Queue email when submission is published."""
-    send_notification_email.delay(
-        event_type="submission_published",
-        user_id=author_id,
-        to_email=author_email,
-        subject="Your submission has been published",
-        body=f"Your submission (ID: {submission_id}) has been published.",
+    _send(
+        EVENT_SUBMISSION_PUBLISHED,
+        author_id,
+        author_email,
+        {"submission_id": submission_id},
         payload={"submission_id": submission_id},
     )
 
@@ -1,9 +1,26 @@
 """Celery tasks for email notifications."""
+import random
+from itertools import groupby
+from operator import attrgetter
+
 from celery import shared_task
 from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import Max
 from django.utils import timezone
 
-from .models import EmailLog, Notification, STATUS_FAILED, STATUS_SENT
+from .delivery import DEFAULT_POLICY, dead_letter, email_circuit, retry_policy_for
+from .inbox import increment_unread
+from .models import (
+    EVENT_DIGEST,
+    EVENT_REVIEW_REMINDER,
+    EmailLog,
+    Notification,
+    PendingDigestItem,
+    STATUS_FAILED,
+    STATUS_SENT,
+)
+from .rendering import render_email
 
 
 def get_email_backend():
@@ -16,12 +33,37 @@ def get_email_backend():
     return SMTPBackend()
 
 
-@shared_task(
-    bind=True,
-    max_retries=5,
-    default_retry_delay=60,
-    autoretry_for=(Exception,),
-)
+def _submission_id_for(payload: dict) -> int | None:
+    """Submission a notification belongs to: payload.submission_id, else via payload.assignment_id."""
+    if payload.get("submission_id"):
+        return payload["submission_id"]
+    if payload.get("assignment_id"):
+        from reviews.models import ReviewAssignment
+
+        return (
+            ReviewAssignment.objects.filter(id=payload["assignment_id"])
+            .values_list("submission_id", flat=True)
+            .first()
+        )
+    return None
+
+
+def _retry_or_dead_letter(task, task_kwargs: dict, exc: Exception, policy):
+    """Schedule the next attempt under policy; dead-letter when permanent (policy None) or exhausted."""
+    if policy is None or task.request.retries >= policy.max_retries:
+        if task.request.called_directly:
+            raise exc
+        letter = dead_letter(task_kwargs, exc, attempts=task.request.retries + 1)
+        return {"status": "dead_lettered", "dead_letter_id": letter.id}
+    raise task.retry(
+        exc=exc,
+        kwargs=task_kwargs,
+        countdown=policy.countdown(task.request.retries),
+        max_retries=policy.max_retries,
+    )
+
+
+@shared_task(bind=True)
 def send_notification_email(
     self,
     event_type: str,
@@ -31,69 +73,123 @@ def send_notification_email(
     body: str,
     payload: dict | None = None,
     idempotency_key: str | None = None,
+    html_body: str | None = None,
+    notification_id: int | None = None,
+    email_log_id: int | None = None,
 ):
     """
     Send notification email. Creates Notification and EmailLog records.
     Uses idempotency_key to avoid duplicate sends (e.g. for status_changed).
+    html_body, when given, is sent as the HTML alternative of the plain-text body.
+
+    Failures are retried with the backoff policy for their exception class
+    (see notifications.delivery); database errors while loading or creating the
+    records use DEFAULT_POLICY. Retries reuse the records of the first attempt
+    via notification_id/email_log_id. Permanent failures and exhausted retries
+    go to DeadLetterEmail. While the shared circuit breaker is open the send is
+    deferred without using up a retry.
     """
     from django.contrib.auth import get_user_model
 
     User = get_user_model()
     payload = payload or {}
 
-    # Idempotency check for status_changed
-    if idempotency_key:
-        existing = Notification.objects.filter(
-            event_type=event_type,
-            idempotency_key=idempotency_key,
-            status=STATUS_SENT,
-        ).exists()
-        if existing:
-            return {"status": "skipped", "reason": "idempotent"}
-
-    user = User.objects.filter(id=user_id).first() if user_id else None
-    notification = Notification.objects.create(
-        user=user,
-        event_type=event_type,
-        payload=payload,
-        status="queued",
-        idempotency_key=idempotency_key or "",
-    )
+    task_kwargs = {
+        "event_type": event_type,
+        "user_id": user_id,
+        "to_email": to_email,
+        "subject": subject,
+        "body": body,
+        "payload": payload,
+        "idempotency_key": idempotency_key,
+        "html_body": html_body,
+        "notification_id": notification_id,
+        "email_log_id": email_log_id,
+    }
 
-    email_log = EmailLog.objects.create(
-        to_email=to_email,
-        subject=subject,
-        body=body,
-        status="queued",
-    )
+    try:
+        # Idempotency check for status_changed
+        if idempotency_key:
+            existing = Notification.objects.filter(
+                event_type=event_type,
+                idempotency_key=idempotency_key,
+                status=STATUS_SENT,
+            ).exists()
+            if existing:
+                return {"status": "skipped", "reason": "idempotent"}
+
+        notification = Notification.objects.filter(id=notification_id).first() if notification_id else None
+        if notification is None:
+            user = User.objects.filter(id=user_id).first() if user_id else None
+            notification = Notification.objects.create(
+                user=user,
+                event_type=event_type,
+                payload=payload,
+                submission_id=_submission_id_for(payload),
+                status="queued",
+                idempotency_key=idempotency_key or "",
+            )
+            task_kwargs["notification_id"] = notification.id
+            if user:
+                increment_unread(user.id)
+
+        email_log = EmailLog.objects.filter(id=email_log_id).first() if email_log_id else None
+        if email_log is None:
+            email_log = EmailLog.objects.create(
+                to_email=to_email,
+                subject=subject,
+                body=body,
+                status="queued",
+            )
+            task_kwargs["email_log_id"] = email_log.id
+    except DatabaseError as e:
+        return _retry_or_dead_letter(self, task_kwargs, e, DEFAULT_POLICY)
+
+    # Eager (test) execution ignores countdowns, so deferring would spin
+    blocked_for = email_circuit.blocked_for()
+    if blocked_for and not self.request.is_eager:
+        self.apply_async(
+            kwargs=task_kwargs,
+            countdown=blocked_for + random.uniform(0, blocked_for),
+            retries=self.request.retries,
+        )
+        return {"status": "deferred", "reason": "circuit_open"}
 
     try:
         backend = get_email_backend()
-        provider_msg_id = backend.send(to_email, subject, body)
-        email_log.status = STATUS_SENT
-        email_log.provider_message_id = provider_msg_id or ""
-        email_log.save()
-        notification.status = STATUS_SENT
-        notification.sent_at = timezone.now()
-        notification.save()
-        return {"status": "sent", "notification_id": notification.id}
+        provider_msg_id = backend.send(to_email, subject, body, html_message=html_body)
     except Exception as e:
         email_log.status = STATUS_FAILED
         email_log.error = str(e)
         email_log.save()
         notification.status = STATUS_FAILED
         notification.save()
-        raise
+
+        policy = retry_policy_for(e)
+        if policy is not None:
+            email_circuit.record_failure()
+        return _retry_or_dead_letter(self, task_kwargs, e, policy)
+
+    email_circuit.record_success()
+    email_log.status = STATUS_SENT
+    email_log.provider_message_id = provider_msg_id or ""
+    email_log.save()
+    notification.status = STATUS_SENT
+    notification.sent_at = timezone.now()
+    notification.save()
+    return {"status": "sent", "notification_id": notification.id}
 
 
 @shared_task(
     bind=True,
     max_retries=5,
-    default_retry_delay=60,
     autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_backoff_max=900,
+    retry_jitter=True,
 )
 def send_review_reminder(self, assignment_id: int):
-    """Send review reminder email to reviewer."""
+    """Queue the review reminder email for the reviewer (delivery retries are handled there)."""
     from reviews.models import ReviewAssignment
 
     assignment = ReviewAssignment.objects.filter(id=assignment_id).select_related(
@@ -107,19 +203,84 @@ def send_review_reminder(self, assignment_id: int):
         return {"status": "skipped", "reason": "no_email"}
 
     submission = assignment.submission
-    subject = f"Reminder: Review due for submission - {submission.title[:50]}"
-    body = f"""You have a pending review for the submission "{submission.title}".
-
-Please submit your review by {assignment.due_date or 'the given deadline'}.
-
-Login to the journal system to access your assignments.
-"""
+    message = render_email(
+        EVENT_REVIEW_REMINDER,
+        {"submission_title": submission.title, "due_date": assignment.due_date},
+    )
 
-    return send_notification_email(
+    send_notification_email.delay(
         event_type="review_reminder",
         user_id=assignment.reviewer_id,
         to_email=to_email,
-        subject=subject,
-        body=body,
+        subject=message.subject,
+        body=message.body,
+        html_body=message.html_body,
         payload={"assignment_id": assignment_id, "submission_id": submission.id},
     )
+    return {"status": "queued", "assignment_id": assignment_id}
+
+
+@shared_task
+def flush_status_change(pending_id: int):
+    """Send the final summary of a coalesced status change (scheduled with countdown)."""
+    from .services import send_coalesced_status_change
+
+    return send_coalesced_status_change(pending_id)
+
+
+@shared_task
+def send_notification_digests(frequency: str):
+    """
+    Send one digest email per user with pending items for the given frequency.
+    Users are processed in chunks of NOTIFICATION_DIGEST_CHUNK_SIZE; items queued
+    while the task runs are left for the next run.
+    """
+    chunk_size = getattr(settings, "NOTIFICATION_DIGEST_CHUNK_SIZE", 500)
+    pending = PendingDigestItem.objects.filter(frequency=frequency)
+    max_id = pending.aggregate(max_id=Max("id"))["max_id"]
+    if max_id is None:
+        return {"status": "skipped", "reason": "nothing_pending"}
+    pending = pending.filter(id__lte=max_id)
+
+    sent = 0
+    last_user_id = 0
+    while True:
+        user_ids = list(
+            pending.filter(user_id__gt=last_user_id)
+            .order_by("user_id")
+            .values_list("user_id", flat=True)
+            .distinct()[:chunk_size]
+        )
+        if not user_ids:
+            break
+        items = (
+            pending.filter(user_id__in=user_ids)
+            .select_related("user")
+            .order_by("user_id", "created_at", "id")
+        )
+        for user_id, group in groupby(items, key=attrgetter("user_id")):
+            group = list(group)
+            message = render_email(EVENT_DIGEST, {"frequency": frequency, "items": group})
+            send_notification_email.delay(
+                event_type=EVENT_DIGEST,
+                user_id=user_id,
+                to_email=group[0].user.email,
+                subject=message.subject,
+                body=message.body,
+                html_body=message.html_body,
+                payload={"frequency": frequency, "count": len(group)},
+                idempotency_key=f"digest_{user_id}_{group[-1].id}",
+            )
+            sent += 1
+        pending.filter(user_id__in=user_ids).delete()
+        last_user_id = user_ids[-1]
+
+    return {"status": "sent", "digests": sent}
+
+
+@shared_task
+def archive_old_notifications():
+    """Periodic retention: archive notifications/email logs past NOTIFICATION_RETENTION_DAYS."""
+    from .archive import archive_old_rows
+
+    return archive_old_rows()
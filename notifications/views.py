@@ -0,0 +1,66 @@
+"""In-app notification inbox views."""
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ejournal.pagination import KeysetPagination
+
+from .inbox import get_unread_count, mark_read
+from .models import Notification
+from .serializers import MarkReadSerializer, NotificationSerializer
+
+
+class NotificationPagination(KeysetPagination):
+    """Newest first, backed by the (user, -created_at) index."""
+
+    page_size = 20
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+
+class NotificationListView(generics.ListAPIView):
+    """GET /api/notifications - Current user's inbox (?unread=true for unread only)."""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = NotificationSerializer
+    pagination_class = NotificationPagination
+
+    def get_queryset(self):
+        qs = Notification.objects.filter(user=self.request.user)
+        if self.request.query_params.get("unread") in ("1", "true"):
+            qs = qs.filter(read_at__isnull=True)
+        return qs
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data["unread_count"] = get_unread_count(request.user.id)
+        return response
+
+
+class UnreadCountView(APIView):
+    """GET /api/notifications/unread-count - Cached unread count for badge polling."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({"unread_count": get_unread_count(request.user.id)})
+
+
+class MarkReadView(APIView):
+    """POST /api/notifications/mark-read - Body: {} (all), {"up_to_id": N} or {"ids": [...]}."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = MarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        marked = mark_read(
+            request.user.id,
+            up_to_id=serializer.validated_data.get("up_to_id"),
+            ids=serializer.validated_data.get("ids"),
+        )
+        return Response(
+            {"marked": marked, "unread_count": get_unread_count(request.user.id)},
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,16 @@
+"""Index assignments by submission and invitation time for the activity timeline."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reviewassignment",
+            index=models.Index(fields=["submission", "-invited_at"], name="reviews_assign_sub_invited_idx"),
+        ),
+    ]
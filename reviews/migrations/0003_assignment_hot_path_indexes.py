@@ -0,0 +1,22 @@
+"""Index assignments for the reviewer list and the invite-reviewer duplicate check."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0002_assignment_submission_invited_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reviewassignment",
+            index=models.Index(fields=["reviewer", "status"], name="reviews_assign_rev_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reviewassignment",
+            index=models.Index(
+                fields=["submission", "submission_version", "invited_email"], name="reviews_assign_invite_dup_idx"
+            ),
+        ),
+    ]
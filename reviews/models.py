@@ -73,6 +73,16 @@ class ReviewAssignment(models.Model):
 
     class Meta:
         db_table = "reviews_assignment"
+        indexes = [
+            # Submission activity timeline
+            models.Index(fields=["submission", "-invited_at"], name="reviews_assign_sub_invited_idx"),
+            # Reviewer list (GET /api/reviewer/assignments?status=)
+            models.Index(fields=["reviewer", "status"], name="reviews_assign_rev_status_idx"),
+            # invite-reviewer duplicate check
+            models.Index(
+                fields=["submission", "submission_version", "invited_email"], name="reviews_assign_invite_dup_idx"
+            ),
+        ]
 
     def __str__(self):
         reviewer_str = self.reviewer.email if self.reviewer else self.invited_email
@@ -19,14 +19,20 @@ class ReviewAssignmentViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        return (
+        qs = (
             ReviewAssignment.objects
             .filter(reviewer=user)
             .select_related("submission", "submission_version")
         )
+        if self.action == "list":
+            status_filter = self.request.query_params.get("status")
+            if status_filter:
+                qs = qs.filter(status=status_filter)
+            qs = qs.order_by("-invited_at")
+        return qs
 
     def list(self, request, *args, **kwargs):
-        """GET /api/reviewer/assignments - List my assignments."""
+        """GET /api/reviewer/assignments?status= - List my assignments, newest first."""
         return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
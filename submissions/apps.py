@@ -8,3 +8,9 @@ class SubmissionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "submissions"
     verbose_name = "Submissions"
+
+    def ready(self):
+        from .models import TopicArea
+        from .reference import topic_areas
+
+        topic_areas.watch(TopicArea)
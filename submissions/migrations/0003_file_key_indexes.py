@@ -0,0 +1,24 @@
+"""Index stored file keys for the orphaned file GC."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0002_submission_editorial_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["manuscript_pdf"], name="submissions_manuscript_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submissionsupplementaryfile",
+            index=models.Index(fields=["file"], name="submissions_supp_file_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submissionversion",
+            index=models.Index(fields=["manuscript_pdf"], name="submissions_version_pdf_idx"),
+        ),
+    ]
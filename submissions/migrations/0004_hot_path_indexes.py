@@ -0,0 +1,28 @@
+"""Composite and partial indexes for the author and editor submission lists."""
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0003_file_key_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["author", "status"], name="submissions_author_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(fields=["status", "-created_at"], name="submissions_status_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["-created_at"],
+                condition=~models.Q(status="draft"),
+                name="submissions_queue_created_idx",
+            ),
+        ),
+    ]
@@ -104,6 +104,20 @@ class Submission(models.Model):
 
     class Meta:
         db_table = "submissions_submission"
+        indexes = [
+            # Orphaned file GC looks up stored keys (integrations.orphans)
+            models.Index(fields=["manuscript_pdf"], name="submissions_manuscript_idx"),
+            # Author list (GET /api/submissions?status=)
+            models.Index(fields=["author", "status"], name="submissions_author_status_idx"),
+            # Editor list filtered by status, newest first
+            models.Index(fields=["status", "-created_at"], name="submissions_status_created_idx"),
+            # Unfiltered editor queue: drafts are most rows and never listed there
+            models.Index(
+                fields=["-created_at"],
+                condition=~models.Q(status=STATUS_DRAFT),
+                name="submissions_queue_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title or '(Untitled)'} by {self.author.email}"
@@ -123,6 +137,7 @@ class SubmissionSupplementaryFile(models.Model):
 
     class Meta:
         db_table = "submissions_supplementary_file"
+        indexes = [models.Index(fields=["file"], name="submissions_supp_file_idx")]
 
 
 class SubmissionVersion(models.Model):
@@ -142,3 +157,4 @@ class SubmissionVersion(models.Model):
         db_table = "submissions_version"
         unique_together = [("submission", "version_number")]
         ordering = ["submission", "version_number"]
+        indexes = [models.Index(fields=["manuscript_pdf"], name="submissions_version_pdf_idx")]
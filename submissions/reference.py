@@ -0,0 +1,29 @@
+"""Topic areas from the reference cache (ejournal.cache): read on every form load and PATCH, edited rarely."""
+import hashlib
+import json
+
+from ejournal.cache import ReferenceCache
+
+from .models import TopicArea
+
+TOPIC_AREA_FIELDS = ["id", "name", "slug"]
+topic_areas = ReferenceCache("topic_areas")
+
+
+def _load_topic_areas() -> dict:
+    rows = list(TopicArea.objects.order_by("id").values(*TOPIC_AREA_FIELDS))
+    digest = hashlib.md5(json.dumps(rows, sort_keys=True).encode(), usedforsecurity=False).hexdigest()
+    return {"rows": rows, "etag": f'"{digest}"'}
+
+
+def topic_area_listing() -> dict:
+    """{"rows": [{"id", "name", "slug"}, ...], "etag"} for all topic areas, ordered by id."""
+    return topic_areas.get("all", _load_topic_areas)
+
+
+def get_topic_area(pk) -> TopicArea | None:
+    """The topic area with this id, rebuilt from the cache without a query."""
+    for row in topic_area_listing()["rows"]:
+        if row["id"] == pk:
+            return TopicArea.from_db("default", TOPIC_AREA_FIELDS, [row[f] for f in TOPIC_AREA_FIELDS])
+    return None
@@ -8,6 +8,7 @@ from .models import (
     SubmissionVersion,
     TopicArea,
 )
+from .reference import get_topic_area
 
 
 class TopicAreaSerializer(serializers.ModelSerializer):
@@ -18,6 +19,22 @@ class TopicAreaSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "slug"]
 
 
+class CachedTopicAreaField(serializers.PrimaryKeyRelatedField):
+    """topic_area_id validated against the reference cache instead of a query per write."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        topic_area = get_topic_area(pk)
+        if topic_area is None:
+            self.fail("does_not_exist", pk_value=data)
+        return topic_area
+
+
 class SubmissionSupplementaryFileSerializer(serializers.ModelSerializer):
     """Serializer for supplementary file."""
 
@@ -32,7 +49,7 @@ class SubmissionSerializer(serializers.ModelSerializer):
 
     supplementary_files = SubmissionSupplementaryFileSerializer(many=True, read_only=True)
     topic_area = TopicAreaSerializer(read_only=True)
-    topic_area_id = serializers.PrimaryKeyRelatedField(
+    topic_area_id = CachedTopicAreaField(
         queryset=TopicArea.objects.all(),
         source="topic_area",
         write_only=True,
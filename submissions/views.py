@@ -6,13 +6,20 @@ from django.core.files.base import ContentFile
 from django.db import transaction
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from accounts.permissions import IsAuthor
+from ejournal.cache import conditional_response
+from integrations.serializers import CompleteUploadSerializer, PresignUploadSerializer
+from integrations.storage import MB, UploadError, finish_upload, max_upload_size, start_upload
+from integrations.upload_handlers import PDF, UploadRejected, expect_upload, inspect_bytes, upload_check, upload_rejection
+from integrations.views import presigned_response
 
 from .models import STATUS_SUBMITTED, Submission, SubmissionSupplementaryFile, SubmissionVersion, TopicArea
+from .reference import topic_area_listing
 from .serializers import SubmissionSerializer, TopicAreaSerializer
 from .transitions import validate_transition
 from .validation import validate_submission_ready_for_submit
@@ -26,7 +33,13 @@ class SubmissionViewSet(viewsets.ModelViewSet):
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
     def get_queryset(self):
-        return Submission.objects.filter(author=self.request.user).select_related("topic_area").prefetch_related("supplementary_files")
+        qs = Submission.objects.filter(author=self.request.user).select_related("topic_area").prefetch_related("supplementary_files")
+        if self.action == "list":
+            status_filter = self.request.query_params.get("status")
+            if status_filter:
+                qs = qs.filter(status=status_filter)
+            qs = qs.order_by("-created_at")
+        return qs
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -45,7 +58,7 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def list(self, request, *args, **kwargs):
-        """GET /api/submissions/mine - List own submissions."""
+        """GET /api/submissions/mine?status= - List own submissions, newest first."""
         return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
@@ -58,7 +71,19 @@ class SubmissionViewSet(viewsets.ModelViewSet):
 
     def update(self, request, *args, **kwargs):
         """Disable PUT; use PATCH for partial updates."""
-        return Response({"detail": "Use PATCH for partial updates."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+        # partial_update() goes through here too
+        if not kwargs.get("partial"):
+            return Response({"detail": "Use PATCH for partial updates."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+        submission = self.get_object()
+        if submission.status != "draft":
+            return Response(
+                {"detail": "Only drafts can be edited."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = self.get_serializer(submission, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
 
     def destroy(self, request, *args, **kwargs):
         """Only drafts can be deleted (optional policy)."""
@@ -68,28 +93,47 @@ class SubmissionViewSet(viewsets.ModelViewSet):
                 {"detail": "Only drafts can be deleted."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        return super().destroy(request, *args, **kwargs)
+        keys = [submission.manuscript_pdf.name, *submission.supplementary_files.values_list("file", flat=True)]
+        response = super().destroy(request, *args, **kwargs)
+        # Files the GC would otherwise find later; versions may still reference the manuscript
+        from integrations.orphans import delete_unreferenced
+        transaction.on_commit(lambda: delete_unreferenced(keys))
+        return response
 
     @action(detail=True, methods=["post"], url_path="upload-file")
     def upload_file(self, request, pk=None):
-        """POST /api/submissions/{id}/upload-file - Upload file. Use form-data (file, file_type) or JSON (base64). Returns file URL."""
+        """
+        POST /api/submissions/{id}/upload-file - Upload file. Use form-data (file, file_type) or JSON (base64).
+        Returns file URL, size and SHA-256. Manuscripts must be PDFs (checked by content, not name).
+        """
         submission = self.get_object()
         if submission.status != "draft":
             return Response(
                 {"detail": "Files can only be uploaded for drafts."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        file_type = (request.data.get("file_type") or "manuscript").strip() or "manuscript"
+        # ?file_type= in the URL lets the handler apply the exact limit (and the PDF check) while streaming
+        hinted = request.query_params.get("file_type")
+        if hinted in ("manuscript", "supplementary"):
+            expect_upload(request, [hinted], require_pdf=hinted == "manuscript")
+        else:
+            expect_upload(request, ["manuscript", "supplementary"])
+        file_obj = request.FILES.get("file")
+        rejected = upload_rejection(request)
+        if rejected:
+            return Response({"detail": rejected.detail}, status=rejected.status_code)
+
+        file_type = (request.data.get("file_type") or hinted or "manuscript").strip() or "manuscript"
         if file_type not in ("manuscript", "supplementary"):
             return Response(
                 {"detail": "file_type must be 'manuscript' or 'supplementary'."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        file_obj = request.FILES.get("file")
         if file_obj:
-            content = file_obj.read()
+            check = upload_check(request)
             filename = file_obj.name or "file"
+            content = file_obj
         else:
             file_base64 = request.data.get("file_base64")
             filename = request.data.get("filename", "file")
@@ -104,22 +148,86 @@ class SubmissionViewSet(viewsets.ModelViewSet):
                 return Response({"detail": "Invalid base64 encoding."}, status=status.HTTP_400_BAD_REQUEST)
             if not content:
                 return Response({"detail": "Empty file content."}, status=status.HTTP_400_BAD_REQUEST)
+            try:
+                check = inspect_bytes(content, filename, file_type)
+            except UploadRejected as e:
+                return Response({"detail": e.detail}, status=e.status_code)
+            content = ContentFile(content)
 
+        # The streaming limit was the larger of the two types; apply this type's own
+        if check.size > max_upload_size(file_type):
+            return Response(
+                {"detail": f"File exceeds the {max_upload_size(file_type) // MB} MB limit."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        stored = {"size": check.size, "sha256": check.sha256}
         if file_type == "manuscript":
-            ext = filename.rsplit(".", 1)[-1] if "." in filename else "pdf"
-            safe_name = f"{uuid.uuid4().hex}.{ext}"
-            submission.manuscript_pdf.save(safe_name, ContentFile(content), save=True)
+            if check.content_type != PDF:
+                return Response({"detail": "Manuscript must be a PDF."}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+            submission.manuscript_pdf.save(f"{uuid.uuid4().hex}.pdf", content, save=True)
             url = request.build_absolute_uri(submission.manuscript_pdf.url) if submission.manuscript_pdf else None
-            return Response({"url": url, "file_type": "manuscript"})
+            return Response({"url": url, "file_type": "manuscript", **stored})
         else:
             safe_name = f"{uuid.uuid4().hex}_{filename}"
-            supp = SubmissionSupplementaryFile.objects.create(
-                submission=submission,
-                file=ContentFile(content, name=safe_name),
-                name=filename,
-            )
+            content.name = safe_name
+            supp = SubmissionSupplementaryFile.objects.create(submission=submission, file=content, name=filename)
             url = request.build_absolute_uri(supp.file.url) if supp.file else None
-            return Response({"url": url, "file_type": "supplementary", "id": supp.id})
+            return Response({"url": url, "file_type": "supplementary", "id": supp.id, **stored})
+
+    @action(detail=True, methods=["post"], url_path="presign-upload")
+    def presign_upload(self, request, pk=None):
+        """
+        POST /api/submissions/{id}/presign-upload - Presigned URL(s) to upload a draft's
+        file straight to storage. Body: file_type, filename, size, sha256, content_type.
+        """
+        submission = self.get_object()
+        if submission.status != "draft":
+            return Response({"detail": "Files can only be uploaded for drafts."}, status=status.HTTP_400_BAD_REQUEST)
+        file_type = request.data.get("file_type") or "manuscript"
+        if file_type not in ("manuscript", "supplementary"):
+            return Response(
+                {"detail": "file_type must be 'manuscript' or 'supplementary'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = PresignUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        prefix = f"submissions/{submission.id}/{'manuscripts' if file_type == 'manuscript' else 'supplementary'}"
+        try:
+            upload = start_upload(
+                prefix, file_type=file_type, scope=f"submission:{submission.id}", **serializer.validated_data
+            )
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(presigned_response(request, upload), status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["post"], url_path="complete-upload")
+    def complete_upload(self, request, pk=None):
+        """POST /api/submissions/{id}/complete-upload - Verify a direct upload (body: ticket) and attach it."""
+        submission = self.get_object()
+        if submission.status != "draft":
+            return Response({"detail": "Files can only be uploaded for drafts."}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = CompleteUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            stored = finish_upload(serializer.validated_data["ticket"], scope=f"submission:{submission.id}")
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # The object is already in storage: record its key without re-saving the bytes.
+        # A repeated complete for the same ticket records nothing new.
+        if stored["file_type"] == "manuscript":
+            if submission.manuscript_pdf.name != stored["key"]:
+                submission.manuscript_pdf.name = stored["key"]
+                submission.save(update_fields=["manuscript_pdf", "updated_at"])
+            url = request.build_absolute_uri(submission.manuscript_pdf.url)
+            return Response({"url": url, "file_type": "manuscript", "size": stored["size"], "sha256": stored["sha256"]})
+        supp, _ = SubmissionSupplementaryFile.objects.get_or_create(
+            submission=submission, file=stored["key"], defaults={"name": stored["name"]}
+        )
+        url = request.build_absolute_uri(supp.file.url)
+        return Response(
+            {"url": url, "file_type": "supplementary", "id": supp.id, "size": stored["size"], "sha256": stored["sha256"]}
+        )
 
     @action(detail=True, methods=["post"], url_path="submit")
     def submit(self, request, pk=None):
@@ -165,8 +273,22 @@ class SubmissionViewSet(viewsets.ModelViewSet):
 
 
 class TopicAreaViewSet(viewsets.ReadOnlyModelViewSet):
-    """GET /api/topic-areas - List topic areas (for submission form)."""
+    """
+    GET /api/topic-areas - List topic areas (for submission form).
+    Served from the reference cache with ETag/Cache-Control; If-None-Match gets a 304.
+    """
 
     permission_classes = [IsAuthenticated]
     serializer_class = TopicAreaSerializer
     queryset = TopicArea.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        listing = topic_area_listing()
+        return conditional_response(request, listing["rows"], listing["etag"])
+
+    def retrieve(self, request, *args, **kwargs):
+        listing = topic_area_listing()
+        row = next((r for r in listing["rows"] if str(r["id"]) == str(kwargs["pk"])), None)
+        if row is None:
+            raise NotFound()
+        return conditional_response(request, row, listing["etag"])
@@ -0,0 +1,96 @@
+"""Tests for the pending-approvals queue and bulk approve/reject."""
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import APPROVAL_APPROVED, APPROVAL_PENDING, APPROVAL_REJECTED, User
+from audit.models import AuditLog
+
+
+class AdminApprovalsTest(TestCase):
+    """Test GET /api/admin/users/pending and POST /api/admin/users/bulk-approve|bulk-reject."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(email="admin@test.com", password="adminpass123")
+        self.reviewers = [
+            User.objects.create_user(
+                email=f"rev{i}@test.com",
+                password="testpass123",
+                full_name=f"Reviewer {i}",
+                roles=["reviewer"],
+                reviewer_status=APPROVAL_PENDING,
+            )
+            for i in range(4)
+        ]
+        self.editor = User.objects.create_user(
+            email="editor@test.com",
+            password="testpass123",
+            full_name="Editor",
+            roles=["editor"],
+            editor_status=APPROVAL_PENDING,
+        )
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def test_pending_queue_paginates_oldest_first(self):
+        resp = self.client.get("/api/admin/users/pending", {"role": "reviewer", "limit": 3})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([u["email"] for u in resp.data["results"]], ["rev0@test.com", "rev1@test.com", "rev2@test.com"])
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual([u["email"] for u in resp.data["results"]], ["rev3@test.com"])
+
+        resp = self.client.get("/api/admin/users/pending")
+        self.assertEqual(len(resp.data["results"]), 5)
+        self.assertEqual(self.client.get("/api/admin/users/pending?role=author").status_code, 400)
+
+    def test_bulk_approve(self):
+        ids = [u.id for u in self.reviewers[:3]] + [self.author.id]
+        # savepoint, select for update, update, release, one audit insert on commit
+        with self.assertNumQueries(5), self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post(
+                "/api/admin/users/bulk-approve", {"role": "reviewer", "user_ids": ids}, format="json"
+            )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["updated"], ids[:3])
+        self.assertEqual(resp.data["skipped"], [self.author.id])
+        self.assertEqual(User.objects.filter(reviewer_status=APPROVAL_APPROVED).count(), 3)
+        self.assertEqual(AuditLog.objects.filter(action_type="reviewer_approved").count(), 3)
+
+        # Already approved users are skipped on a repeat
+        resp = self.client.post("/api/admin/users/bulk-approve", {"role": "reviewer", "user_ids": ids[:1]}, format="json")
+        self.assertEqual(resp.data["updated"], [])
+
+    def test_bulk_eligibility_matches_single_approval(self):
+        # Holds the role without a status (admin / create_user), and a stale status without the role
+        holder = User.objects.create_user(email="holder@test.com", password="testpass123", roles=["reviewer"])
+        stale = User.objects.create_user(
+            email="stale@test.com", password="testpass123", roles=["author"], reviewer_status=APPROVAL_PENDING
+        )
+        resp = self.client.post(
+            "/api/admin/users/bulk-approve", {"role": "reviewer", "user_ids": [holder.id, stale.id]}, format="json"
+        )
+        self.assertEqual((resp.data["updated"], resp.data["skipped"]), ([holder.id], [stale.id]))
+        holder.refresh_from_db()
+        self.assertEqual(holder.reviewer_status, APPROVAL_APPROVED)
+        resp = self.client.post(f"/api/admin/users/{stale.id}/approve-reviewer")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_reject_requires_reason(self):
+        body = {"role": "editor", "user_ids": [self.editor.id]}
+        resp = self.client.post("/api/admin/users/bulk-reject", body, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post("/api/admin/users/bulk-reject", {**body, "reason": "Incomplete"}, format="json")
+        self.assertEqual(resp.data["updated"], [self.editor.id])
+        self.editor.refresh_from_db()
+        self.assertEqual(self.editor.editor_status, APPROVAL_REJECTED)
+        entry = AuditLog.objects.get(action_type="editor_rejected")
+        self.assertEqual((entry.target_id, entry.new_value), (self.editor.id, {"reason": "Incomplete"}))
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(user=self.author)
+        self.assertEqual(self.client.get("/api/admin/users/pending").status_code, status.HTTP_403_FORBIDDEN)
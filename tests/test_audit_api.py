@@ -0,0 +1,77 @@
+"""Tests for the admin audit log query API."""
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from audit.models import AuditLog
+
+
+class AuditLogApiTest(TestCase):
+    """Test filtering and keyset pagination of GET /api/admin/audit."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(email="admin@test.com", password="adminpass123")
+        self.editor = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"]
+        )
+        now = timezone.now()
+        rows = []
+        for i in range(6):
+            rows.append(
+                AuditLog(
+                    actor_user=self.editor if i % 2 else self.admin,
+                    action_type="status_transition",
+                    target_type="submission",
+                    target_id=1 if i < 4 else 2,
+                    new_value={"step": i},
+                    created_at=now - timedelta(hours=6 - i),
+                )
+            )
+        rows.append(
+            AuditLog(
+                actor_user=self.admin,
+                action_type="reviewer_approved",
+                target_type="user",
+                target_id=self.editor.id,
+                created_at=now,
+            )
+        )
+        AuditLog.objects.bulk_create(rows)
+        self.client.force_authenticate(user=self.admin)
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(user=self.editor)
+        resp = self.client.get("/api/admin/audit")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_target_timeline_paginated_newest_first(self):
+        resp = self.client.get("/api/admin/audit?target_type=submission&target_id=1&limit=3")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([e["new_value"]["step"] for e in resp.data["results"]], [3, 2, 1])
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual([e["new_value"]["step"] for e in resp.data["results"]], [0])
+        self.assertIsNone(resp.data["next"])
+
+    def test_actor_action_and_time_filters(self):
+        resp = self.client.get(f"/api/admin/audit?actor={self.editor.id}")
+        self.assertEqual([e["new_value"]["step"] for e in resp.data["results"]], [5, 3, 1])
+        self.assertEqual(resp.data["results"][0]["actor_email"], "editor@test.com")
+
+        resp = self.client.get("/api/admin/audit?action=reviewer_approved")
+        self.assertEqual(len(resp.data["results"]), 1)
+        self.assertEqual(resp.data["results"][0]["target_id"], self.editor.id)
+
+        since = (timezone.now() - timedelta(hours=2, minutes=30)).isoformat()
+        resp = self.client.get("/api/admin/audit", {"since": since, "action": "status_transition"})
+        self.assertEqual([e["new_value"]["step"] for e in resp.data["results"]], [5, 4])
+
+    def test_invalid_filters_rejected(self):
+        resp = self.client.get("/api/admin/audit?target_id=1")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        resp = self.client.get("/api/admin/audit?since=yesterday")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
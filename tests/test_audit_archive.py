@@ -0,0 +1,132 @@
+"""Tests for audit log cold storage."""
+import json
+import tempfile
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from audit.archive import archive_old_rows, audit_trail, search_archive
+from audit.models import AuditLog
+
+
+class AuditArchiveTest(TestCase):
+    """Old audit rows move to date-partitioned segments and stay queryable."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        override = override_settings(ARCHIVE_ROOT=self.tmp.name, ARCHIVE_CHUNK_SIZE=2, AUDIT_RETENTION_DAYS=365)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.admin = User.objects.create_superuser(email="admin@test.com", password="adminpass123")
+        now = timezone.now()
+        rows = []
+        # Submission 1: two entries on each of two old days, one recent
+        for days_ago, hour in ((500, 1), (500, 2), (450, 1), (450, 2), (1, 0)):
+            rows.append(
+                AuditLog(
+                    actor_user=self.admin,
+                    action_type="status_transition",
+                    target_type="submission",
+                    target_id=1,
+                    new_value={"days_ago": days_ago, "hour": hour},
+                    created_at=now - timedelta(days=days_ago) + timedelta(hours=hour),
+                )
+            )
+        rows.append(
+            AuditLog(
+                actor_user=self.admin,
+                action_type="reviewer_approved",
+                target_type="user",
+                target_id=9,
+                created_at=now - timedelta(days=500),
+            )
+        )
+        AuditLog.objects.bulk_create(rows)
+
+    def test_archive_moves_old_rows_to_day_segments(self):
+        self.assertEqual(archive_old_rows(dry_run=True), 5)
+        self.assertEqual(archive_old_rows(), 5)
+        self.assertEqual(AuditLog.objects.count(), 1)
+
+        segments = sorted(Path(self.tmp.name, "audit").rglob("*.ndjson.gz"))
+        self.assertEqual(len(segments), 2)
+        index = json.loads(segments[0].with_name(segments[0].name.split(".")[0] + ".idx.json").read_text())
+        self.assertEqual(index["rows"], 3)
+        self.assertEqual(index["targets"], {"submission": [1], "user": [9]})
+
+    def test_search_uses_filters(self):
+        archive_old_rows()
+        rows = list(search_archive(target_type="submission", target_id=1))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(list(search_archive(target_type="user", target_id=1)), [])
+        self.assertEqual(len(list(search_archive(action="reviewer_approved"))), 1)
+
+    def test_trail_spans_table_and_archive(self):
+        archive_old_rows()
+        rows = audit_trail(target_type="submission", target_id=1, limit=3)
+        self.assertEqual(
+            [(r["new_value"]["days_ago"], r["new_value"]["hour"]) for r in rows], [(1, 0), (450, 2), (450, 1)]
+        )
+        more = audit_trail(target_type="submission", target_id=1, before=(rows[-1]["created_at"], rows[-1]["id"]))
+        self.assertEqual([(r["new_value"]["days_ago"], r["new_value"]["hour"]) for r in more], [(500, 2), (500, 1)])
+
+    def test_trail_api_paginates_into_archive(self):
+        archive_old_rows()
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        resp = client.get("/api/admin/audit/trail?target_type=submission&target_id=1&limit=2")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data["results"]), 2)
+        seen = [r["id"] for r in resp.data["results"]]
+        while resp.data["next"]:
+            resp = client.get(resp.data["next"])
+            seen += [r["id"] for r in resp.data["results"]]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+        resp = client.get("/api/admin/audit/trail")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_commands(self):
+        out = StringIO()
+        call_command("archive_audit_logs", stdout=out)
+        self.assertIn("archived 5 rows", out.getvalue())
+        out = StringIO()
+        call_command(
+            "search_audit_archive", "--target-type", "user", "--archive-only", stdout=out, stderr=StringIO()
+        )
+        self.assertEqual(json.loads(out.getvalue())["target_id"], 9)
+
+    def test_command_since_until_naive_and_offset(self):
+        # 20:00 UTC lands in the 2024-01-30 partition
+        AuditLog.objects.create(
+            action_type="status_transition",
+            target_type="review_assignment",
+            target_id=77,
+            created_at=datetime(2024, 1, 30, 20, 0, tzinfo=dt_timezone.utc),
+        )
+        archive_old_rows()
+
+        def search(since):
+            out = StringIO()
+            call_command(
+                "search_audit_archive", "--target-type", "review_assignment", "--archive-only", "--since", since,
+                stdout=out, stderr=StringIO(),
+            )
+            return [json.loads(line)["target_id"] for line in out.getvalue().splitlines()]
+
+        # 2024-01-31 00:00 at +05:00 is 19:00 UTC the day before
+        self.assertEqual(search("2024-01-31T00:00:00+05:00"), [77])
+        # Naive values are UTC
+        self.assertEqual(search("2024-01-30T19:30:00"), [77])
+        self.assertEqual(search("2024-01-30T21:00:00"), [])
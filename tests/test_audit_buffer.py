@@ -0,0 +1,109 @@
+"""Tests for the buffered audit log writer."""
+from unittest import mock
+
+from django.db import DatabaseError, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+
+from accounts.models import User
+from audit.middleware import AuditBufferMiddleware
+from audit.models import AuditLog
+from audit.services import buffered, log
+
+
+def log_transition(actor, target_id):
+    """Log a status transition."""
+    log(actor, "status_transition", "submission", target_id, {"status": "a"}, {"status": "b"})
+
+
+class AuditBufferTest(TestCase):
+    """Test direct, buffered and async audit writes."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"]
+        )
+
+    def test_log_without_buffer_writes_immediately(self):
+        log_transition(self.user, 7)
+        entry = AuditLog.objects.get()
+        self.assertEqual(entry.target_id, 7)
+        self.assertEqual(entry.actor_user, self.user)
+
+    def test_middleware_writes_request_entries_in_one_insert(self):
+        def view(request):
+            for i in range(5):
+                log_transition(self.user, i)
+            return HttpResponse("ok")
+
+        middleware = AuditBufferMiddleware(view)
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            middleware(RequestFactory().get("/"))
+        self.assertEqual(
+            sorted(AuditLog.objects.values_list("target_id", flat=True)), [0, 1, 2, 3, 4]
+        )
+
+    def test_created_at_is_log_time(self):
+        with self.captureOnCommitCallbacks(execute=True), buffered():
+            log_transition(self.user, 1)
+            log_transition(self.user, 2)
+        first, second = AuditLog.objects.order_by("id")
+        self.assertLessEqual(first.created_at, second.created_at)
+
+    @override_settings(AUDIT_ASYNC_ACTIONS=["status_transition"])
+    def test_async_actions_written_by_task(self):
+        with self.captureOnCommitCallbacks(execute=True), buffered():
+            log_transition(self.user, 1)
+            log(self.user, "user_approved", "user", self.user.id)
+        self.assertEqual(
+            sorted(AuditLog.objects.values_list("action_type", flat=True)),
+            ["status_transition", "user_approved"],
+        )
+        self.assertEqual(AuditLog.objects.get(action_type="status_transition").actor_user, self.user)
+
+    def test_failed_flush_is_handed_to_task(self):
+        bulk_create = AuditLog.objects.bulk_create
+        calls = []
+
+        def fail_once(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise DatabaseError("connection lost")
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(AuditLog.objects, "bulk_create", side_effect=fail_once):
+            with self.assertLogs("audit.services", "WARNING"):
+                with self.captureOnCommitCallbacks(execute=True), buffered():
+                    log_transition(self.user, 1)
+                    log_transition(self.user, 2)
+        # Written by write_audit_entries (eager in tests)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(sorted(AuditLog.objects.values_list("target_id", flat=True)), [1, 2])
+
+    def test_failed_flush_and_enqueue_is_logged(self):
+        with mock.patch.object(AuditLog.objects, "bulk_create", side_effect=DatabaseError("down")), \
+                mock.patch("audit.tasks.write_audit_entries.delay", side_effect=ConnectionError("broker down")):
+            with self.assertLogs("audit.services", "ERROR") as logs:
+                with self.captureOnCommitCallbacks(execute=True), buffered():
+                    log_transition(self.user, 1)
+        self.assertIn("Failed to queue 1 buffered audit entries", logs.output[-1])
+        self.assertFalse(AuditLog.objects.exists())
+
+
+class AuditBufferTransactionTest(TransactionTestCase):
+    """Test that buffered entries follow their transaction's outcome."""
+
+    def test_rolled_back_entries_are_dropped(self):
+        user = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"]
+        )
+        with buffered():
+            with transaction.atomic():
+                log_transition(user, 1)
+            try:
+                with transaction.atomic():
+                    log_transition(user, 2)
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+        self.assertEqual(list(AuditLog.objects.values_list("target_id", flat=True)), [1])
@@ -0,0 +1,139 @@
+"""Tests for presigned direct-to-storage uploads (filesystem stand-in)."""
+import hashlib
+import tempfile
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from submissions.models import Submission
+
+
+def sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class DirectUploadTest(TestCase):
+    """Presign, PUT to the stand-in, complete; the key is recorded only after verification."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        override = override_settings(MEDIA_ROOT=self.tmp.name, UPLOAD_MULTIPART_THRESHOLD_MB=1, UPLOAD_PART_SIZE_MB=1)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.submission = Submission.objects.create(author=self.author)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+        self.put_client = APIClient()  # presigned URLs need no credentials
+
+    def presign(self, data, **extra):
+        body = {"filename": "paper.pdf", "size": len(data), "sha256": sha(data), "content_type": "application/pdf"}
+        return self.client.post(
+            f"/api/submissions/{self.submission.id}/presign-upload/", {**body, **extra}, format="json"
+        )
+
+    def test_single_put_manuscript(self):
+        data = b"%PDF-1.7 manuscript"
+        presigned = self.presign(data).data
+        resp = self.put_client.put(presigned["url"], data, content_type="application/pdf")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        resp = self.client.post(
+            f"/api/submissions/{self.submission.id}/complete-upload/", {"ticket": presigned["ticket"]}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.submission.refresh_from_db()
+        self.assertEqual(self.submission.manuscript_pdf.name, presigned["key"])
+        self.assertEqual(Path(self.tmp.name, presigned["key"]).read_bytes(), data)
+
+    def test_put_with_wrong_bytes_rejected(self):
+        presigned = self.presign(b"%PDF-1.7 expected").data
+        resp = self.put_client.put(presigned["url"], b"%PDF-1.7 tampered", content_type="application/pdf")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        resp = self.client.post(
+            f"/api/submissions/{self.submission.id}/complete-upload/", {"ticket": presigned["ticket"]}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.submission.refresh_from_db()
+        self.assertFalse(self.submission.manuscript_pdf)
+
+    def upload_multipart(self):
+        """Presign, PUT both parts and complete a 1 MB + 100 byte supplementary file."""
+        part = 1024 * 1024
+        data = b"a" * part + b"b" * 100
+        presigned = self.presign(
+            data, file_type="supplementary", filename="data.csv", part_sha256=[sha(data[:part]), sha(data[part:])]
+        ).data
+        self.assertEqual(len(presigned["parts"]), 2)
+        for p in presigned["parts"]:
+            start = (p["part_number"] - 1) * presigned["part_size"]
+            chunk = data[start : start + presigned["part_size"]]
+            self.assertEqual(self.put_client.put(p["url"], chunk, content_type="application/octet-stream").status_code, 200)
+
+        resp = self.client.post(
+            f"/api/submissions/{self.submission.id}/complete-upload/", {"ticket": presigned["ticket"]}, format="json"
+        )
+        return presigned, resp
+
+    def test_multipart_supplementary(self):
+        presigned, resp = self.upload_multipart()
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.submission.supplementary_files.get().file.size, 1024 * 1024 + 100)
+
+    def test_multipart_complete_retry_keeps_file(self):
+        presigned, resp = self.upload_multipart()
+        first = resp.data
+        for _ in range(2):
+            resp = self.client.post(
+                f"/api/submissions/{self.submission.id}/complete-upload/", {"ticket": presigned["ticket"]}, format="json"
+            )
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            self.assertEqual(resp.data, first)
+        self.assertEqual(self.submission.supplementary_files.count(), 1)
+        self.assertEqual(Path(self.tmp.name, presigned["key"]).stat().st_size, first["size"])
+
+        # Without the completion record (evicted, another cache), the finished object is still left alone
+        cache.delete(f"uploads:finished:{presigned['key']}")
+        resp = self.client.post(
+            f"/api/submissions/{self.submission.id}/complete-upload/", {"ticket": presigned["ticket"]}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.submission.supplementary_files.count(), 1)
+        self.assertEqual(Path(self.tmp.name, presigned["key"]).stat().st_size, first["size"])
+
+    def test_single_put_complete_retry(self):
+        data = b"%PDF-1.7 supplement"
+        presigned = self.presign(data, file_type="supplementary", filename="notes.pdf").data
+        self.put_client.put(presigned["url"], data, content_type="application/pdf")
+        url = f"/api/submissions/{self.submission.id}/complete-upload/"
+        responses = [self.client.post(url, {"ticket": presigned["ticket"]}, format="json") for _ in range(3)]
+        self.assertEqual({r.status_code for r in responses}, {status.HTTP_200_OK})
+        self.assertEqual(len({r.data["id"] for r in responses}), 1)
+        self.assertEqual(self.submission.supplementary_files.count(), 1)
+        self.assertEqual(Path(self.tmp.name, presigned["key"]).read_bytes(), data)
+
+    def test_limits_and_ticket_scope(self):
+        too_big = self.presign(b"x", size=60 * 1024 * 1024, sha256="0" * 64)
+        self.assertEqual(too_big.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.presign(b"x" * (2 * 1024 * 1024)).status_code, status.HTTP_400_BAD_REQUEST)
+
+        presigned = self.client.post(
+            "/api/uploads/presign", {"filename": "a.txt", "size": 3, "sha256": sha(b"abc")}, format="json"
+        ).data
+        self.put_client.put(presigned["url"], b"abc", content_type="text/plain")
+        # A ticket for a user upload cannot be attached to a submission
+        resp = self.client.post(
+            f"/api/submissions/{self.submission.id}/complete-upload/", {"ticket": presigned["ticket"]}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        resp = self.client.post("/api/uploads/complete", {"ticket": presigned["ticket"]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertTrue(resp.data["key"].startswith(f"uploads/{self.author.id}/"))
@@ -0,0 +1,150 @@
+"""Tests for email retry policies, circuit breaker and dead-letter replay."""
+import smtplib
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+
+from notifications.delivery import (
+    CONNECTION_POLICY,
+    THROTTLED_POLICY,
+    PermanentEmailError,
+    email_circuit,
+    retry_policy_for,
+)
+from notifications.models import DeadLetterEmail, EmailLog, Notification
+from notifications.tasks import send_notification_email
+
+SEND = "notifications.backends.smtp.SMTPBackend.send"
+
+
+def queue_email(**kwargs):
+    """Queue an email through the eager Celery task."""
+    params = {
+        "event_type": "submission_submitted",
+        "user_id": None,
+        "to_email": "author@test.com",
+        "subject": "Received",
+        "body": "Body",
+    }
+    params.update(kwargs)
+    return send_notification_email.delay(**params).get()
+
+
+class RetryPolicyTest(TestCase):
+    """Test exception classification and backoff delays."""
+
+    def test_classification(self):
+        self.assertIs(retry_policy_for(ConnectionRefusedError()), CONNECTION_POLICY)
+        self.assertIs(retry_policy_for(smtplib.SMTPServerDisconnected()), CONNECTION_POLICY)
+        self.assertIs(retry_policy_for(smtplib.SMTPDataError(451, b"try later")), THROTTLED_POLICY)
+        self.assertIsNone(retry_policy_for(smtplib.SMTPDataError(554, b"rejected")))
+        self.assertIsNone(retry_policy_for(smtplib.SMTPRecipientsRefused({})))
+        self.assertIsNone(retry_policy_for(PermanentEmailError()))
+        # A bug in a backend is not proof that the message can never be sent
+        self.assertIsNotNone(retry_policy_for(ValueError("oops")))
+
+    def test_countdown_grows_and_is_capped(self):
+        for retries in range(12):
+            cap = min(CONNECTION_POLICY.max_delay, CONNECTION_POLICY.base_delay * 2**retries)
+            delay = CONNECTION_POLICY.countdown(retries)
+            self.assertGreaterEqual(delay, cap / 2)
+            self.assertLessEqual(delay, cap)
+
+
+@override_settings(EMAIL_CIRCUIT_FAILURE_THRESHOLD=3, EMAIL_CIRCUIT_COOLDOWN_SECONDS=30)
+class DeliveryTest(TestCase):
+    """Test retries, dead-lettering and the shared circuit breaker."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_transient_failure_retried_then_sent(self):
+        with mock.patch(SEND, side_effect=[ConnectionResetError("reset"), None]) as send:
+            result = queue_email()
+        self.assertEqual(result["status"], "sent")
+        self.assertEqual(send.call_count, 2)
+        # Retries reuse the first attempt's records
+        self.assertEqual(Notification.objects.get().status, "sent")
+        self.assertEqual(EmailLog.objects.get().status, "sent")
+
+    def test_permanent_failure_dead_lettered_without_retry(self):
+        refused = smtplib.SMTPRecipientsRefused({"author@test.com": (550, b"no such user")})
+        with mock.patch(SEND, side_effect=refused) as send:
+            result = queue_email()
+        self.assertEqual(result["status"], "dead_lettered")
+        self.assertEqual(send.call_count, 1)
+        letter = DeadLetterEmail.objects.get()
+        self.assertEqual(letter.exception_type, "smtplib.SMTPRecipientsRefused")
+        self.assertEqual(letter.attempts, 1)
+        self.assertEqual(letter.task_kwargs["to_email"], "author@test.com")
+        # Permanent errors say nothing about provider health
+        self.assertEqual(email_circuit.blocked_for(), 0)
+
+    def test_database_error_retried(self):
+        create = Notification.objects.create
+        failures = [OperationalError("database is locked")]
+
+        def flaky_create(**kwargs):
+            if failures:
+                raise failures.pop()
+            return create(**kwargs)
+
+        with mock.patch.object(Notification.objects, "create", side_effect=flaky_create):
+            with mock.patch(SEND, return_value=None) as send:
+                result = queue_email()
+        self.assertEqual(result["status"], "sent")
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(Notification.objects.get().status, "sent")
+
+    def test_invalid_address_dead_lettered_without_retry(self):
+        with mock.patch("notifications.backends.smtp.send_mail") as send_mail:
+            result = queue_email(to_email="not-an-address")
+        self.assertEqual(result["status"], "dead_lettered")
+        send_mail.assert_not_called()
+        self.assertEqual(DeadLetterEmail.objects.get().exception_type, "notifications.delivery.PermanentEmailError")
+
+    @override_settings(EMAIL_CIRCUIT_FAILURE_THRESHOLD=100)
+    def test_exhausted_retries_dead_lettered(self):
+        with mock.patch(SEND, side_effect=smtplib.SMTPDataError(451, b"slow down")) as send:
+            result = queue_email()
+        self.assertEqual(result["status"], "dead_lettered")
+        self.assertEqual(send.call_count, THROTTLED_POLICY.max_retries + 1)
+        self.assertEqual(DeadLetterEmail.objects.get().attempts, THROTTLED_POLICY.max_retries + 1)
+
+    def test_circuit_opens_after_threshold_and_probe_closes_it(self):
+        for _ in range(3):
+            email_circuit.record_failure()
+        self.assertGreater(email_circuit.blocked_for(), 0)
+
+        cache.set(email_circuit.open_until_key, 0)
+        self.assertEqual(email_circuit.blocked_for(), 0)  # this worker probes
+        self.assertGreater(email_circuit.blocked_for(), 0)  # others keep waiting
+        email_circuit.record_success()
+        self.assertEqual(email_circuit.blocked_for(), 0)
+
+    def test_failed_probe_reopens_circuit(self):
+        cache.set(email_circuit.open_until_key, 0)
+        self.assertEqual(email_circuit.blocked_for(), 0)
+        email_circuit.record_failure()
+        self.assertGreater(email_circuit.blocked_for(), 0)
+
+    def test_replay_dead_letters(self):
+        with mock.patch(SEND, side_effect=PermanentEmailError("bad template")):
+            queue_email()
+        letter = DeadLetterEmail.objects.get()
+
+        out = StringIO()
+        with mock.patch(SEND, return_value=None):
+            call_command("replay_dead_letters", stdout=out)
+        self.assertIn("Re-queued 1 emails", out.getvalue())
+        letter.refresh_from_db()
+        self.assertIsNotNone(letter.replayed_at)
+        self.assertEqual(Notification.objects.get().status, "sent")
+
+        out = StringIO()
+        call_command("replay_dead_letters", stdout=out)
+        self.assertIn("Re-queued 0 emails", out.getvalue())
@@ -0,0 +1,37 @@
+"""Tests for the email template registry."""
+from django.core import mail
+from django.test import TestCase
+
+from notifications.models import EVENT_CHOICES
+from notifications.rendering import SUBJECTS, render_email, render_many
+from notifications.services import queue_revision_requested
+
+
+class EmailRenderingTest(TestCase):
+    """Templates exist for every event and render text + HTML parts."""
+
+    def test_every_event_type_has_templates(self):
+        for event_type, _ in EVENT_CHOICES:
+            self.assertIn(event_type, SUBJECTS)
+            rendered = render_email(event_type, {"submission_id": 1, "submission_title": "T", "items": []})
+            self.assertTrue(rendered.subject)
+            self.assertTrue(rendered.body)
+            self.assertIn("<html>", rendered.html_body)
+
+    def test_render_many_matches_single_render(self):
+        shared = {"submission_title": "A <b>bold</b> title"}
+        contexts = [{"recipient_email": "a@test.com"}, {"recipient_email": "b@test.com"}]
+        batch = render_many("review_submitted", contexts, shared=shared)
+        single = render_email("review_submitted", {**shared, **contexts[1]})
+        self.assertEqual(batch[1], single)
+        self.assertIn("A <b>bold</b> title", single.body)  # plain text is not escaped
+        self.assertIn("A &lt;b&gt;bold&lt;/b&gt; title", single.html_body)
+
+    def test_html_part_is_sent(self):
+        queue_revision_requested(5, "author@test.com", None, "Please address\nreviewer 2.")
+        message = mail.outbox[0]
+        self.assertEqual(message.subject, "Revision requested for your submission")
+        self.assertIn("Please address\nreviewer 2.", message.body)
+        html, mimetype = message.alternatives[0]
+        self.assertEqual(mimetype, "text/html")
+        self.assertIn("reviewer 2.", html)
@@ -0,0 +1,108 @@
+"""Tests for the Prometheus metrics middleware, Celery hooks and /metrics endpoint."""
+import json
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from monitoring import celery_hooks, metrics
+from submissions.models import TopicArea
+
+
+def sample(text, name, **labels):
+    """Value of one sample line of a Prometheus text exposition."""
+    wanted = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    for line in text.splitlines():
+        if line.startswith(f"{name}{{{wanted}}} "):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+@override_settings(METRICS_TOKEN="s3cret")
+class MetricsTest(TestCase):
+    """monitoring.metrics across requests, tasks and worker processes."""
+
+    def setUp(self):
+        for metric in metrics._registry.values():
+            metric.series = {}
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        TopicArea.objects.create(name="AI", slug="ai")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+
+    def scrape(self):
+        return self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret")
+
+    def test_request_metrics_by_view(self):
+        for _ in range(3):
+            self.client.get("/api/topic-areas/")
+        self.client.get("/api/does-not-exist")
+        resp = self.scrape()
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = resp.content.decode()
+        self.assertIn("# TYPE http_request_duration_seconds histogram", text)
+        labels = {"view": "topic-area-list", "method": "GET", "status": "200"}
+        self.assertEqual(sample(text, "http_request_duration_seconds_count", **labels), 3)
+        self.assertEqual(sample(text, "http_request_duration_seconds_bucket", **labels, le="+Inf"), 3)
+        self.assertGreater(sample(text, "http_response_size_bytes_sum", view="topic-area-list"), 0)
+        self.assertIsNotNone(sample(text, "http_request_db_queries_count", view="topic-area-list"))
+        self.assertEqual(sample(text, "http_request_duration_seconds_count", view="<unresolved>", method="GET", status="404"), 1)
+        # Scrapes are not recorded
+        self.assertNotIn('view="metrics"', text)
+
+    def test_sums_other_worker_files(self):
+        with tempfile.TemporaryDirectory() as tmp, override_settings(METRICS_DIR=tmp):
+            self.client.get("/api/topic-areas/")
+            self.assertTrue(list(Path(tmp).glob("*.json")))
+            # Another worker that served the same view twice
+            key = json.dumps(["topic-area-list"])
+            other = {"http_request_db_queries": {key: [0] * len(metrics.REQUEST_QUERIES.buckets) + [4, 2]}}
+            Path(tmp, "99999-1.json").write_text(json.dumps(other))
+            text = self.scrape().content.decode()
+        self.assertEqual(sample(text, "http_request_db_queries_count", view="topic-area-list"), 3)
+
+    def test_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 401)
+        self.assertEqual(self.scrape().status_code, 200)
+
+    @override_settings(METRICS_TOKEN="", METRICS_ALLOW_ANONYMOUS=False)
+    def test_no_token_configured_denies_scrapes(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        with override_settings(METRICS_ALLOW_ANONYMOUS=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    def test_task_queue_wait_and_runtime(self):
+        headers = {}
+        celery_hooks.stamp_enqueued_at(sender="notifications.tasks.send_review_reminder", headers=headers)
+        task = SimpleNamespace(
+            name="notifications.tasks.send_review_reminder",
+            request=SimpleNamespace(eta=None, enqueued_at=headers["enqueued_at"] - 2),
+        )
+        celery_hooks.task_started(task_id="t1", task=task)
+        celery_hooks.task_finished(task_id="t1", task=task, state="SUCCESS")
+        # Untracked tasks are ignored
+        other = SimpleNamespace(name="audit.tasks.write_audit_entries", request=SimpleNamespace(eta=None))
+        celery_hooks.task_started(task_id="t2", task=other)
+        celery_hooks.task_finished(task_id="t2", task=other, state="SUCCESS")
+
+        text = metrics.render()
+        name = "notifications.tasks.send_review_reminder"
+        self.assertGreaterEqual(sample(text, "celery_task_queue_wait_seconds_sum", task=name), 2)
+        self.assertEqual(sample(text, "celery_task_runtime_seconds_count", task=name, state="SUCCESS"), 1)
+        self.assertNotIn("write_audit_entries", text)
+
+    def test_eager_task_records_runtime(self):
+        from notifications.tasks import send_notification_email
+
+        send_notification_email.delay("welcome", self.author.id, self.author.email, "Welcome", "Hello")
+        text = metrics.render()
+        self.assertIsNotNone(
+            sample(text, "celery_task_runtime_seconds_count", task="notifications.tasks.send_notification_email", state="SUCCESS")
+        )
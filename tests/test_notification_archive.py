@@ -0,0 +1,61 @@
+"""Tests for notification/email log retention archival."""
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from notifications.archive import archive_old_rows, search_archive
+from notifications.inbox import get_unread_count
+from notifications.models import EmailLog, Notification
+from notifications.tasks import send_notification_email
+
+
+class NotificationArchiveTest(TestCase):
+    """Old rows move to NDJSON archives; recent rows stay."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        override = override_settings(ARCHIVE_ROOT=self.tmp.name, ARCHIVE_CHUNK_SIZE=2)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = User.objects.create_user(email="u@test.com", password="testpass123", full_name="U")
+        for i in range(5):
+            send_notification_email(
+                event_type="submission_submitted",
+                user_id=self.user.id,
+                to_email=self.user.email,
+                subject=f"Subject {i}",
+                body=f"Body {i}",
+                payload={"submission_id": i},
+            )
+        old = timezone.now() - timedelta(days=400)
+        old_ids = list(Notification.objects.order_by("id").values_list("id", flat=True)[:3])
+        Notification.objects.filter(id__in=old_ids).update(created_at=old)
+        EmailLog.objects.filter(id__in=EmailLog.objects.order_by("id").values_list("id", flat=True)[:3]).update(created_at=old)
+
+    def test_dry_run_only_counts(self):
+        self.assertEqual(archive_old_rows(days=180, dry_run=True), {"notification": 3, "emaillog": 3})
+        self.assertEqual(Notification.objects.count(), 5)
+
+    def test_archive_moves_old_rows_and_keeps_counters(self):
+        self.assertEqual(get_unread_count(self.user.id), 5)
+        self.assertEqual(archive_old_rows(days=180), {"notification": 3, "emaillog": 3})
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertEqual(EmailLog.objects.count(), 2)
+        self.assertEqual(get_unread_count(self.user.id), 2)
+
+        rows = list(search_archive("emaillog", to_email="u@test.com", contains="body 1"))
+        self.assertEqual([r["subject"] for r in rows], ["Subject 1"])
+        self.assertEqual(len(list(search_archive("notification", user_id=self.user.id))), 3)
+
+    def test_search_command(self):
+        call_command("archive_notifications", "--days", "180", stdout=StringIO())
+        out = StringIO()
+        call_command("search_notification_archive", "emaillog", "--contains", "subject 2", stdout=out, stderr=StringIO())
+        self.assertIn('"Subject 2"', out.getvalue())
@@ -0,0 +1,55 @@
+"""Tests for per-user notification digests."""
+from django.core import mail
+from django.test import TestCase
+
+from accounts.models import APPROVAL_APPROVED, DIGEST_DAILY, DIGEST_HOURLY, User
+from notifications.models import EVENT_DIGEST, Notification, PendingDigestItem
+from notifications.services import queue_review_submitted, queue_status_changed
+from notifications.tasks import send_notification_digests
+
+
+def make_editor(email, digest):
+    """Create approved editor with a digest preference."""
+    return User.objects.create_user(
+        email=email,
+        password="testpass123",
+        full_name="Editor",
+        roles=["editor"],
+        editor_status=APPROVAL_APPROVED,
+        notification_digest=digest,
+    )
+
+
+class NotificationDigestTest(TestCase):
+    """Digest users get pending items instead of immediate emails."""
+
+    def setUp(self):
+        self.hourly = make_editor("hourly@test.com", DIGEST_HOURLY)
+        self.daily = make_editor("daily@test.com", DIGEST_DAILY)
+        self.immediate = make_editor("now@test.com", "immediate")
+
+    def test_fanout_respects_preferences(self):
+        queue_review_submitted(1, [u.email for u in (self.hourly, self.daily, self.immediate)], "Paper")
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.immediate.email])
+        self.assertEqual(PendingDigestItem.objects.filter(user=self.hourly).count(), 1)
+        self.assertEqual(PendingDigestItem.objects.filter(user=self.daily).count(), 1)
+
+    def test_digest_task_sends_one_email_per_user(self):
+        for i in range(3):
+            queue_status_changed(i, "submitted", "screening", self.hourly.email, self.hourly.id, f"status_{i}")
+        queue_status_changed(9, "submitted", "screening", self.daily.email, self.daily.id, "status_9")
+        self.assertEqual(len(mail.outbox), 0)
+
+        result = send_notification_digests("hourly")
+
+        self.assertEqual(result["digests"], 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.hourly.email])
+        self.assertIn("3 updates", mail.outbox[0].subject)
+        self.assertFalse(PendingDigestItem.objects.filter(frequency="hourly").exists())
+        self.assertEqual(PendingDigestItem.objects.filter(frequency="daily").count(), 1)
+        self.assertTrue(Notification.objects.filter(user=self.hourly, event_type=EVENT_DIGEST).exists())
+
+    def test_digest_task_noop_when_empty(self):
+        self.assertEqual(send_notification_digests("daily")["status"], "skipped")
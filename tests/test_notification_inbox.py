@@ -0,0 +1,65 @@
+"""Tests for the in-app notification inbox."""
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from notifications.models import UnreadCounter
+from notifications.tasks import send_notification_email
+
+
+def make_user(email):
+    """Create a user."""
+    return User.objects.create_user(email=email, password="testpass123", full_name="User", roles=["author"])
+
+
+class NotificationInboxTest(TestCase):
+    """Test inbox listing, unread counters and bulk mark-read."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = make_user("inbox@test.com")
+        self.other = make_user("other@test.com")
+        for i in range(5):
+            self._notify(self.user, i)
+        self._notify(self.other, 99)
+        self.client.force_authenticate(user=self.user)
+
+    def _notify(self, user, submission_id):
+        send_notification_email(
+            event_type="submission_submitted",
+            user_id=user.id,
+            to_email=user.email,
+            subject="Received",
+            body="Body",
+            payload={"submission_id": submission_id},
+        )
+
+    def test_list_is_paginated_newest_first(self):
+        resp = self.client.get("/api/notifications?limit=3")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([n["payload"]["submission_id"] for n in resp.data["results"]], [4, 3, 2])
+        self.assertEqual(resp.data["unread_count"], 5)
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual([n["payload"]["submission_id"] for n in resp.data["results"]], [1, 0])
+        self.assertIsNone(resp.data["next"])
+
+    def test_counter_maintained_without_count_query(self):
+        self.assertEqual(UnreadCounter.objects.get(user=self.user).unread, 5)
+        with self.assertNumQueries(1):
+            resp = self.client.get("/api/notifications/unread-count")
+        self.assertEqual(resp.data["unread_count"], 5)
+
+    def test_mark_read_up_to_id(self):
+        ids = list(self.user.notifications.order_by("id").values_list("id", flat=True))
+        resp = self.client.post("/api/notifications/mark-read", {"up_to_id": ids[2]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data, {"marked": 3, "unread_count": 2})
+        resp = self.client.get("/api/notifications?unread=true")
+        self.assertEqual(len(resp.data["results"]), 2)
+
+    def test_mark_read_does_not_touch_other_users(self):
+        other_id = self.other.notifications.get().id
+        resp = self.client.post("/api/notifications/mark-read", {"ids": [other_id]}, format="json")
+        self.assertEqual(resp.data["marked"], 0)
+        self.assertIsNone(self.other.notifications.get().read_at)
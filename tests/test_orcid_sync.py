@@ -0,0 +1,183 @@
+"""Tests for ORCID record sync against a local mock of the public API."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import APPROVAL_APPROVED, User
+from integrations.models import SYNC_NOT_FOUND, OrcidRecord
+from integrations.orcid import normalize_orcid_id, sync_orcid_records
+from submissions.models import Submission
+
+AUTHOR_ID = "0000-0002-1825-0097"
+REVIEWER_ID = "0000-0002-1694-233X"
+MISSING_ID = "0000-0001-5109-3700"
+
+
+def orcid_record(given, family, works):
+    return {
+        "person": {"name": {"given-names": {"value": given}, "family-name": {"value": family}, "credit-name": None}},
+        "activities-summary": {
+            "employments": {
+                "affiliation-group": [
+                    {
+                        "summaries": [
+                            {
+                                "employment-summary": {
+                                    "organization": {"name": "Samarkand State University"},
+                                    "role-title": "Professor",
+                                    "start-date": {"year": {"value": "2015"}},
+                                    "end-date": None,
+                                }
+                            }
+                        ]
+                    }
+                ]
+            },
+            "educations": {"affiliation-group": []},
+            "works": {
+                "group": [
+                    {
+                        "external-ids": {"external-id": [{"external-id-type": "doi", "external-id-value": doi}]},
+                        "work-summary": [
+                            {
+                                "put-code": put_code,
+                                "title": {"title": {"value": f"Paper {put_code}"}},
+                                "type": "journal-article",
+                                "publication-date": {"year": {"value": "2021"}},
+                            }
+                        ],
+                    }
+                    for put_code, doi in works
+                ]
+            },
+        },
+    }
+
+
+class MockOrcid(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    records = {}
+    requests = []
+    connections = set()
+
+    def do_GET(self):
+        orcid_id = self.path.split("/")[-2]
+        MockOrcid.requests.append((orcid_id, self.headers.get("If-None-Match")))
+        MockOrcid.connections.add(self.client_address)
+        record = MockOrcid.records.get(orcid_id)
+        etag = f'"{orcid_id}-v1"'
+        if record is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            body = json.dumps(record).encode()
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Mon, 05 Oct 2026 10:00:00 GMT")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class OrcidSyncTest(TestCase):
+    """sync_orcid_records() and the endpoints that read the cached records."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), MockOrcid)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.settings_override = override_settings(
+            ORCID_API_URL=f"http://127.0.0.1:{cls.server.server_port}/v3.0", ORCID_SYNC_CONCURRENCY=2
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        MockOrcid.records = {
+            AUTHOR_ID: orcid_record("Dilnoza", "Karimova", [(1, "10.1000/shared"), (2, "https://doi.org/10.1000/A")]),
+            REVIEWER_ID: orcid_record("Timur", "Rahimov", [(7, "10.1000/SHARED"), (8, "")]),
+        }
+        MockOrcid.requests, MockOrcid.connections = [], set()
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"], orcid_id=AUTHOR_ID
+        )
+        self.reviewer = User.objects.create_user(
+            email="reviewer@test.com",
+            password="testpass123",
+            full_name="Timur Rahimov",
+            roles=["reviewer"],
+            reviewer_status=APPROVAL_APPROVED,
+            orcid_id=REVIEWER_ID,
+        )
+        self.missing = User.objects.create_user(
+            email="missing@test.com", password="testpass123", full_name="Missing", orcid_id=MISSING_ID
+        )
+
+    def test_normalize_orcid_id(self):
+        self.assertEqual(normalize_orcid_id(f"https://orcid.org/{AUTHOR_ID}"), AUTHOR_ID)
+        self.assertEqual(normalize_orcid_id(REVIEWER_ID.lower()), REVIEWER_ID)
+        self.assertIsNone(normalize_orcid_id("0000-0002-1825-0098"))
+
+    def test_sync_then_conditional_refresh(self):
+        result = sync_orcid_records()
+        self.assertEqual((result["fetched"], result["not_found"]), (2, 1))
+        record = OrcidRecord.objects.get(user=self.author)
+        self.assertEqual((record.given_names, record.family_name), ("Dilnoza", "Karimova"))
+        self.assertEqual(sorted(record.works.values_list("doi", flat=True)), ["10.1000/a", "10.1000/shared"])
+        self.assertEqual(record.affiliations.get().organization, "Samarkand State University")
+        self.assertEqual(OrcidRecord.objects.get(user=self.missing).status, SYNC_NOT_FOUND)
+        # Three fetches over at most two pooled connections
+        self.assertLessEqual(len(MockOrcid.connections), 2)
+
+        # Fresh records are not picked up again; forced ones revalidate with their ETag
+        self.assertEqual(sync_orcid_records()["fetched"], 0)
+        MockOrcid.requests = []
+        result = sync_orcid_records([self.author.id, self.reviewer.id])
+        self.assertEqual(result["not_modified"], 2)
+        self.assertEqual(sorted(etag for _, etag in MockOrcid.requests), sorted([f'"{AUTHOR_ID}-v1"', f'"{REVIEWER_ID}-v1"']))
+        self.assertEqual(OrcidRecord.objects.get(user=self.author).works.count(), 2)
+
+    def test_connect_validates_and_queues_sync(self):
+        client = APIClient()
+        client.force_authenticate(user=self.author)
+        resp = client.post("/api/orcid/connect", {"orcid_id": "0000-0002-1825-0098"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = client.post("/api/orcid/connect", {"orcid_id": f"https://orcid.org/{AUTHOR_ID}"}, format="json")
+        self.assertEqual(resp.data["orcid_id"], AUTHOR_ID)
+        resp = client.get("/api/orcid/record")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data["works"]), 2)
+
+    def test_reviewer_search_flags_coauthors(self):
+        sync_orcid_records()
+        editor = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"], editor_status=APPROVAL_APPROVED
+        )
+        submission = Submission.objects.create(author=self.author)
+        client = APIClient()
+        client.force_authenticate(user=editor)
+        resp = client.get("/api/editor/reviewers/search", {"q": "Rahimov", "submission_id": submission.id})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["results"][0]["shared_works"], 1)
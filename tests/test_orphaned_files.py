@@ -0,0 +1,89 @@
+"""Tests for the orphaned file garbage collector."""
+import os
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from integrations.orphans import collect_orphans
+from submissions.models import Submission, SubmissionSupplementaryFile, SubmissionVersion
+
+
+class OrphanedFilesTest(TestCase):
+    """collect_orphans() and the collect_orphaned_files command."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        override = override_settings(MEDIA_ROOT=self.tmp.name, STORAGE_GC_THROTTLE_SECONDS=0)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.root = Path(self.tmp.name)
+
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.submission = Submission.objects.create(author=self.author)
+
+    def put(self, key, age_hours=48):
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 10)
+        stamp = time.time() - age_hours * 3600
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_collects_only_old_unreferenced_files(self):
+        sid = self.submission.id
+        current = self.put(f"submissions/{sid}/manuscripts/current.pdf")
+        replaced = self.put(f"submissions/{sid}/manuscripts/replaced.pdf")
+        versioned = self.put(f"submissions/{sid}/manuscripts/v1.pdf")
+        supplementary = self.put(f"submissions/{sid}/supplementary/data.csv")
+        snapshotted = self.put(f"submissions/{sid}/supplementary/removed.csv")
+        scratch = self.put("uploads/abc_notes.txt")
+        fresh = self.put("uploads/def_fresh.txt", age_hours=1)
+        stale_parts = self.put(".multipart/upload1/00001")
+        os.utime(stale_parts.parent, (time.time() - 48 * 3600,) * 2)
+
+        self.submission.manuscript_pdf.name = f"submissions/{sid}/manuscripts/current.pdf"
+        self.submission.save()
+        SubmissionSupplementaryFile.objects.create(submission=self.submission, file=f"submissions/{sid}/supplementary/data.csv")
+        SubmissionVersion.objects.create(
+            submission=self.submission,
+            version_number=1,
+            manuscript_pdf=f"submissions/{sid}/manuscripts/v1.pdf",
+            supplementary_files_snapshot=[{"name": "removed", "url": f"/media/submissions/{sid}/supplementary/removed.csv"}],
+        )
+
+        dry = collect_orphans(dry_run=True, batch_size=2)
+        self.assertEqual((dry["scanned"], dry["orphaned"], dry["deleted"]), (7, 2, 0))
+        self.assertTrue(replaced.exists())
+
+        result = collect_orphans(batch_size=2)
+        self.assertEqual((result["deleted"], result["bytes"], result["multipart_expired"]), (2, 20, 1))
+        self.assertFalse(replaced.exists() or scratch.exists() or stale_parts.exists())
+        self.assertTrue(all(p.exists() for p in (current, versioned, supplementary, snapshotted, fresh)))
+
+    def test_command_dry_run_lists_orphans(self):
+        self.put("uploads/abc_notes.txt")
+        out = StringIO()
+        call_command("collect_orphaned_files", "--dry-run", stdout=out)
+        self.assertIn("uploads/abc_notes.txt", out.getvalue())
+        self.assertIn("would delete 1 orphans", out.getvalue())
+        self.assertTrue((self.root / "uploads/abc_notes.txt").exists())
+
+    def test_deleting_draft_removes_its_files(self):
+        client = APIClient()
+        client.force_authenticate(user=self.author)
+        manuscript = self.put(f"submissions/{self.submission.id}/manuscripts/m.pdf", age_hours=0)
+        self.submission.manuscript_pdf.name = f"submissions/{self.submission.id}/manuscripts/m.pdf"
+        self.submission.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = client.delete(f"/api/submissions/{self.submission.id}/")
+        self.assertEqual(resp.status_code, 204)
+        self.assertFalse(manuscript.exists())
@@ -0,0 +1,85 @@
+"""Tests for the cached JWT principal."""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import APPROVAL_APPROVED, APPROVAL_PENDING, User
+
+
+def _user_queries(ctx):
+    return [q["sql"] for q in ctx.captured_queries if 'FROM "accounts_user"' in q["sql"]]
+
+
+class PrincipalCacheTest(TestCase):
+    """Authenticated requests resolve the user from cache until it is invalidated."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(email="admin@test.com", password="adminpass123")
+        self.editor = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"]
+        )
+        self.editor.editor_status = APPROVAL_PENDING
+        self.editor.save()
+
+    def client_for(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client
+
+    def test_cached_principal_skips_user_query(self):
+        client = self.client_for(self.admin)
+        self.assertEqual(client.get("/api/admin/audit").status_code, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(client.get("/api/admin/audit").status_code, status.HTTP_200_OK)
+        self.assertEqual(_user_queries(ctx), [])
+
+    def test_approval_invalidates_principal(self):
+        editor = self.client_for(self.editor)
+        self.assertEqual(editor.get("/api/editor/submissions/").status_code, status.HTTP_403_FORBIDDEN)
+
+        resp = self.client_for(self.admin).post(f"/api/admin/users/{self.editor.id}/approve-editor")
+        self.assertEqual(resp.data["editor_status"], APPROVAL_APPROVED)
+        self.assertEqual(editor.get("/api/editor/submissions/").status_code, status.HTTP_200_OK)
+
+    def test_profile_update_invalidates_principal(self):
+        client = self.client_for(self.editor)
+        self.assertEqual(client.get("/api/me").data["full_name"], "Editor")
+        resp = client.patch("/api/me", {"full_name": "Renamed", "affiliation": "Uni"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        resp = client.get("/api/me")
+        self.assertEqual((resp.data["full_name"], resp.data["affiliation"]), ("Renamed", "Uni"))
+
+    def test_inactive_user_rejected(self):
+        client = self.client_for(self.editor)
+        User.objects.filter(id=self.editor.id).update(is_active=False)
+        self.assertEqual(client.get("/api/me").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_saves_and_deletes_outside_the_api_invalidate_principal(self):
+        client = self.client_for(self.editor)
+        self.assertEqual(client.get("/api/me").status_code, status.HTTP_200_OK)  # cached
+
+        # As the Django admin or a shell would
+        with self.captureOnCommitCallbacks(execute=True):
+            self.editor.is_active = False
+            self.editor.save()
+        self.assertEqual(client.get("/api/me").status_code, status.HTTP_401_UNAUTHORIZED)
+
+        other = User.objects.create_user(email="gone@test.com", password="testpass123", roles=["author"])
+        client = self.client_for(other)
+        self.assertEqual(client.get("/api/me").status_code, status.HTTP_200_OK)
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertEqual(client.get("/api/me").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_last_login_save_keeps_principal(self):
+        client = self.client_for(self.admin)
+        client.get("/api/admin/audit")
+        self.admin.save(update_fields=["last_login"])
+        with CaptureQueriesContext(connection) as ctx:
+            client.get("/api/admin/audit")
+        self.assertEqual(_user_queries(ctx), [])
@@ -0,0 +1,87 @@
+"""Tests for on-demand request profiling and the profile admin API."""
+import json
+import pstats
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from submissions.models import TopicArea
+
+
+class ProfilingTest(TestCase):
+    """monitoring.profiling.ProfilingMiddleware and /api/admin/profiles."""
+
+    def setUp(self):
+        cache.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        override = override_settings(PROFILING_DIR=self.tmp.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        TopicArea.objects.create(name="AI", slug="ai")
+        self.admin = User.objects.create_user(
+            email="admin@test.com", password="testpass123", full_name="Admin", is_staff=True
+        )
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(user=self.admin)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+
+    def token(self):
+        resp = self.admin_client.post("/api/admin/profiles/token")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        return resp.data["token"]
+
+    def test_token_profiles_one_request(self):
+        token = self.token()
+        resp = self.client.get("/api/submissions/", HTTP_X_PROFILE=token)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        profile_id = resp["X-Profile-Id"]
+
+        # Single use; unprofiled requests carry no id
+        self.assertNotIn("X-Profile-Id", self.client.get("/api/submissions/", HTTP_X_PROFILE=token))
+        self.assertNotIn("X-Profile-Id", self.client.get("/api/submissions/"))
+
+        listing = self.admin_client.get("/api/admin/profiles").data["results"]
+        self.assertEqual([row["id"] for row in listing], [profile_id])
+        self.assertEqual((listing[0]["trigger"], listing[0]["view"]), ("token", "submission-list"))
+
+        detail = json.loads(b"".join(self.admin_client.get(f"/api/admin/profiles/{profile_id}").streaming_content))
+        self.assertEqual(detail["requested_by"], self.admin.id)
+        self.assertGreater(detail["sql"]["count"], 0)
+        slowest = detail["sql"]["slowest"][0]
+        self.assertTrue(slowest["sql"].startswith("SELECT"))
+        self.assertTrue(slowest["explain"])
+        self.assertTrue(detail["functions"])
+
+        resp = self.admin_client.get(f"/api/admin/profiles/{profile_id}/pstats")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        path = f"{self.tmp.name}/downloaded.pstats"
+        with open(path, "wb") as f:
+            f.write(b"".join(resp.streaming_content))
+        self.assertTrue(pstats.Stats(path).total_calls)
+
+    def test_query_flag_and_bad_tokens(self):
+        resp = self.client.get(f"/api/topic-areas/?_profile={self.token()}")
+        self.assertIn("X-Profile-Id", resp)
+        self.assertNotIn("X-Profile-Id", self.client.get("/api/topic-areas/", HTTP_X_PROFILE="forged"))
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_MAX_ARTIFACTS=2)
+    def test_sampling_keeps_newest(self):
+        ids = [self.client.get("/api/topic-areas/")["X-Profile-Id"] for _ in range(3)]
+        listing = self.admin_client.get("/api/admin/profiles").data["results"]
+        self.assertEqual([row["id"] for row in listing], [ids[2], ids[1]])
+
+    def test_admin_only(self):
+        self.assertEqual(self.client.post("/api/admin/profiles/token").status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get("/api/admin/profiles").status_code, status.HTTP_403_FORBIDDEN)
+        resp = self.admin_client.get("/api/admin/profiles/..%2F..%2Fsettings")
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
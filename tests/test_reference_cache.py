@@ -0,0 +1,79 @@
+"""Tests for the two-tier reference cache and the topic-area endpoint."""
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from ejournal.cache import ReferenceCache, clear_local
+from submissions.models import STATUS_SUBMITTED, Submission, TopicArea
+
+
+class ReferenceCacheTest(TestCase):
+    """GET /api/topic-areas and topic_area_id writes served from ejournal.cache."""
+
+    def setUp(self):
+        cache.clear()
+        clear_local()
+        self.ai = TopicArea.objects.create(name="Artificial Intelligence", slug="ai")
+        self.swe = TopicArea.objects.create(name="Software Engineering", slug="swe")
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+
+    def test_steady_state_costs_no_queries(self):
+        resp = self.client.get("/api/topic-areas/")
+        self.assertEqual([row["slug"] for row in resp.data], ["ai", "swe"])
+        with self.assertNumQueries(0):
+            resp = self.client.get("/api/topic-areas/")
+            self.client.get(f"/api/topic-areas/{self.ai.id}/")
+        self.assertIn("max-age=", resp["Cache-Control"])
+
+        # A worker whose local copy is gone reads the shared tier, still without a query
+        clear_local()
+        with self.assertNumQueries(0):
+            self.client.get("/api/topic-areas/")
+
+    def test_etag_and_invalidation(self):
+        etag = self.client.get("/api/topic-areas/")["ETag"]
+        resp = self.client.get("/api/topic-areas/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.swe.name = "Software Eng."
+        self.swe.save()
+        resp = self.client.get("/api/topic-areas/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data[1]["name"], "Software Eng.")
+        self.assertNotEqual(resp["ETag"], etag)
+
+        self.ai.delete()
+        self.assertEqual(len(self.client.get("/api/topic-areas/").data), 1)
+
+    def test_patch_validates_topic_area_from_cache(self):
+        submission = Submission.objects.create(author=self.author)
+        url = f"/api/submissions/{submission.id}/"
+        self.client.get("/api/topic-areas/")  # warm
+        # submission, prefetched supplementary files, update; no topic area lookup
+        with self.assertNumQueries(3):
+            resp = self.client.patch(url, {"title": "Paper", "topic_area_id": self.swe.id}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["topic_area"]["slug"], "swe")
+        submission.refresh_from_db()
+        self.assertEqual(submission.topic_area_id, self.swe.id)
+
+        resp = self.client.patch(url, {"topic_area_id": 9999}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.put(url, {"title": "x"}, format="json").status_code, 405)
+        Submission.objects.filter(id=submission.id).update(status=STATUS_SUBMITTED)
+        self.assertEqual(self.client.patch(url, {"title": "Late"}, format="json").status_code, 400)
+
+    def test_namespace_versions(self):
+        ref = ReferenceCache("test-namespace")
+        loads = []
+        self.assertEqual(ref.get("k", lambda: loads.append(1) or "v1"), "v1")
+        self.assertEqual(ref.get("k", lambda: loads.append(1) or "v2"), "v1")
+        ref.invalidate()
+        self.assertEqual(ref.get("k", lambda: loads.append(1) or "v2"), "v2")
+        self.assertEqual(len(loads), 2)
@@ -1,4 +1,6 @@
 """Tests for review workflow."""
+from datetime import timedelta
+
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from rest_framework import status
@@ -68,6 +70,35 @@ class ReviewWorkflowTest(TestCase):
         self.assertEqual(assign.status, STATUS_INVITED)
         self.assertEqual(assign.reviewer, self.reviewer)
 
+    def test_invite_existing_reviewer_email_rejected(self):
+        ReviewAssignment.objects.create(
+            submission=self.submission,
+            submission_version=self.version,
+            invited_email="guest@example.com",
+        )
+        self._login(self.editor)
+        resp = self.client.post(
+            f"/api/editor/submissions/{self.submission.id}/invite-reviewer/",
+            {"reviewer_email": "guest@example.com"},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ReviewAssignment.objects.filter(submission=self.submission).count(), 1)
+
+    def test_assignment_list_filters_by_status(self):
+        invited = ReviewAssignment.objects.create(
+            submission=self.submission, submission_version=self.version, reviewer=self.reviewer, status=STATUS_INVITED
+        )
+        accepted = ReviewAssignment.objects.create(
+            submission=self.submission, submission_version=self.version, reviewer=self.reviewer, status=STATUS_ACCEPTED
+        )
+        ReviewAssignment.objects.filter(id=invited.id).update(invited_at=accepted.invited_at - timedelta(days=1))
+        self._login(self.reviewer)
+        resp = self.client.get("/api/reviewer/assignments/")
+        self.assertEqual([row["id"] for row in resp.data], [accepted.id, invited.id])
+        resp = self.client.get(f"/api/reviewer/assignments/?status={STATUS_INVITED}")
+        self.assertEqual([row["id"] for row in resp.data], [invited.id])
+
     def test_accept_invitation(self):
         assign = ReviewAssignment.objects.create(
             submission=self.submission,
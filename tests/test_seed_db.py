@@ -0,0 +1,59 @@
+"""Tests for seed_db --scale synthetic data."""
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from accounts.models import User
+from audit.models import AuditLog
+from reviews.models import Review, ReviewAssignment
+from submissions.models import STATUS_CHOICES, Submission
+
+
+def snapshot():
+    subs = Submission.objects.filter(author__email__endswith="@seed-7.invalid").order_by("id")
+    return (
+        list(User.objects.filter(email__endswith="@seed-7.invalid").order_by("id").values_list("email", "date_joined")),
+        list(subs.values_list("author__email", "status", "title", "created_at")),
+        list(
+            ReviewAssignment.objects.filter(submission__in=subs)
+            .order_by("id")
+            .values_list("invited_email", "status", "token")
+        ),
+    )
+
+
+class SeedScaleTest(TestCase):
+    """ejournal.synthetic.generate() through the seed_db command."""
+
+    def seed(self, **options):
+        call_command("seed_db", "--no-superuser", "--scale", "150", "--seed", "7", stdout=StringIO(), **options)
+
+    def test_scale_covers_workflow(self):
+        self.seed()
+        statuses = set(Submission.objects.values_list("status", flat=True))
+        self.assertEqual(statuses, {value for value, _ in STATUS_CHOICES})
+        self.assertTrue(Review.objects.exists())
+        # Review rows belong to submitted reviews; invitations are audited under the assignment id
+        self.assertFalse(Review.objects.exclude(assignment__status="review_submitted").exists())
+        invited = AuditLog.objects.filter(action_type="reviewer_invited")
+        self.assertEqual(invited.count(), ReviewAssignment.objects.count())
+        self.assertFalse(invited.filter(target_id=0).exists())
+        # Historical timestamps survive bulk_create
+        self.assertGreater(Submission.objects.dates("created_at", "year").count(), 1)
+        user = User.objects.filter(email__endswith="@seed-7.invalid").first()
+        self.assertTrue(user.check_password("seedpass123"))
+
+        with self.assertRaises(CommandError):
+            self.seed()
+
+    def test_same_seed_same_data_any_chunk_size(self):
+        self.seed(chunk_size=1000)
+        first = snapshot()
+        User.objects.filter(email__endswith="@seed-7.invalid").delete()
+        self.seed(chunk_size=40)
+        second = snapshot()
+        # Timestamps are relative to now
+        self.assertEqual([row[0] for row in first[0]], [row[0] for row in second[0]])
+        self.assertEqual([row[:3] for row in first[1]], [row[:3] for row in second[1]])
+        self.assertEqual(first[2], second[2])
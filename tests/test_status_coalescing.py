@@ -0,0 +1,56 @@
+"""Tests for coalescing rapid status change notifications."""
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from notifications.models import CoalescedStatusChange, Notification
+from notifications.services import queue_status_changed
+from notifications.tasks import flush_status_change
+
+
+@override_settings(NOTIFICATION_STATUS_COALESCE_SECONDS=60)
+class StatusCoalescingTest(TestCase):
+    """Successive transitions within the window produce one summary email."""
+
+    def setUp(self):
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+
+    def _queue(self, old, new):
+        queue_status_changed(7, old, new, self.author.email, self.author.id, f"status_7_{old}_{new}")
+
+    @mock.patch("notifications.services.flush_status_change.apply_async")
+    def test_transitions_within_window_are_merged(self, apply_async):
+        self._queue("submitted", "screening")
+        self._queue("screening", "under_review")
+
+        apply_async.assert_called_once()
+        self.assertEqual(apply_async.call_args.kwargs["countdown"], 60)
+        pending = CoalescedStatusChange.objects.get()
+        self.assertEqual((pending.old_status, pending.new_status, pending.transitions), ("submitted", "under_review", 2))
+        self.assertEqual(len(mail.outbox), 0)
+
+        flush_status_change(pending.id)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("from submitted to under_review", mail.outbox[0].body)
+        self.assertFalse(CoalescedStatusChange.objects.exists())
+        notification = Notification.objects.get(event_type="status_changed")
+        self.assertEqual(notification.payload["transitions"], 2)
+
+    @mock.patch("notifications.services.flush_status_change.apply_async")
+    def test_flush_is_idempotent(self, apply_async):
+        self._queue("submitted", "screening")
+        pending_id = CoalescedStatusChange.objects.get().id
+        flush_status_change(pending_id)
+        self.assertEqual(flush_status_change(pending_id)["status"], "skipped")
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(NOTIFICATION_STATUS_COALESCE_SECONDS=0)
+    def test_window_disabled_sends_immediately(self):
+        self._queue("submitted", "screening")
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(CoalescedStatusChange.objects.exists())
@@ -0,0 +1,120 @@
+"""Tests for the per-submission activity timeline."""
+from datetime import timedelta
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import APPROVAL_APPROVED, User
+from audit.models import AuditLog
+from editorial.timeline import decode_cursor, encode_cursor, get_timeline
+from notifications.models import Notification
+from notifications.tasks import send_notification_email
+from reviews.models import Review, ReviewAssignment
+from submissions.models import STATUS_UNDER_REVIEW, Submission, SubmissionVersion
+
+
+class SubmissionTimelineTest(TestCase):
+    """Audit entries, review activity and notifications merged newest first."""
+
+    def setUp(self):
+        self.editor = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"]
+        )
+        self.editor.editor_status = APPROVAL_APPROVED
+        self.editor.save()
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.submission = Submission.objects.create(
+            author=self.author, status=STATUS_UNDER_REVIEW, title="Paper", abstract="A", keywords=["a", "b", "c"]
+        )
+        other = Submission.objects.create(
+            author=self.author, status=STATUS_UNDER_REVIEW, title="Other", abstract="A", keywords=["a", "b", "c"]
+        )
+        version = SubmissionVersion.objects.create(
+            submission=self.submission,
+            version_number=1,
+            manuscript_pdf=SimpleUploadedFile("m.pdf", b"pdf", content_type="application/pdf"),
+            supplementary_files_snapshot=[],
+        )
+
+        t0 = timezone.now() - timedelta(days=3)
+        at = lambda hours: t0 + timedelta(hours=hours)  # noqa: E731
+        AuditLog.objects.bulk_create(
+            [
+                AuditLog(actor_user=self.author, action_type="submission_submitted", target_type="submission",
+                         target_id=self.submission.id, created_at=at(0)),
+                AuditLog(actor_user=self.editor, action_type="status_transition", target_type="submission",
+                         target_id=self.submission.id, created_at=at(2)),
+                AuditLog(actor_user=self.editor, action_type="status_transition", target_type="submission",
+                         target_id=other.id, created_at=at(2)),
+            ]
+        )
+        assignment = ReviewAssignment.objects.create(
+            submission=self.submission, submission_version=version, invited_email="rev@test.com", status="accepted"
+        )
+        ReviewAssignment.objects.filter(id=assignment.id).update(invited_at=at(3), responded_at=at(4))
+        review = Review.objects.create(assignment=assignment, summary="Good", recommendation="accept")
+        Review.objects.filter(id=review.id).update(submitted_at=at(6))
+
+        send_notification_email(
+            event_type="reviewer_invited", user_id=None, to_email="rev@test.com", subject="S", body="B",
+            payload={"assignment_id": assignment.id},
+        )
+        send_notification_email(
+            event_type="status_changed", user_id=self.author.id, to_email=self.author.email, subject="S", body="B",
+            payload={"submission_id": self.submission.id},
+        )
+        send_notification_email(
+            event_type="status_changed", user_id=self.author.id, to_email=self.author.email, subject="S", body="B",
+            payload={"submission_id": other.id},
+        )
+        invited, changed = Notification.objects.filter(submission_id=self.submission.id).order_by("id")
+        Notification.objects.filter(id=invited.id).update(created_at=at(3))
+        Notification.objects.filter(id=changed.id).update(created_at=at(2))
+
+        self.expected = [
+            ("review_submitted", at(6)),
+            ("review_response", at(4)),
+            ("notification", at(3)),
+            ("review_invitation", at(3)),
+            ("notification", at(2)),
+            ("audit", at(2)),
+            ("audit", at(0)),
+        ]
+
+    def test_notification_submission_id_resolved_from_assignment(self):
+        self.assertEqual(
+            Notification.objects.filter(event_type="reviewer_invited").get().submission_id, self.submission.id
+        )
+
+    def test_merged_order_and_pagination(self):
+        entries, position = get_timeline(self.submission.id, limit=3)
+        seen = list(entries)
+        while position:
+            cursor = decode_cursor(encode_cursor(position))
+            entries, position = get_timeline(self.submission.id, cursor=cursor, limit=3)
+            seen += entries
+        self.assertEqual([(e["type"], e["at"]) for e in seen], self.expected)
+
+    def test_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(user=self.editor)
+        url = f"/api/editor/submissions/{self.submission.id}/timeline/"
+        resp = client.get(url, {"limit": 4})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([e["type"] for e in resp.data["results"]], [t for t, _ in self.expected[:4]])
+        resp = client.get(resp.data["next"])
+        self.assertEqual([e["type"] for e in resp.data["results"]], [t for t, _ in self.expected[4:]])
+        self.assertIsNone(resp.data["next"])
+        self.assertEqual(resp.data["results"][-1]["actor"], "author@test.com")
+
+        self.assertEqual(client.get(url, {"cursor": "garbage"}).status_code, status.HTTP_404_NOT_FOUND)
+        resp = client.get(url, {"limit": "ten"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("limit", resp.data)
+        client.force_authenticate(user=self.author)
+        self.assertEqual(client.get(url).status_code, status.HTTP_403_FORBIDDEN)
@@ -1,4 +1,6 @@
 """Tests for submission workflow (author)."""
+from datetime import timedelta
+
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -70,3 +72,14 @@ class SubmissionWorkflowTest(TestCase):
         )
         resp = self.client.post(f"/api/submissions/{sub_id}/submit/")
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_filters_by_status_newest_first(self):
+        older = Submission.objects.create(author=self.author, status="submitted")
+        newer = Submission.objects.create(author=self.author, status="submitted")
+        draft = Submission.objects.create(author=self.author)
+        Submission.objects.filter(id=older.id).update(created_at=newer.created_at - timedelta(days=1))
+        self._login(self.author)
+        resp = self.client.get("/api/submissions/")
+        self.assertEqual([row["id"] for row in resp.data], [draft.id, newer.id, older.id])
+        resp = self.client.get("/api/submissions/?status=submitted")
+        self.assertEqual([row["id"] for row in resp.data], [newer.id, older.id])
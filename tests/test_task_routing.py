@@ -0,0 +1,42 @@
+"""Tests for Celery queue routing of notification tasks."""
+from django.test import SimpleTestCase
+
+from ejournal.celery import QUEUE_BULK, QUEUE_TRANSACTIONAL, app
+
+
+def queue_for(name, kwargs=None, **options):
+    """Return the queue name the app router picks for a task call."""
+    route = app.amqp.router.route(options, name, (), kwargs or {})
+    return route["queue"].name
+
+
+class TaskRoutingTest(SimpleTestCase):
+    """Test transactional vs bulk routing."""
+
+    def test_transactional_emails_use_high_priority_queue(self):
+        for event_type in ("reviewer_invited", "status_changed", "submission_rejected"):
+            self.assertEqual(
+                queue_for("notifications.tasks.send_notification_email", {"event_type": event_type}),
+                QUEUE_TRANSACTIONAL,
+            )
+        self.assertEqual(queue_for("notifications.tasks.flush_status_change"), QUEUE_TRANSACTIONAL)
+
+    def test_reminders_and_digests_use_bulk_queue(self):
+        for event_type in ("review_reminder", "digest"):
+            self.assertEqual(
+                queue_for("notifications.tasks.send_notification_email", {"event_type": event_type}),
+                QUEUE_BULK,
+            )
+        self.assertEqual(queue_for("notifications.tasks.send_review_reminder"), QUEUE_BULK)
+        self.assertEqual(queue_for("notifications.tasks.send_notification_digests"), QUEUE_BULK)
+
+    def test_other_tasks_and_explicit_queue(self):
+        self.assertEqual(queue_for("submissions.tasks.unknown"), "celery")
+        self.assertEqual(
+            queue_for(
+                "notifications.tasks.send_notification_email",
+                {"event_type": "reviewer_invited"},
+                queue=QUEUE_BULK,
+            ),
+            QUEUE_BULK,
+        )
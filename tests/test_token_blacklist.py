@@ -0,0 +1,73 @@
+"""Tests for cached refresh-token blacklist checks and token compaction."""
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from accounts.models import User
+from accounts.tokens import WARM_KEY, flush_expired_tokens, is_blacklisted, warm_blacklist_cache
+
+
+class TokenBlacklistTest(TestCase):
+    """Rotated refresh tokens are rejected; expired rows are compacted."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        resp = self.client.post("/api/auth/login", {"email": "author@test.com", "password": "testpass123"})
+        self.refresh = resp.data["refresh"]
+
+    def test_rotated_token_rejected_from_warm_cache(self):
+        resp = self.client.post("/api/auth/refresh", {"refresh": self.refresh})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        new_refresh = resp.data["refresh"]
+        warm_blacklist_cache()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(is_blacklisted("never-issued"))
+        resp = self.client.post("/api/auth/refresh", {"refresh": self.refresh})
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+        resp = self.client.post("/api/auth/refresh", {"refresh": new_refresh})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_row_written_outside_the_api_rejected_from_warm_cache(self):
+        warm_blacklist_cache()
+        # As the admin or a shell would: a plain row, no CachedBlacklistRefreshToken involved
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get())
+        resp = self.client.post("/api/auth/refresh", {"refresh": self.refresh})
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cold_cache_falls_back_to_database(self):
+        self.client.post("/api/auth/refresh", {"refresh": self.refresh})
+        jti = BlacklistedToken.objects.get().token.jti
+        cache.clear()
+        self.assertIsNone(cache.get(WARM_KEY))
+        self.assertTrue(is_blacklisted(jti))
+        self.assertFalse(is_blacklisted("unknown"))
+
+    def test_compaction_deletes_expired_rows_in_batches(self):
+        self.client.post("/api/auth/refresh", {"refresh": self.refresh})
+        self.assertEqual(OutstandingToken.objects.count(), 2)
+        past = timezone.now() - timedelta(days=1)
+        for i in range(5):
+            token = OutstandingToken.objects.create(jti=f"old-{i}", token="t", expires_at=past)
+            if i % 2:
+                BlacklistedToken.objects.create(token=token)
+
+        self.assertEqual(flush_expired_tokens(batch_size=2), 5)
+        self.assertEqual(OutstandingToken.objects.count(), 2)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+        out = StringIO()
+        call_command("compact_tokens", stdout=out)
+        self.assertIn("flushed 0 expired tokens", out.getvalue())
+        self.assertIn("Cached 1 blacklisted tokens", out.getvalue())
@@ -0,0 +1,100 @@
+"""Tests for the streaming upload checks (hash, size limit, PDF sniffing)."""
+import hashlib
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import StopUpload
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from integrations.upload_handlers import StreamingValidationUploadHandler, expect_upload
+from submissions.models import Submission
+
+MB = 1024 * 1024
+PDF_BYTES = b"%PDF-1.7\n" + b"0" * 4000
+
+
+class UploadHandlerTest(TestCase):
+    """Multipart uploads checked by the handler that expect_upload() installs."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        override = override_settings(
+            MEDIA_ROOT=self.tmp.name, UPLOAD_MAX_SIZE_MB={"manuscript": 1, "supplementary": 2, "other": 1}
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.author = User.objects.create_user(
+            email="author@test.com", password="testpass123", full_name="Author", roles=["author"]
+        )
+        self.submission = Submission.objects.create(author=self.author)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+        self.url = f"/api/submissions/{self.submission.id}/upload-file/"
+
+    def upload(self, data, name, file_type="manuscript", query=""):
+        return self.client.post(
+            self.url + query, {"file": SimpleUploadedFile(name, data), "file_type": file_type}, format="multipart"
+        )
+
+    def test_manuscript_is_hashed_and_named_by_content(self):
+        resp = self.upload(PDF_BYTES, "paper.docx")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["sha256"], hashlib.sha256(PDF_BYTES).hexdigest())
+        self.assertEqual(resp.data["size"], len(PDF_BYTES))
+        self.submission.refresh_from_db()
+        self.assertTrue(self.submission.manuscript_pdf.name.endswith(".pdf"))
+
+    def test_wrong_type_rejected(self):
+        resp = self.upload(b"PK\x03\x04" + b"0" * 4000, "paper.pdf")
+        self.assertEqual(resp.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        resp = self.upload(b"plain text", "notes.txt", query="?file_type=manuscript")
+        self.assertEqual(resp.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        self.submission.refresh_from_db()
+        self.assertFalse(self.submission.manuscript_pdf)
+
+        # Supplementary files may be anything that does not claim to be a PDF
+        resp = self.upload(b"a,b\n1,2\n", "data.csv", file_type="supplementary")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+    def test_size_limits_per_file_type(self):
+        big = b"%PDF-1.7\n" + b"0" * (MB + 10)
+        self.assertEqual(self.upload(big, "paper.pdf").status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        resp = self.upload(big, "paper.pdf", file_type="supplementary")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        # The body is refused from its Content-Length alone
+        huge = b"0" * (3 * MB)
+        resp = self.upload(huge, "data.bin", file_type="supplementary")
+        self.assertEqual(resp.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(self.submission.supplementary_files.count(), 1)
+
+    def test_handler_aborts_on_first_chunk(self):
+        request = RequestFactory().post("/")
+        expect_upload(request, ["manuscript"], require_pdf=True)
+        handler = StreamingValidationUploadHandler(request)
+        handler.new_file("file", "paper.pdf", "application/pdf", None)
+        with self.assertRaises(StopUpload):
+            handler.receive_data_chunk(b"MZ" + b"\0" * (64 * 1024), 0)
+        self.assertEqual(request.upload_rejection.status_code, 415)
+
+    def test_requests_without_expect_upload_are_not_checked(self):
+        # e.g. the Django admin saving a manuscript: no limits, no PDF sniffing, body intact
+        zip_named_pdf = SimpleUploadedFile("paper.pdf", b"PK\x03\x04" + b"0" * (2 * MB))
+        request = RequestFactory().post("/", {"file": zip_named_pdf, "csrfmiddlewaretoken": "t"})
+        self.assertFalse(any(isinstance(h, StreamingValidationUploadHandler) for h in request.upload_handlers))
+        request.upload_handlers.insert(0, StreamingValidationUploadHandler(request))  # even if installed
+        self.assertEqual(request.FILES["file"].size, 2 * MB + 4)
+        self.assertEqual(request.POST["csrfmiddlewaretoken"], "t")
+        self.assertIsNone(getattr(request, "upload_rejection", None))
+
+    def test_generic_upload_reports_checksum(self):
+        resp = self.client.post(
+            "/api/upload-file", {"file": SimpleUploadedFile("a.png", b"\x89PNG\r\n\x1a\nxyz")}, format="multipart"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["content_type"], "image/png")
+        self.assertEqual(resp.data["sha256"], hashlib.sha256(b"\x89PNG\r\n\x1a\nxyz").hexdigest())
@@ -0,0 +1,65 @@
+"""Tests for admin user search and the reviewer-invite picker (SQLite fallback path)."""
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import APPROVAL_APPROVED, APPROVAL_PENDING, User
+
+
+class UserSearchTest(TestCase):
+    """Test GET /api/admin/users/search and GET /api/editor/reviewers/search."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(email="admin@test.com", password="adminpass123")
+        self.editor = User.objects.create_user(
+            email="editor@test.com", password="testpass123", full_name="Editor", roles=["editor"],
+            editor_status=APPROVAL_APPROVED,
+        )
+
+        def make(email, full_name, affiliation="", reviewer_status=None):
+            return User.objects.create_user(
+                email=email, password="testpass123", full_name=full_name, affiliation=affiliation,
+                roles=["author", "reviewer"] if reviewer_status else ["author"], reviewer_status=reviewer_status,
+            )
+
+        self.smith = make("jsmith@uni.edu", "John Smith", "Samarkand State University", APPROVAL_APPROVED)
+        self.smithson = make("anna@lab.org", "Anna Smithson", "Inha University", APPROVAL_PENDING)
+        self.author = make("smart@test.com", "Dilnoza Karimova", "Samarkand Institute")
+
+    def test_admin_search_ranks_prefix_matches_first(self):
+        self.client.force_authenticate(user=self.admin)
+        resp = self.client.get("/api/admin/users/search", {"q": "sm"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["results"][0]["email"], "smart@test.com")
+        self.assertEqual(
+            {u["email"] for u in resp.data["results"]}, {"smart@test.com", "jsmith@uni.edu", "anna@lab.org"}
+        )
+
+        resp = self.client.get("/api/admin/users/search", {"q": "samarkand", "role": "reviewer"})
+        self.assertEqual([u["email"] for u in resp.data["results"]], ["jsmith@uni.edu"])
+        self.assertEqual(self.client.get("/api/admin/users/search", {"q": "s"}).status_code, 400)
+
+    def test_role_filter_matches_role_membership(self):
+        holder = User.objects.create_user(
+            email="holder@test.com", password="testpass123", full_name="Role Holder", roles=["reviewer"]
+        )
+        User.objects.create_user(
+            email="former@test.com", password="testpass123", full_name="Role Former", roles=["author"],
+            reviewer_status=APPROVAL_PENDING,
+        )
+        self.client.force_authenticate(user=self.admin)
+        resp = self.client.get("/api/admin/users/search", {"q": "role", "role": "reviewer"})
+        self.assertEqual([u["id"] for u in resp.data["results"]], [holder.id])
+
+    def test_reviewer_picker_only_returns_approved_reviewers(self):
+        self.client.force_authenticate(user=self.editor)
+        resp = self.client.get("/api/editor/reviewers/search", {"q": "smith"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([u["id"] for u in resp.data["results"]], [self.smith.id])
+
+    def test_permissions(self):
+        self.client.force_authenticate(user=self.editor)
+        self.assertEqual(self.client.get("/api/admin/users/search", {"q": "smith"}).status_code, 403)
+        self.client.force_authenticate(user=self.author)
+        self.assertEqual(self.client.get("/api/editor/reviewers/search", {"q": "smith"}).status_code, 403)